@@ -1,4 +1,5 @@
-try:
-    import cv2
-except ImportError:
+from importlib.util import find_spec
+
+# Checked without importing: cv2 itself is loaded lazily, on first use (see amir_dev_studio.lazy_imports).
+if find_spec('cv2') is None:
     raise ImportError('OpenCV is not installed. Please install it before using this module.')
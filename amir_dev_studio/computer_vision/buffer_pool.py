@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from threading import Lock
+
+import numpy as np
+
+
+class BufferPool:
+    """
+    Recycles pixel buffers by shape and dtype.
+
+    `acquire` returns an uninitialized array, reusing a released one when a match is free. `release`
+    hands an array back; once the pool holds `max_pooled_bytes` of idle buffers, extra released arrays
+    are left to the garbage collector.
+    """
+
+    def __init__(self, max_pooled_bytes: int = None):
+        self._lock = Lock()
+        self._free: defaultdict[tuple, list[np.ndarray]] = defaultdict(list)
+        self.max_pooled_bytes = max_pooled_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.outstanding_bytes = 0
+        self.pooled_bytes = 0
+        self.peak_bytes = 0
+
+    def __repr__(self):
+        return (
+            f'BufferPool(hit_rate={self.hit_rate:.2f}, outstanding={self.outstanding_bytes}, '
+            f'pooled={self.pooled_bytes}, peak={self.peak_bytes})'
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        acquisitions = self.hits + self.misses
+        return self.hits / acquisitions if acquisitions else 0.0
+
+    @staticmethod
+    def _key(shape: tuple[int, ...], dtype) -> tuple:
+        return tuple(shape), np.dtype(dtype).str
+
+    def acquire(self, shape: tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        key = self._key(shape, dtype)
+
+        with self._lock:
+            if free := self._free[key]:
+                array = free.pop()
+                self.pooled_bytes -= array.nbytes
+                self.hits += 1
+            else:
+                array = None
+                self.misses += 1
+
+        if array is None:
+            array = np.empty(shape, dtype)
+
+        with self._lock:
+            self.outstanding_bytes += array.nbytes
+            self.peak_bytes = max(self.peak_bytes, self.outstanding_bytes + self.pooled_bytes)
+
+        return array
+
+    def clear(self):
+        with self._lock:
+            self._free.clear()
+            self.pooled_bytes = 0
+
+    def discard(self, array: np.ndarray):
+        """
+        Stops tracking an acquired array that is still in use elsewhere, leaving it to the garbage collector.
+        """
+        with self._lock:
+            self.outstanding_bytes -= array.nbytes
+
+    def release(self, array: np.ndarray):
+        assert array.base is None and array.flags.c_contiguous, 'Only whole, contiguous buffers can be pooled'
+
+        with self._lock:
+            self.outstanding_bytes -= array.nbytes
+
+            if self.max_pooled_bytes is not None and self.pooled_bytes + array.nbytes > self.max_pooled_bytes:
+                return
+
+            self._free[self._key(array.shape, array.dtype)].append(array)
+            self.pooled_bytes += array.nbytes
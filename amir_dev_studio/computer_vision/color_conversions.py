@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from collections import deque
+from functools import lru_cache
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+# Values name cv2.COLOR_* codes; they are resolved on first use so importing this module does not load cv2.
+CONVERSIONS: dict[tuple[ColorSpaces, ColorSpaces], str] = {
+    (ColorSpaces.BGR, ColorSpaces.GRAY): 'COLOR_BGR2GRAY',
+    (ColorSpaces.BGR, ColorSpaces.HSV): 'COLOR_BGR2HSV',
+    (ColorSpaces.BGR, ColorSpaces.LAB): 'COLOR_BGR2LAB',
+    (ColorSpaces.BGR, ColorSpaces.RGB): 'COLOR_BGR2RGB',
+    (ColorSpaces.BGR, ColorSpaces.RGBA): 'COLOR_BGR2RGBA',
+    (ColorSpaces.GRAY, ColorSpaces.BGR): 'COLOR_GRAY2BGR',
+    (ColorSpaces.GRAY, ColorSpaces.RGB): 'COLOR_GRAY2RGB',
+    (ColorSpaces.GRAY, ColorSpaces.RGBA): 'COLOR_GRAY2RGBA',
+    (ColorSpaces.HSV, ColorSpaces.BGR): 'COLOR_HSV2BGR',
+    (ColorSpaces.HSV, ColorSpaces.RGB): 'COLOR_HSV2RGB',
+    (ColorSpaces.LAB, ColorSpaces.BGR): 'COLOR_LAB2BGR',
+    (ColorSpaces.LAB, ColorSpaces.RGB): 'COLOR_LAB2RGB',
+    (ColorSpaces.RGB, ColorSpaces.BGR): 'COLOR_RGB2BGR',
+    (ColorSpaces.RGB, ColorSpaces.GRAY): 'COLOR_RGB2GRAY',
+    (ColorSpaces.RGB, ColorSpaces.HSV): 'COLOR_RGB2HSV',
+    (ColorSpaces.RGB, ColorSpaces.LAB): 'COLOR_RGB2LAB',
+    (ColorSpaces.RGB, ColorSpaces.RGBA): 'COLOR_RGB2RGBA',
+    (ColorSpaces.RGBA, ColorSpaces.BGR): 'COLOR_RGBA2BGR',
+    (ColorSpaces.RGBA, ColorSpaces.GRAY): 'COLOR_RGBA2GRAY',
+    (ColorSpaces.RGBA, ColorSpaces.RGB): 'COLOR_RGBA2RGB',
+}
+
+CHANNELS: dict[ColorSpaces, int] = {
+    ColorSpaces.BGR: 3,
+    ColorSpaces.GRAY: 1,
+    ColorSpaces.HSV: 3,
+    ColorSpaces.LAB: 3,
+    ColorSpaces.RGB: 3,
+    ColorSpaces.RGBA: 4,
+}
+
+
+@lru_cache(maxsize=None)
+def conversion_path(source: ColorSpaces, target: ColorSpaces) -> tuple[tuple[int, ColorSpaces], ...]:
+    """
+    The shortest chain of single cv2.cvtColor calls from one color space to another, as (code, result) pairs.
+    """
+    previous = {source: None}
+    queue = deque([source])
+
+    while queue:
+        current = queue.popleft()
+        if current == target:
+            break
+
+        for (edge_source, edge_target), code in CONVERSIONS.items():
+            if edge_source == current and edge_target not in previous:
+                previous[edge_target] = (current, code)
+                queue.append(edge_target)
+
+    if target not in previous:
+        raise Exception(f'Could not convert {source} to {target}')
+
+    path = []
+    current = target
+    while previous[current] is not None:
+        current_source, code = previous[current]
+        path.append((getattr(cv2, code), current))
+        current = current_source
+
+    return tuple(reversed(path))
+
+
+def output_shape(pixels: np.ndarray, color_space: ColorSpaces) -> tuple[int, ...]:
+    channels = CHANNELS[color_space]
+    return pixels.shape[:2] if channels == 1 else (*pixels.shape[:2], channels)
+
+
+def convert(pixels: np.ndarray, source: ColorSpaces, target: ColorSpaces, dst: np.ndarray = None) -> np.ndarray:
+    """
+    Converts pixels between color spaces along the shortest path. `dst`, if given, receives the final step.
+    """
+    path = conversion_path(source, target)
+
+    for index, (code, _) in enumerate(path):
+        pixels = cv2.cvtColor(pixels, code, dst=dst if index == len(path) - 1 else None)
+
+    return pixels
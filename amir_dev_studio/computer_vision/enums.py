@@ -11,6 +11,8 @@ class CardinalDirections(Enum):
 class ColorSpaces(Enum):
     BGR = auto()
     GRAY = auto()
+    HSV = auto()
+    LAB = auto()
     RGB = auto()
     RGBA = auto()
 
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.models.drawable.rectangle import BoxArray, Rectangle
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+
+def _as_regions(boxes: Rectangle | BoxArray | Iterable[Rectangle] | np.ndarray) -> np.ndarray:
+    if isinstance(boxes, BoxArray):
+        return boxes.ltrb
+    if isinstance(boxes, Rectangle):
+        return np.array([[boxes.left, boxes.top, boxes.right, boxes.bottom]], dtype=np.float64)
+    if isinstance(boxes, np.ndarray):
+        return np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    return BoxArray.from_rectangles(boxes).ltrb
+
+
+class IntegralImage:
+    """
+    Summed-area tables of an image's pixels and squared pixels, one per channel.
+
+    Once built, the sum, mean and variance over any rectangle cost four lookups per channel, however
+    large the rectangle. Batch queries take a BoxArray, a list of Rectangles or an Nx4 ltrb array and
+    return an (N, channels) array. Regions cover whole pixels the same way Image.view does: edges are
+    rounded outwards and clipped to the image. Means and variances of empty regions are NaN.
+
+    The squared table is only built the first time a variance is requested.
+    """
+
+    def __init__(self, pixels: np.ndarray):
+        self.pixels = pixels
+        self.height, self.width = pixels.shape[:2]
+        self.channels = pixels.shape[2] if pixels.ndim == 3 else 1
+
+        self._sums = self._per_channel(cv2.integral(pixels, sdepth=cv2.CV_64F))
+        self._squared_sums: np.ndarray = None
+
+    def __repr__(self):
+        return f'IntegralImage(width={self.width}, height={self.height}, channels={self.channels})'
+
+    def _per_channel(self, table: np.ndarray) -> np.ndarray:
+        return table.reshape(self.height + 1, self.width + 1, self.channels)
+
+    @property
+    def squared_sums(self) -> np.ndarray:
+        if self._squared_sums is None:
+            _, squared_sums = cv2.integral2(self.pixels, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+            self._squared_sums = self._per_channel(squared_sums)
+        return self._squared_sums
+
+    @property
+    def sums(self) -> np.ndarray:
+        return self._sums
+
+    def _bounds(self, boxes) -> tuple[np.ndarray, ...]:
+        ltrb = _as_regions(boxes)
+        left = np.clip(np.floor(ltrb[:, 0]), 0, self.width).astype(np.intp)
+        top = np.clip(np.floor(ltrb[:, 1]), 0, self.height).astype(np.intp)
+        right = np.clip(np.ceil(ltrb[:, 2]), 0, self.width).astype(np.intp)
+        bottom = np.clip(np.ceil(ltrb[:, 3]), 0, self.height).astype(np.intp)
+        return left, top, np.maximum(right, left), np.maximum(bottom, top)
+
+    @staticmethod
+    def _lookup(table: np.ndarray, left, top, right, bottom) -> np.ndarray:
+        return table[bottom, right] - table[top, right] - table[bottom, left] + table[top, left]
+
+    def counts(self, boxes) -> np.ndarray:
+        """
+        Number of pixels in each region.
+        """
+        left, top, right, bottom = self._bounds(boxes)
+        return (right - left) * (bottom - top)
+
+    def sum(self, boxes) -> np.ndarray:
+        return self._lookup(self._sums, *self._bounds(boxes))
+
+    def mean(self, boxes) -> np.ndarray:
+        bounds = self._bounds(boxes)
+        counts = ((bounds[2] - bounds[0]) * (bounds[3] - bounds[1]))[:, None]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self._lookup(self._sums, *bounds) / counts
+
+    def variance(self, boxes) -> np.ndarray:
+        """
+        Population variance per region and channel.
+        """
+        bounds = self._bounds(boxes)
+        counts = ((bounds[2] - bounds[0]) * (bounds[3] - bounds[1]))[:, None]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = self._lookup(self._sums, *bounds) / counts
+            variances = self._lookup(self.squared_sums, *bounds) / counts - means ** 2
+
+        # Cancellation can leave tiny negative values for flat regions.
+        return np.maximum(variances, 0, where=~np.isnan(variances), out=variances)
+
+    def std(self, boxes) -> np.ndarray:
+        return np.sqrt(self.variance(boxes))
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+
+from amir_dev_studio.computer_vision.models.drawable.rectangle import Rectangle
+from amir_dev_studio.computer_vision.models.image import Image
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    image: Image
+    mtime_ns: int
+    size: int
+
+    @property
+    def nbytes(self) -> int:
+        return self.image.pixels.nbytes
+
+
+class ImageCache:
+    """
+    A process-wide LRU cache of decoded images, bounded by the bytes of pixel data it holds.
+
+    Entries are keyed by absolute path and revalidated against the file's mtime and size on every lookup.
+    Hits hand out copy-on-write views of the cached pixels (see Image.view), so a hit never copies the
+    buffer and callers cannot modify the cached frame. Images larger than the whole budget are returned
+    without being cached.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024):
+        assert max_bytes > 0, 'max_bytes must be positive'
+
+        self._lock = Lock()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __contains__(self, path: str):
+        return os.path.abspath(path) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return (
+            f'ImageCache(entries={len(self)}, bytes={self.current_bytes}/{self.max_bytes}, '
+            f'hits={self.hits}, misses={self.misses})'
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def _share(image: Image) -> Image:
+        return image.view(Rectangle.from_ltrb(0, 0, image.width, image.height))
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self.current_bytes -= entry.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def get(self, path: str) -> Image:
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._share(entry.image)
+
+            if entry is not None:
+                self._remove(key)
+                self.invalidations += 1
+
+            self.misses += 1
+
+        image = Image.from_path(path)
+        image.pixels.flags.writeable = False
+        entry = _CacheEntry(image, stat.st_mtime_ns, stat.st_size)
+
+        if entry.nbytes > self.max_bytes:
+            return self._share(image)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = entry
+            self.current_bytes += entry.nbytes
+
+            while self.current_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+        return self._share(image)
+
+    def invalidate(self, path: str):
+        with self._lock:
+            if (key := os.path.abspath(path)) in self._entries:
+                self._remove(key)
+                self.invalidations += 1
+
+
+default_image_cache = ImageCache()
+
+
+def get_default_image_cache() -> ImageCache:
+    return default_image_cache
+
+
+def set_default_image_cache(cache: ImageCache):
+    global default_image_cache
+    default_image_cache = cache
+
+
+def load_cached(path: str) -> Image:
+    return default_image_cache.get(path)
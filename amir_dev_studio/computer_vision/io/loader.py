@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.io.probe import probe
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+# cv2.IMREAD_* flag names, resolved on use so importing this module does not load cv2.
+_reduced_color_flags = {
+    1: 'IMREAD_COLOR',
+    2: 'IMREAD_REDUCED_COLOR_2',
+    4: 'IMREAD_REDUCED_COLOR_4',
+    8: 'IMREAD_REDUCED_COLOR_8',
+}
+_reduced_grayscale_flags = {
+    1: 'IMREAD_GRAYSCALE',
+    2: 'IMREAD_REDUCED_GRAYSCALE_2',
+    4: 'IMREAD_REDUCED_GRAYSCALE_4',
+    8: 'IMREAD_REDUCED_GRAYSCALE_8',
+}
+
+
+@dataclass
+class LoadResult:
+    path: str
+    image: Image = None
+    exception: Exception = None
+
+    @property
+    def was_successful(self) -> bool:
+        return self.exception is None
+
+
+class ImageLoader:
+    """
+    Decodes images on a thread pool and yields them as LoadResults.
+
+    OpenCV releases the GIL while decoding, so files decode in parallel. At most `max_prefetch` files are
+    decoding or waiting to be consumed at any time. If `memory_budget` is set, their estimated decoded
+    size (taken from the file header) is also kept under that many bytes. A single file larger than the
+    budget is still loaded, on its own.
+
+    With `ordered`, results come back in input order. Otherwise they come back as soon as each finishes.
+    `reduce_factor` (1, 2, 4 or 8) makes the decoder downscale while decoding (IMREAD_REDUCED_*).
+    """
+
+    def __init__(
+            self,
+            paths: Iterable[str],
+            max_workers: int = None,
+            max_prefetch: int = 16,
+            memory_budget: int = None,
+            ordered: bool = True,
+            reduce_factor: int = 1,
+            grayscale: bool = False
+    ):
+        assert max_prefetch > 0, 'max_prefetch must be positive'
+        assert reduce_factor in _reduced_color_flags, f'Invalid reduce factor: {reduce_factor}'
+
+        self.paths = paths
+        self.max_workers = max_workers
+        self.max_prefetch = max_prefetch
+        self.memory_budget = memory_budget
+        self.ordered = ordered
+        self.reduce_factor = reduce_factor
+        self.grayscale = grayscale
+
+    @property
+    def imread_flags(self) -> int:
+        flags = _reduced_grayscale_flags if self.grayscale else _reduced_color_flags
+        return getattr(cv2, flags[self.reduce_factor])
+
+    def estimate_bytes(self, path: str) -> int:
+        try:
+            info = probe(path)
+        except Exception:
+            return os.path.getsize(path) if os.path.exists(path) else 0
+
+        channels = 1 if self.grayscale else 3
+        return -(-info.width // self.reduce_factor) * -(-info.height // self.reduce_factor) * channels
+
+    def load(self, path: str) -> LoadResult:
+        try:
+            pixels = cv2.imdecode(np.fromfile(path, np.uint8), self.imread_flags)
+
+            if pixels is None:
+                raise Exception(f'Could not decode image from path {path}')
+
+            image = Image.from_numpy_array(
+                pixels=pixels,
+                color_space=ColorSpaces.GRAY if self.grayscale else ColorSpaces.BGR,
+                path=path
+            )
+            return LoadResult(path, image)
+
+        except Exception as exception:
+            return LoadResult(path, exception=exception)
+
+    def __iter__(self) -> Iterator[LoadResult]:
+        paths = iter(self.paths)
+        pending: deque[tuple[Future, int]] = deque()
+        next_path = next(paths, None)
+        in_flight_bytes = 0
+
+        executor = ThreadPoolExecutor(self.max_workers)
+        try:
+            while True:
+                while next_path is not None and len(pending) < self.max_prefetch:
+                    estimate = self.estimate_bytes(next_path) if self.memory_budget else 0
+
+                    if pending and self.memory_budget and in_flight_bytes + estimate > self.memory_budget:
+                        break
+
+                    pending.append((executor.submit(self.load, next_path), estimate))
+                    in_flight_bytes += estimate
+                    next_path = next(paths, None)
+
+                if not pending:
+                    return
+
+                if self.ordered:
+                    future, estimate = pending.popleft()
+                else:
+                    done, _ = wait([future for future, _ in pending], return_when=FIRST_COMPLETED)
+                    future, estimate = next(item for item in pending if item[0] in done)
+                    pending.remove((future, estimate))
+
+                in_flight_bytes -= estimate
+                yield future.result()
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def iter_images(self) -> Iterator[Image]:
+        """
+        Yields only the images that loaded successfully.
+        """
+        for result in self:
+            if result.was_successful:
+                yield result.image
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from amir_dev_studio.computer_vision.io.raw_store import is_raw_image, read_raw_header
+
+_png_channels = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}
+_jpeg_sof_markers = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    format: str
+    width: int
+    height: int
+    channels: int
+
+
+def _probe_png(file: BinaryIO, head: bytes) -> ImageInfo:
+    width, height, _, color_type = struct.unpack('>IIBB', head[16:26])
+    return ImageInfo('png', width, height, _png_channels.get(color_type, 3))
+
+
+def _probe_jpeg(file: BinaryIO, head: bytes) -> ImageInfo:
+    file.seek(2)
+
+    while True:
+        marker = file.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            raise Exception('Corrupt JPEG: no frame header found')
+
+        while marker[1] == 0xFF:
+            marker = marker[1:] + file.read(1)
+
+        if marker[1] in {0xD8, 0x01} or 0xD0 <= marker[1] <= 0xD7:
+            continue
+
+        (length,) = struct.unpack('>H', file.read(2))
+
+        if marker[1] in _jpeg_sof_markers:
+            _, height, width, channels = struct.unpack('>BHHB', file.read(6))
+            return ImageInfo('jpeg', width, height, channels)
+
+        file.seek(length - 2, 1)
+
+
+def _probe_bmp(file: BinaryIO, head: bytes) -> ImageInfo:
+    (header_size,) = struct.unpack('<I', head[14:18])
+
+    if header_size == 12:
+        width, height, _, bits_per_pixel = struct.unpack('<HHHH', head[18:26])
+    else:
+        width, height, _, bits_per_pixel = struct.unpack('<iiHH', head[18:30])
+
+    return ImageInfo('bmp', width, abs(height), 4 if bits_per_pixel == 32 else 3 if bits_per_pixel > 8 else 1)
+
+
+def _probe_gif(file: BinaryIO, head: bytes) -> ImageInfo:
+    width, height = struct.unpack('<HH', head[6:10])
+    return ImageInfo('gif', width, height, 3)
+
+
+def _probe_webp(file: BinaryIO, head: bytes) -> ImageInfo:
+    chunk = head[12:16]
+
+    if chunk == b'VP8 ':
+        width, height = struct.unpack('<HH', head[26:30])
+        return ImageInfo('webp', width & 0x3FFF, height & 0x3FFF, 3)
+
+    if chunk == b'VP8L':
+        bits = int.from_bytes(head[21:25], 'little')
+        has_alpha = (bits >> 28) & 1
+        return ImageInfo('webp', (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1, 4 if has_alpha else 3)
+
+    if chunk == b'VP8X':
+        has_alpha = (head[20] >> 4) & 1
+        width = int.from_bytes(head[24:27], 'little') + 1
+        height = int.from_bytes(head[27:30], 'little') + 1
+        return ImageInfo('webp', width, height, 4 if has_alpha else 3)
+
+    raise Exception(f'Unsupported WebP chunk: {chunk!r}')
+
+
+def _probe_raw(path: str) -> ImageInfo:
+    header = read_raw_header(path)
+    return ImageInfo('raw', header.width, header.height, header.channels)
+
+
+def probe(path: str) -> ImageInfo:
+    """
+    Reads an image's dimensions and channel count from its header without decoding any pixels.
+    Supports PNG, JPEG, BMP, GIF, WebP and the raw memory-mapped format.
+    """
+    with open(path, 'rb') as file:
+        head = file.read(32)
+
+        if is_raw_image(head):
+            return _probe_raw(path)
+        if head.startswith(b'\x89PNG\r\n\x1a\n'):
+            return _probe_png(file, head)
+        if head.startswith(b'\xff\xd8'):
+            return _probe_jpeg(file, head)
+        if head.startswith(b'BM'):
+            return _probe_bmp(file, head)
+        if head[:6] in {b'GIF87a', b'GIF89a'}:
+            return _probe_gif(file, head)
+        if head.startswith(b'RIFF') and head[8:12] == b'WEBP':
+            return _probe_webp(file, head)
+
+    raise Exception(f'Unsupported image format: {path}')
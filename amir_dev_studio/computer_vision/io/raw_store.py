@@ -0,0 +1,119 @@
+"""
+A minimal on-disk image format that can be memory-mapped.
+
+Layout: an 8-byte magic string, a little-endian uint32 header length, a UTF-8 JSON header and then the raw
+C-ordered pixel data. The header is padded with spaces so the pixel data starts on a 64-byte boundary.
+"""
+from __future__ import annotations
+
+import json
+import struct
+from dataclasses import dataclass
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+
+RAW_IMAGE_MAGIC = b'\x93ADSIMG\x01'
+RAW_IMAGE_EXTENSION = '.adsimg'
+
+_alignment = 64
+_length_format = '<I'
+_prefix_size = len(RAW_IMAGE_MAGIC) + struct.calcsize(_length_format)
+
+
+@dataclass(frozen=True)
+class RawImageHeader:
+    shape: tuple[int, ...]
+    dtype: np.dtype
+    color_space: ColorSpaces
+    name: str
+    offset: int
+
+    @property
+    def width(self) -> int:
+        return self.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.shape[0]
+
+    @property
+    def channels(self) -> int:
+        return self.shape[2] if len(self.shape) == 3 else 1
+
+
+def _encode_header(shape: tuple[int, ...], dtype: np.dtype, color_space: ColorSpaces, name: str) -> bytes:
+    header = json.dumps({
+        'shape': list(shape),
+        'dtype': np.dtype(dtype).str,
+        'color_space': color_space.name,
+        'name': name,
+    }).encode('utf-8')
+
+    padding = -(_prefix_size + len(header) + 1) % _alignment
+    header += b' ' * padding + b'\n'
+
+    return RAW_IMAGE_MAGIC + struct.pack(_length_format, len(header)) + header
+
+
+def is_raw_image(prefix: bytes) -> bool:
+    return prefix.startswith(RAW_IMAGE_MAGIC)
+
+
+def read_raw_header(path: str) -> RawImageHeader:
+    with open(path, 'rb') as file:
+        prefix = file.read(_prefix_size)
+
+        if not is_raw_image(prefix):
+            raise Exception(f'Not a raw image file: {path}')
+
+        (length,) = struct.unpack(_length_format, prefix[len(RAW_IMAGE_MAGIC):])
+        header = json.loads(file.read(length).decode('utf-8'))
+
+    return RawImageHeader(
+        shape=tuple(header['shape']),
+        dtype=np.dtype(header['dtype']),
+        color_space=ColorSpaces[header['color_space']],
+        name=header['name'],
+        offset=_prefix_size + length
+    )
+
+
+def open_raw(path: str, mode: str = 'c') -> tuple[np.ndarray, RawImageHeader]:
+    """
+    Memory-maps the pixels of a raw image file. Opening is constant time; pages are read on first access.
+
+    `mode` follows `numpy.memmap`: 'r' is read-only, 'r+' writes changes back to the file and 'c'
+    (the default) is copy-on-write, where changes stay in memory.
+    """
+    header = read_raw_header(path)
+    pixels = np.memmap(path, dtype=header.dtype, mode=mode, offset=header.offset, shape=header.shape)
+    return pixels, header
+
+
+def save_raw(path: str, pixels: np.ndarray, color_space: ColorSpaces, name: str = 'Untitled'):
+    with open(path, 'wb') as file:
+        file.write(_encode_header(pixels.shape, pixels.dtype, color_space, name))
+        file.write(np.ascontiguousarray(pixels).data)
+
+
+def create_raw(
+        path: str,
+        shape: tuple[int, ...],
+        dtype,
+        color_space: ColorSpaces,
+        name: str = 'Untitled'
+) -> np.ndarray:
+    """
+    Creates a raw image file of the given shape without writing any pixels and returns it memory-mapped
+    for writing. The file is sparse until regions are written.
+    """
+    dtype = np.dtype(dtype)
+    header = _encode_header(shape, dtype, color_space, name)
+
+    with open(path, 'wb') as file:
+        file.write(header)
+        file.truncate(len(header) + int(np.prod(shape)) * dtype.itemsize)
+
+    return np.memmap(path, dtype=dtype, mode='r+', offset=len(header), shape=tuple(shape))
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from dataclasses import dataclass, field
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.models.image import Image
+
+_alignment = 64
+
+# Pools this process owns or has attached to, by segment name, so SharedImage references arriving through
+# queues can find their memory.
+_pools: dict[str, SharedImagePool] = {}
+_pools_lock = Lock()
+
+
+def _aligned(size: int) -> int:
+    return -(-size // _alignment) * _alignment
+
+
+class SharedImagePool:
+    """
+    A fixed set of image slots in one shared memory segment, for handing frames between processes
+    without copying them.
+
+    The producer allocates a SharedImage, fills its pixels in place and puts it on a multiprocessing
+    queue; only the segment name, slot and layout are pickled. The receiving process maps the same
+    memory. Every slot is reference counted: `allocate` returns a slot with one reference, passing an
+    image along transfers that reference, `retain` adds one per extra consumer and `release` drops one.
+    The slot is reused once the count reaches zero. With every slot in use, `allocate` blocks, which
+    bounds memory and applies backpressure to the producer.
+
+    Worker processes get the pool as a Process argument (its locks can only be shared at spawn time), and
+    must come from the same multiprocessing `context` as the pool. Spawned workers attach to the segment
+    by name when the pool is unpickled; forked workers inherit the mapping. Only the process that created
+    the pool unlinks the segment on close. Images must be released, and their pixels no longer
+    referenced, before closing.
+    """
+
+    def __init__(
+            self,
+            slot_shape: tuple[int, ...],
+            dtype=np.uint8,
+            slots: int = 8,
+            name: str = None,
+            context: multiprocessing.context.BaseContext = None
+    ):
+        assert slots > 0, 'A pool needs at least one slot'
+
+        self.slots = slots
+        self.slot_nbytes = _aligned(int(np.prod(slot_shape)) * np.dtype(dtype).itemsize)
+        self._header_nbytes = _aligned(slots * np.dtype(np.int64).itemsize)
+
+        self._memory = SharedMemory(name=name, create=True, size=self._header_nbytes + slots * self.slot_nbytes)
+        self._owner_pid = os.getpid()
+        context = context or multiprocessing.get_context()
+        self._lock = context.Lock()
+        self._free = context.BoundedSemaphore(slots)
+        self._map_refcounts()
+        self._refcounts[:] = 0
+
+        with _pools_lock:
+            _pools[self.name] = self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __reduce__(self):
+        return _attach_pool, (self.name, self.slots, self.slot_nbytes, self._header_nbytes, self._lock, self._free)
+
+    def __repr__(self):
+        return f'SharedImagePool(name={self.name!r}, slots={self.slots}, free={self.free_slots})'
+
+    def _map_refcounts(self):
+        self._refcounts = np.ndarray((self.slots,), np.int64, buffer=self._memory.buf)
+
+    @property
+    def free_slots(self) -> int:
+        with self._lock:
+            return int(np.count_nonzero(self._refcounts == 0))
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    def _slot_offset(self, slot: int) -> int:
+        return self._header_nbytes + slot * self.slot_nbytes
+
+    def _pixels(self, slot: int, shape: tuple[int, ...], dtype, offset: int = 0, strides=None) -> np.ndarray:
+        return np.ndarray(
+            shape,
+            dtype,
+            buffer=self._memory.buf,
+            offset=self._slot_offset(slot) + offset,
+            strides=strides
+        )
+
+    def allocate(
+            self,
+            shape: tuple[int, ...],
+            dtype=np.uint8,
+            color_space: ColorSpaces = ColorSpaces.BGR,
+            name: str = 'Untitled',
+            timeout: float = None
+    ) -> SharedImage:
+        """
+        Reserves a free slot and returns an image over it, holding one reference. The pixels are not
+        initialized. Raises TimeoutError if no slot frees up within `timeout` seconds.
+        """
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        assert nbytes <= self.slot_nbytes, f'An image of {nbytes} bytes does not fit in {self.slot_nbytes}-byte slots'
+
+        if not self._free.acquire(timeout=timeout):
+            raise TimeoutError(f'No free slot in shared image pool {self.name}')
+
+        with self._lock:
+            slot = int(np.flatnonzero(self._refcounts == 0)[0])
+            self._refcounts[slot] = 1
+
+        return SharedImage(
+            pixels=self._pixels(slot, shape, dtype),
+            color_space=color_space,
+            name=name,
+            pool_name=self.name,
+            slot=slot
+        )
+
+    def share(self, image: Image, timeout: float = None) -> SharedImage:
+        """
+        Copies an image into a free slot. Prefer allocating first and decoding or drawing into the slot.
+        """
+        shared = self.allocate(image.pixels.shape, image.pixels.dtype, image.color_space, image.name, timeout)
+        shared.path = image.path
+        shared.pixels[...] = image.pixels
+        return shared
+
+    def refcount(self, slot: int) -> int:
+        with self._lock:
+            return int(self._refcounts[slot])
+
+    def retain(self, slot: int, count: int = 1):
+        with self._lock:
+            assert self._refcounts[slot] > 0, f'Slot {slot} is not in use'
+            self._refcounts[slot] += count
+
+    def release(self, slot: int):
+        with self._lock:
+            remaining = int(self._refcounts[slot]) - 1
+            assert remaining >= 0, f'Slot {slot} was released more times than it was retained'
+            self._refcounts[slot] = remaining
+
+        if remaining == 0:
+            self._free.release()
+
+    def close(self):
+        """
+        Detaches from the segment; in the creating process, also frees it. Closing an inherited copy of
+        the pool in a forked worker leaves the segment alone.
+        """
+        with _pools_lock:
+            if _pools.get(self.name) is self:
+                del _pools[self.name]
+
+        self._refcounts = None
+        self._memory.close()
+
+        if self._owner_pid == os.getpid():
+            self._memory.unlink()
+
+
+def _attach_pool(name, slots, slot_nbytes, header_nbytes, lock, free) -> SharedImagePool:
+    # Unpickling a pool this process already has returns that instance, so there is only ever one handle
+    # (and one owner) per segment in a process.
+    with _pools_lock:
+        if (pool := _pools.get(name)) is not None:
+            return pool
+
+        pool = SharedImagePool.__new__(SharedImagePool)
+        pool.slots = slots
+        pool.slot_nbytes = slot_nbytes
+        pool._header_nbytes = header_nbytes
+        pool._lock = lock
+        pool._free = free
+        pool._memory = SharedMemory(name=name)
+        pool._owner_pid = None
+        pool._map_refcounts()
+
+        _pools[name] = pool
+        return pool
+
+
+def _get_pool(name: str) -> SharedImagePool:
+    with _pools_lock:
+        pool = _pools.get(name)
+
+    if pool is None:
+        raise Exception(
+            f'Shared image pool {name} is not attached in this process; pass the pool to the worker when it is started'
+        )
+    return pool
+
+
+def _rebuild_shared_image(pool_name, slot, shape, dtype, offset, strides, color_space, name, path) -> SharedImage:
+    pool = _get_pool(pool_name)
+    return SharedImage(
+        pixels=pool._pixels(slot, shape, dtype, offset, strides),
+        color_space=color_space,
+        name=name,
+        path=path,
+        pool_name=pool_name,
+        slot=slot
+    )
+
+
+@dataclass
+class SharedImage(Image):
+    """
+    An Image whose pixels live in a SharedImagePool slot. Pickling it (as multiprocessing queues do)
+    sends a reference to the slot instead of the pixels, so the receiver sees the same memory, including
+    later in-place changes. Trimmed views of the slot stay shared; operations that produce new pixel
+    arrays detach the image from the slot and it can no longer be sent by reference.
+
+    Each SharedImage holds one reference to its slot until `release` is called. `copy` and `deepcopy`
+    return a private, unshared Image.
+    """
+    pool_name: str = field(default=None, repr=False, compare=False)
+    slot: int = field(default=None, repr=False, compare=False)
+
+    _released: bool = field(default=False, init=False, repr=False, compare=False)
+
+    @property
+    def pool(self) -> SharedImagePool:
+        return _get_pool(self.pool_name)
+
+    @property
+    def is_shared(self) -> bool:
+        """
+        True while the pixels still live in the pool slot.
+        """
+        if self._released or self.pixels is None:
+            return False
+
+        pool = self.pool
+        return np.shares_memory(self.pixels, pool._pixels(self.slot, (pool.slot_nbytes,), np.uint8))
+
+    def __reduce__(self):
+        if not self.is_shared:
+            raise Exception(f'{self.name} no longer references its shared memory slot and cannot be sent by reference')
+
+        pool = self.pool
+        slot_address = pool._pixels(self.slot, (1,), np.uint8).__array_interface__['data'][0]
+        offset = self.pixels.__array_interface__['data'][0] - slot_address
+
+        return _rebuild_shared_image, (
+            self.pool_name,
+            self.slot,
+            self.pixels.shape,
+            self.pixels.dtype.str,
+            offset,
+            self.pixels.strides,
+            self.color_space,
+            self.name,
+            self.path
+        )
+
+    def __copy__(self):
+        return Image(
+            pixels=self.pixels.copy(),
+            color_space=self.color_space,
+            name=self.name,
+            path=self.path,
+            buffer_pool=self.buffer_pool
+        )
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
+    def retain(self, count: int = 1):
+        """
+        Adds references for additional consumers, e.g. before putting the image on several queues.
+        """
+        assert not self._released, f'{self.name} has already been released'
+        self.pool.retain(self.slot, count)
+
+    def release(self):
+        """
+        Drops this image's reference to its slot and returns any pooled buffer it was detached into. The
+        image must not be used afterwards.
+        """
+        if not self._released and self.pool_name is not None:
+            self._released = True
+            self.pool.release(self.slot)
+
+        super().release()
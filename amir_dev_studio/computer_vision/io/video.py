@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import time
+from queue import Empty, Queue
+from threading import Event, Lock, Thread
+from typing import Iterator
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+_end_of_stream = None
+_poll_seconds = 0.05
+
+
+class FrameSource:
+    """
+    Yields Image frames from a video file or a capture device.
+
+    Frames are decoded straight into a fixed ring of `ring_size` preallocated buffers
+    (`VideoCapture.read(image=...)`), so steady-state capture allocates nothing. A yielded frame's pixels
+    stay valid until the next frame is requested; copy the image to keep it longer.
+
+    When threaded, capture runs on a background thread up to `ring_size - 1` frames ahead of the consumer.
+    With `drop_frames` (meant for live devices), the capture thread skips frames instead of waiting when
+    every buffer is taken. Only every `stride`-th frame is decoded; skipped frames are grabbed without
+    decoding. The frame index and capture timestamp are stored in each image's extra_data.
+    """
+
+    def __init__(
+            self,
+            source: str | int,
+            ring_size: int = 4,
+            stride: int = 1,
+            start_frame: int = 0,
+            max_frames: int = None,
+            threaded: bool = True,
+            drop_frames: bool = False,
+            api_preference: int = None
+    ):
+        assert ring_size >= 2, 'ring_size must be at least 2'
+        assert stride >= 1, 'stride must be at least 1'
+
+        self.source = source
+        self.ring_size = ring_size
+        self.stride = stride
+        self.start_frame = start_frame
+        self.max_frames = max_frames
+        self.threaded = threaded
+        self.drop_frames = drop_frames
+        self.api_preference = api_preference
+
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Thread = None
+        self._capture: cv2.VideoCapture = None
+        self._buffers: list[np.ndarray] = [None] * ring_size
+        self._free: Queue = Queue()
+        self._filled: Queue = Queue()
+
+        self.frames_read = 0
+        self.frames_yielded = 0
+        self.frames_dropped = 0
+        self.total_latency = 0.0
+        self.last_latency = 0.0
+        self.exception: Exception = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return (
+            f'FrameSource(source={self.source!r}, read={self.frames_read}, '
+            f'yielded={self.frames_yielded}, dropped={self.frames_dropped})'
+        )
+
+    @property
+    def average_latency(self) -> float:
+        """
+        Mean seconds between a frame being decoded and being handed to the consumer.
+        """
+        return self.total_latency / self.frames_yielded if self.frames_yielded else 0.0
+
+    @property
+    def fps(self) -> float:
+        return self._capture.get(cv2.CAP_PROP_FPS) if self._capture is not None else 0.0
+
+    def _open(self):
+        self._capture = cv2.VideoCapture(
+            self.source,
+            cv2.CAP_ANY if self.api_preference is None else self.api_preference
+        )
+
+        if not self._capture.isOpened():
+            raise Exception(f'Could not open video source {self.source}')
+
+        if self.start_frame:
+            self._capture.set(cv2.CAP_PROP_POS_FRAMES, self.start_frame)
+
+        self._stop.clear()
+        self.exception = None
+        self._free = Queue()
+        self._filled = Queue()
+        for slot in range(self.ring_size):
+            self._free.put(slot)
+
+    def _acquire_slot(self) -> int:
+        while not self._stop.is_set():
+            if self.drop_frames:
+                try:
+                    return self._free.get_nowait()
+                except Empty:
+                    return None
+
+            try:
+                return self._free.get(timeout=_poll_seconds)
+            except Empty:
+                continue
+
+        return None
+
+    def _read_into(self, slot: int) -> bool:
+        ok, frame = self._capture.read(image=self._buffers[slot])
+
+        if ok:
+            self._buffers[slot] = frame
+
+        return ok
+
+    def _capture_frames(self):
+        index = self.start_frame
+        captured = 0
+
+        try:
+            while not self._stop.is_set() and (self.max_frames is None or captured < self.max_frames):
+                slot = self._acquire_slot()
+
+                if slot is None:
+                    if self._stop.is_set():
+                        break
+                    if not self._capture.grab():
+                        break
+
+                    with self._lock:
+                        self.frames_dropped += 1
+                    index += 1
+                    continue
+
+                if not self._read_into(slot):
+                    break
+
+                self._filled.put((slot, index, time.perf_counter(), self._capture.get(cv2.CAP_PROP_POS_MSEC)))
+                with self._lock:
+                    self.frames_read += 1
+                captured += 1
+                index += 1
+
+                for _ in range(self.stride - 1):
+                    if not self._capture.grab():
+                        return
+                    index += 1
+
+        except Exception as exception:
+            self.exception = exception
+
+        finally:
+            self._filled.put(_end_of_stream)
+
+    def __iter__(self) -> Iterator[Image]:
+        self._open()
+
+        if self.threaded:
+            self._thread = Thread(target=self._capture_frames, daemon=True)
+            self._thread.start()
+            items = iter(self._filled.get, _end_of_stream)
+        else:
+            items = self._capture_frames_inline()
+
+        held = None
+        try:
+            for slot, index, captured_at, timestamp_ms in items:
+                if held is not None:
+                    self._free.put(held)
+                held = slot
+
+                latency = time.perf_counter() - captured_at
+                self.frames_yielded += 1
+                self.last_latency = latency
+                self.total_latency += latency
+
+                image = Image(
+                    pixels=self._buffers[slot],
+                    color_space=ColorSpaces.BGR,
+                    name=f'frame {index}',
+                    path=self.source if isinstance(self.source, str) else None
+                )
+                image.extra_data['frame_index'] = index
+                image.extra_data['timestamp_ms'] = timestamp_ms
+                yield image
+
+        finally:
+            self.close()
+
+        if self.exception is not None:
+            raise self.exception
+
+    def _capture_frames_inline(self) -> Iterator[tuple[int, int, float, float]]:
+        index = self.start_frame
+        captured = 0
+        slot = 0
+
+        while self.max_frames is None or captured < self.max_frames:
+            if not self._read_into(slot):
+                return
+
+            self.frames_read += 1
+            captured += 1
+            yield slot, index, time.perf_counter(), self._capture.get(cv2.CAP_PROP_POS_MSEC)
+
+            index += 1
+            for _ in range(self.stride - 1):
+                if not self._capture.grab():
+                    return
+                index += 1
+
+            slot = (slot + 1) % self.ring_size
+
+    def close(self):
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from queue import Queue
+from threading import Lock, Thread
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+_stop = object()
+
+
+@dataclass(frozen=True)
+class EncodeParams:
+    jpeg_quality: int = None
+    png_compression: int = None
+    webp_quality: int = None
+
+    def for_path(self, path: str) -> list[int]:
+        extension = os.path.splitext(path)[1].lower()
+
+        if extension in {'.jpg', '.jpeg'} and self.jpeg_quality is not None:
+            return [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality]
+        if extension == '.png' and self.png_compression is not None:
+            return [cv2.IMWRITE_PNG_COMPRESSION, self.png_compression]
+        if extension == '.webp' and self.webp_quality is not None:
+            return [cv2.IMWRITE_WEBP_QUALITY, self.webp_quality]
+
+        return []
+
+
+@dataclass(frozen=True)
+class WriteError:
+    path: str
+    exception: Exception
+
+
+class ImageWriter:
+    """
+    Encodes and writes images on background threads.
+
+    `write` only blocks when `max_queue` images are already waiting. Images are copied on submission by
+    default, so the caller can keep drawing on its frame; pass copy=False for frames that will not change.
+    Failures are collected in `errors`. `flush` waits for the queue to drain, and `close` also stops the
+    workers and raises if any write failed.
+    """
+
+    def __init__(
+            self,
+            max_workers: int = 2,
+            max_queue: int = 64,
+            encode_params: EncodeParams = None,
+            copy: bool = True
+    ):
+        assert max_workers > 0, 'max_workers must be positive'
+
+        self._lock = Lock()
+        self._queue: Queue = Queue(max_queue)
+        self._closed = False
+        self.copy = copy
+        self.encode_params = encode_params or EncodeParams()
+        self.errors: list[WriteError] = []
+
+        self.images_written = 0
+        self.bytes_written = 0
+        self.encode_seconds = 0.0
+        self.started_at = time.perf_counter()
+
+        self._workers = [Thread(target=self._work, daemon=True) for _ in range(max_workers)]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close(raise_errors=exc_type is None)
+
+    def __repr__(self):
+        return f'ImageWriter(queued={self.queued}, written={self.images_written}, errors={len(self.errors)})'
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def throughput(self) -> float:
+        """
+        Images written per second since the writer started.
+        """
+        elapsed = time.perf_counter() - self.started_at
+        return self.images_written / elapsed if elapsed > 0 else 0.0
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+
+            try:
+                if job is _stop:
+                    return
+                self._write(*job)
+
+            finally:
+                self._queue.task_done()
+
+    def _write(self, pixels: np.ndarray, path: str, params: list[int]):
+        try:
+            started_at = time.perf_counter()
+            ok, encoded = cv2.imencode(os.path.splitext(path)[1], pixels, params)
+
+            if not ok:
+                raise Exception(f'Could not encode image for path {path}')
+
+            encode_seconds = time.perf_counter() - started_at
+            encoded.tofile(path)
+
+            with self._lock:
+                self.images_written += 1
+                self.bytes_written += encoded.nbytes
+                self.encode_seconds += encode_seconds
+
+        except Exception as exception:
+            with self._lock:
+                self.errors.append(WriteError(path, exception))
+
+    def write(self, image: Image | np.ndarray, path: str, encode_params: EncodeParams = None):
+        assert not self._closed, 'Writer is closed'
+
+        pixels = image.pixels if isinstance(image, Image) else image
+        params = (encode_params or self.encode_params).for_path(path)
+        self._queue.put((pixels.copy() if self.copy else pixels, path, params))
+
+    def flush(self):
+        self._queue.join()
+
+    def close(self, raise_errors: bool = True):
+        if self._closed:
+            return
+
+        self._closed = True
+        for _ in self._workers:
+            self._queue.put(_stop)
+        for worker in self._workers:
+            worker.join()
+
+        if raise_errors and self.errors:
+            paths = ', '.join(error.path for error in self.errors[:5])
+            raise Exception(f'Failed to write {len(self.errors)} image(s): {paths}') from self.errors[0].exception
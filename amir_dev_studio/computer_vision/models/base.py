@@ -1,14 +1,24 @@
 from abc import abstractmethod, ABC
-from dataclasses import dataclass, field
 
 
-@dataclass
 class Base(ABC):
-    extra_data: dict = field(
-        init=False,
-        default_factory=dict,
-        repr=False
-    )
+    # Slotted so that subclasses declared with slots=True carry no per-instance __dict__.
+    __slots__ = ('_extra_data',)
+
+    @property
+    def extra_data(self) -> dict:
+        """
+        Free-form metadata. The dict is only allocated the first time it is accessed.
+        """
+        try:
+            return self._extra_data
+        except AttributeError:
+            self._extra_data = {}
+            return self._extra_data
+
+    @extra_data.setter
+    def extra_data(self, value: dict):
+        self._extra_data = value
 
     @abstractmethod
     def __copy__(self):
@@ -1,11 +1,28 @@
-from dataclasses import dataclass
+from __future__ import annotations
 
-import matplotlib
+import re
+from dataclasses import dataclass
 
 from amir_dev_studio.computer_vision.models.base import Base
+from amir_dev_studio.lazy_imports import lazy_import
+
+_hex_pattern = re.compile(r'#([0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})')
+
+
+def hex_digits(hex_color: str) -> str | None:
+    """
+    The six rrggbb digits of a '#rgb', '#rgba', '#rrggbb' or '#rrggbbaa' string, or None for anything else.
+    """
+    if (match := _hex_pattern.fullmatch(hex_color)) is None:
+        return None
 
+    digits = match.group(1)
+    if len(digits) <= 4:
+        digits = ''.join(digit * 2 for digit in digits)
+    return digits[:6]
 
-@dataclass
+
+@dataclass(slots=True)
 class Color(Base):
     b: float | int
     g: float | int
@@ -24,13 +41,25 @@ class Color(Base):
 
     @classmethod
     def from_hex(cls, hex_color: str):
-        rgb = matplotlib.colors.to_rgb(hex_color)
-        rgb = [int(x * 255) for x in rgb]
+        """
+        Parses '#rgb', '#rrggbb' and their alpha forms; alpha is ignored. Any other color specification
+        (such as a named color) is resolved with matplotlib, which is only imported for that case.
+        """
+        if digits := hex_digits(hex_color):
+            rgb = [int(digits[i:i + 2], 16) for i in range(0, 6, 2)]
+
+        else:
+            rgb = lazy_import('matplotlib.colors').to_rgb(hex_color)
+            rgb = [int(x * 255) for x in rgb]
+
         return cls(*rgb[::-1])
 
     def to_hex(self):
-        rgb = [x / 255 for x in self.rgb]
-        return matplotlib.colors.to_hex(rgb)
+        for value in self.rgb:
+            if not 0 <= value <= 255:
+                raise ValueError(f'Color channels must be between 0 and 255. Got: {self.rgb}')
+
+        return '#' + ''.join(format(round(value), '02x') for value in self.rgb)
 
     def lighten(self, intensity: float):
         self.b = min(float(255), self.b + (intensity * 255))
@@ -2,14 +2,14 @@ from dataclasses import dataclass
 
 import numpy as np
 
-from amir_dev_studio.computer_vision.models.base import Base
 from amir_dev_studio.computer_vision.models.drawable.base import Drawable
 from amir_dev_studio.computer_vision.models.drawable.rectangle import DrawableRectangle
 from amir_dev_studio.computer_vision.models.drawable.text import DrawableText
+from amir_dev_studio.computer_vision.models.drawable.text_sprite_cache import get_default_text_sprite_cache
 
 
 @dataclass
-class DrawableBoundingBox(Base, Drawable[np.ndarray]):
+class DrawableBoundingBox(Drawable[np.ndarray]):
     text: DrawableText
     rect: DrawableRectangle
 
@@ -20,6 +20,6 @@ class DrawableBoundingBox(Base, Drawable[np.ndarray]):
         )
 
     def draw_on_image(self, pixels: np.ndarray) -> np.ndarray:
-        pixels = self.text.draw_on_image(pixels)
+        pixels = get_default_text_sprite_cache().draw(self.text, pixels)
         pixels = self.rect.draw_on_image(pixels)
         return pixels
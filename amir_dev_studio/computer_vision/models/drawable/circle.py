@@ -1,17 +1,19 @@
 from dataclasses import dataclass, field
-from math import acos, cos, pi, sin
+from math import acos, pi
 
-import cv2
 import numpy as np
 
 from amir_dev_studio.computer_vision.models.base import Base
 from amir_dev_studio.computer_vision.models.color import Color
 from amir_dev_studio.computer_vision.models.drawable.base import Drawable
 from amir_dev_studio.computer_vision.models.drawable.configs import get_default_draw_color, get_default_draw_thickness
-from amir_dev_studio.computer_vision.models.point import Point
+from amir_dev_studio.computer_vision.models.point import Point, PointArray
+from amir_dev_studio.lazy_imports import lazy_import
 
+cv2 = lazy_import('cv2')
 
-@dataclass
+
+@dataclass(slots=True)
 class Circle(Base):
     center: Point
     radius: float
@@ -53,26 +55,30 @@ class Circle(Base):
     def degrees_between(self, pt1: Point, pt2: Point) -> float:
         return self.radians_between(pt1, pt2) * (180 / pi)
 
-    def list_points_on_circumference(self, steps: int, clockwise: bool = True) -> list[Point]:
-        radians_per_step = (2 * pi) / steps
-        points = []
-
-        for step in range(0, steps + 1):
-            x = self.center.x + self.radius * cos(step * radians_per_step)
-            y = self.center.y + self.radius * sin(step * radians_per_step)
-            point = Point(x, y)
-            points.append(point)
-
-        if not clockwise:
-            points.reverse()
+    def contains_points(self, points: PointArray) -> np.ndarray:
+        return points.distance_from(self.center) <= self.radius
 
-        return points
+    def list_points_on_circumference(self, steps: int, clockwise: bool = True) -> list[Point]:
+        return self.sample_circumference(steps, clockwise).to_points()
 
     def radians_between(self, pt1: Point, pt2: Point) -> float:
         c = pt1.distance_from(pt2)
         a = b = self.radius
         return acos((a ** 2 + b ** 2 - c ** 2) / (2 * a * b))
 
+    def sample_circumference(self, steps: int, clockwise: bool = True) -> PointArray:
+        """
+        Returns steps + 1 evenly spaced points; the last one closes the circle at the first.
+        """
+        angles = np.arange(steps + 1) * ((2 * pi) / steps)
+        if not clockwise:
+            angles = angles[::-1]
+
+        return PointArray.from_xy(
+            self.center.x + self.radius * np.cos(angles),
+            self.center.y + self.radius * np.sin(angles)
+        )
+
     def to_xyr(self) -> tuple[float, float, float]:
         return self.center.x, self.center.y, self.radius
 
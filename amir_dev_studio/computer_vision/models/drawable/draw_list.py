@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Iterable
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.models.drawable.base import Drawable
+from amir_dev_studio.computer_vision.models.drawable.line import DrawableLine
+from amir_dev_studio.computer_vision.models.drawable.rectangle import DrawableRectangle
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+
+def _line_polylines(lines: list[DrawableLine]) -> np.ndarray:
+    coords = np.fromiter(
+        chain.from_iterable((line.pt1.x, line.pt1.y, line.pt2.x, line.pt2.y) for line in lines),
+        dtype=np.float64,
+        count=len(lines) * 4
+    )
+    return coords.astype(np.int32).reshape(-1, 2, 2)
+
+
+def _rectangle_polylines(rectangles: list[DrawableRectangle]) -> np.ndarray:
+    coords = np.fromiter(
+        chain.from_iterable((rect.pt1.x, rect.pt1.y, rect.pt2.x, rect.pt2.y) for rect in rectangles),
+        dtype=np.float64,
+        count=len(rectangles) * 4
+    ).reshape(-1, 2, 2)
+    left, top = coords.min(axis=1).astype(np.int32).T
+    right, bottom = coords.max(axis=1).astype(np.int32).T
+
+    # Same corner order as cv2.rectangle, so the rasterized outline is identical.
+    return np.stack(
+        (
+            np.stack((left, top), axis=1),
+            np.stack((right, top), axis=1),
+            np.stack((right, bottom), axis=1),
+            np.stack((left, bottom), axis=1),
+        ),
+        axis=1
+    )
+
+
+@dataclass
+class DrawList(Drawable[np.ndarray]):
+    """
+    Collects drawables and renders them in batches.
+
+    Lines and outlined rectangles that share a color and thickness are drawn with a single
+    `cv2.polylines` call. Other drawables are drawn one by one. Groups are rendered in order of their
+    first appearance and keep their insertion order internally, so overlapping shapes of different
+    groups may stack differently than when drawn individually.
+    """
+    drawables: list[Drawable[np.ndarray]] = field(default_factory=list)
+
+    def __copy__(self):
+        return DrawList([drawable.copy() for drawable in self.drawables])
+
+    def __iter__(self):
+        return iter(self.drawables)
+
+    def __len__(self):
+        return len(self.drawables)
+
+    def add(self, drawable: Drawable[np.ndarray]):
+        self.drawables.append(drawable)
+
+    def clear(self):
+        self.drawables.clear()
+
+    def extend(self, drawables: Iterable[Drawable[np.ndarray]]):
+        self.drawables.extend(drawables)
+
+    def group(self) -> dict[tuple, list[Drawable[np.ndarray]]]:
+        groups = {}
+
+        for index, drawable in enumerate(self.drawables):
+            # Key on the exact color tuple each shape hands to OpenCV in its own draw_on_image.
+            if type(drawable) is DrawableLine:
+                key = (DrawableLine, drawable.color.rgb, drawable.thickness)
+            elif type(drawable) is DrawableRectangle and drawable.thickness >= 0:
+                key = (DrawableRectangle, drawable.color.rgb, drawable.thickness)
+            else:
+                key = (None, index)
+
+            groups.setdefault(key, []).append(drawable)
+
+        return groups
+
+    def draw_on_image(self, pixels: np.ndarray) -> np.ndarray:
+        for (kind, *params), drawables in self.group().items():
+            if kind is DrawableLine:
+                color, thickness = params
+                pixels = cv2.polylines(pixels, _line_polylines(drawables), False, color, thickness)
+
+            elif kind is DrawableRectangle:
+                color, thickness = params
+                pixels = cv2.polylines(pixels, _rectangle_polylines(drawables), True, color, thickness)
+
+            else:
+                for drawable in drawables:
+                    pixels = drawable.draw_on_image(pixels)
+
+        return pixels
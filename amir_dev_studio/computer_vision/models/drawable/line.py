@@ -1,6 +1,5 @@
 from dataclasses import dataclass, field
 
-import cv2
 import numpy as np
 
 from amir_dev_studio.computer_vision.enums import CardinalDirections, OrdinalDirections
@@ -8,11 +7,14 @@ from amir_dev_studio.computer_vision.models.base import Base
 from amir_dev_studio.computer_vision.models.color import Color
 from amir_dev_studio.computer_vision.models.drawable.base import Drawable
 from amir_dev_studio.computer_vision.models.drawable.configs import get_default_draw_color, get_default_draw_thickness
-from amir_dev_studio.computer_vision.models.point import Point
+from amir_dev_studio.computer_vision.models.point import Point, PointArray
 from amir_dev_studio.extended_datatypes import Number
+from amir_dev_studio.lazy_imports import lazy_import
 
+cv2 = lazy_import('cv2')
 
-@dataclass
+
+@dataclass(slots=True)
 class Line(Base):
     pt1: Point
     pt2: Point
@@ -64,6 +66,21 @@ class Line(Base):
             (self.pt2.x - self.pt1.x)
         )
 
+    def contains_points(self, points: PointArray, tolerance: float = 0.5) -> np.ndarray:
+        return self.distances_from(points) <= tolerance
+
+    def distances_from(self, points: PointArray) -> np.ndarray:
+        """
+        Distance from each point to the closest point on the segment.
+        """
+        start = np.array(self.pt1.xy, dtype=np.float64)
+        segment = np.array(self.pt2.xy, dtype=np.float64) - start
+        length_squared = segment @ segment
+
+        offsets = points.coords - start
+        t = np.clip(offsets @ segment / length_squared, 0, 1) if length_squared else np.zeros(len(points))
+        return np.hypot(*(offsets - t[:, None] * segment).T)
+
 
 @dataclass
 class DrawableLine(Line, Drawable[np.ndarray]):
@@ -1,78 +1,116 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
+from itertools import chain
+from typing import Iterable
 
-import cv2
 import numpy as np
 
 from amir_dev_studio.computer_vision.models.base import Base
 from amir_dev_studio.computer_vision.models.color import Color
 from amir_dev_studio.computer_vision.models.drawable.base import Drawable
 from amir_dev_studio.computer_vision.models.drawable.configs import get_default_draw_thickness, get_default_draw_color
-from amir_dev_studio.computer_vision.models.point import Point
+from amir_dev_studio.computer_vision.models.point import Point, PointArray
+from amir_dev_studio.lazy_imports import lazy_import
 
+cv2 = lazy_import('cv2')
 
-@dataclass
+
+@dataclass(slots=True)
 class Rectangle(Base):
     """
     A rectangle defined by two opposite corners.
+
+    The normalized edges are computed once, when the corners are assigned. Moving a corner point in place
+    (rect.pt2.x = 10) does not update them; reassign pt1 or pt2 instead.
     """
+    # Declared first so __init__ resets it before assigning the corners; __post_init__ fills it in. A factory
+    # rather than a plain default, so non-slotted subclasses also assign it in __init__.
+    _ltrb: tuple[float, float, float, float] = field(
+        default_factory=lambda: None,
+        init=False,
+        repr=False,
+        compare=False
+    )
+
     pt1: Point
     pt2: Point
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+
+        if name == 'pt1' or name == 'pt2':
+            try:
+                if self._ltrb is not None:
+                    self._normalize()
+            except AttributeError:
+                # copy and pickle restore the fields one at a time; the restored _ltrb is already correct.
+                pass
+
     def __copy__(self):
         return Rectangle(self.pt1, self.pt2)
 
     def __post_init__(self):
-        assert self.pt1.xy != self.pt2.xy, 'Rectangle cannot have zero area'
-        assert self.pt1.x != self.pt2.x, 'Rectangle width cannot be 0'
-        assert self.pt1.y != self.pt2.y, 'Rectangle height cannot be 0'
+        self._normalize()
+        left, top, right, bottom = self._ltrb
+
+        assert left != right or top != bottom, 'Rectangle cannot have zero area'
+        assert left != right, 'Rectangle width cannot be 0'
+        assert top != bottom, 'Rectangle height cannot be 0'
+
+    def _normalize(self):
+        x1, y1, x2, y2 = self.pt1.x, self.pt1.y, self.pt2.x, self.pt2.y
+        ltrb = (x1, y1, x2, y2) if x1 <= x2 else (x2, y1, x1, y2)
+        if y1 > y2:
+            ltrb = (ltrb[0], y2, ltrb[2], y1)
+        object.__setattr__(self, '_ltrb', ltrb)
 
     def __repr__(self):
         return f'Rectangle({self.top_left.xy}, {self.bottom_right.xy})'
 
     @property
     def bottom(self) -> float:
-        return self.bottom_right.y
+        return self._ltrb[3]
 
     @property
     def bottom_right(self) -> Point:
-        return Point(
-            max(self.pt1.x, self.pt2.x),
-            max(self.pt1.y, self.pt2.y)
-        )
+        return Point(self._ltrb[2], self._ltrb[3])
 
     @property
     def center(self) -> Point:
+        left, top, right, bottom = self._ltrb
         return Point(
-            self.top_left.x + self.width / 2,
-            self.top_left.y + self.height / 2
+            left + (right - left) / 2,
+            top + (bottom - top) / 2
         )
 
     @property
     def height(self):
-        return self.bottom_right.y - self.top_left.y
+        return self._ltrb[3] - self._ltrb[1]
 
     @property
     def left(self) -> float:
-        return self.top_left.x
+        return self._ltrb[0]
+
+    @property
+    def ltrb(self) -> tuple[float, float, float, float]:
+        return self._ltrb
 
     @property
     def right(self) -> float:
-        return self.bottom_right.x
+        return self._ltrb[2]
 
     @property
     def top(self) -> float:
-        return self.top_left.y
+        return self._ltrb[1]
 
     @property
     def top_left(self) -> Point:
-        return Point(
-            min(self.pt1.x, self.pt2.x),
-            min(self.pt1.y, self.pt2.y)
-        )
+        return Point(self._ltrb[0], self._ltrb[1])
 
     @property
     def width(self) -> float:
-        return self.bottom_right.x - self.top_left.x
+        return self._ltrb[2] - self._ltrb[0]
 
     @classmethod
     def from_coco_bbox(cls, x: float, y: float, width: float, height: float):
@@ -123,6 +161,12 @@ class Rectangle(Base):
             self.bottom >= other.bottom
         )
 
+    def contains_points(self, points: PointArray) -> np.ndarray:
+        return (
+            (points.x >= self.left) & (points.x <= self.right) &
+            (points.y >= self.top) & (points.y <= self.bottom)
+        )
+
     def get_random_point(self) -> Point:
         return Point(
             np.random.uniform(self.left + 3, self.right - 3),
@@ -130,13 +174,13 @@ class Rectangle(Base):
         )
 
     def to_coco_bbox(self) -> tuple[float, float, float, float]:
-        return self.top_left.x, self.top_left.y, self.width, self.height
+        return self.left, self.top, self.width, self.height
 
     def to_tlbr(self) -> tuple[tuple[int, int], tuple[int, int]]:
         return self.top_left.xy, self.bottom_right.xy
 
     def to_xywh(self) -> tuple[float, float, float, float]:
-        return self.top_left.x, self.top_left.y, self.width, self.height
+        return self.left, self.top, self.width, self.height
 
     def to_yolo_bbox(self, image_width: int, image_height: int) -> tuple[float, float, float, float]:
         return (
@@ -169,3 +213,183 @@ class DrawableRectangle(Rectangle, Drawable[np.ndarray]):
             self.thickness
         )
 
+
+@dataclass
+class BoxArray(Base):
+    """
+    A columnar collection of rectangles backed by an Nx4 float array of (left, top, right, bottom) rows.
+    """
+    ltrb: np.ndarray
+
+    def __post_init__(self):
+        boxes = np.asarray(self.ltrb, dtype=np.float64).reshape(-1, 4)
+        self.ltrb = np.concatenate(
+            (
+                np.minimum(boxes[:, :2], boxes[:, 2:]),
+                np.maximum(boxes[:, :2], boxes[:, 2:])
+            ),
+            axis=1
+        )
+
+    def __copy__(self):
+        return BoxArray(self.ltrb.copy())
+
+    def __getitem__(self, item) -> Rectangle | BoxArray:
+        if isinstance(item, (int, np.integer)):
+            return Rectangle.from_ltrb(*self.ltrb[item].tolist())
+        return BoxArray(self.ltrb[item])
+
+    def __iter__(self):
+        for left, top, right, bottom in self.ltrb.tolist():
+            yield Rectangle.from_ltrb(left, top, right, bottom)
+
+    def __len__(self):
+        return len(self.ltrb)
+
+    def __repr__(self):
+        return f'BoxArray(n={len(self)})'
+
+    @property
+    def areas(self) -> np.ndarray:
+        return self.widths * self.heights
+
+    @property
+    def bottom(self) -> np.ndarray:
+        return self.ltrb[:, 3]
+
+    @property
+    def centers(self) -> PointArray:
+        return PointArray((self.ltrb[:, :2] + self.ltrb[:, 2:]) / 2)
+
+    @property
+    def heights(self) -> np.ndarray:
+        return self.bottom - self.top
+
+    @property
+    def left(self) -> np.ndarray:
+        return self.ltrb[:, 0]
+
+    @property
+    def right(self) -> np.ndarray:
+        return self.ltrb[:, 2]
+
+    @property
+    def top(self) -> np.ndarray:
+        return self.ltrb[:, 1]
+
+    @property
+    def widths(self) -> np.ndarray:
+        return self.right - self.left
+
+    @classmethod
+    def empty(cls) -> BoxArray:
+        return cls(np.empty((0, 4), np.float64))
+
+    @classmethod
+    def from_coco_bboxes(cls, boxes: np.ndarray) -> BoxArray:
+        return cls.from_ltwh(boxes)
+
+    @classmethod
+    def from_ltrb(cls, boxes: np.ndarray) -> BoxArray:
+        return cls(boxes)
+
+    @classmethod
+    def from_ltwh(cls, boxes: np.ndarray) -> BoxArray:
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        return cls(np.concatenate((boxes[:, :2], boxes[:, :2] + boxes[:, 2:]), axis=1))
+
+    @classmethod
+    def from_rectangles(cls, rectangles: Iterable[Rectangle]) -> BoxArray:
+        if isinstance(rectangles, BoxArray):
+            return rectangles.copy()
+
+        rectangles = list(rectangles)
+        boxes = np.fromiter(
+            chain.from_iterable(r.ltrb for r in rectangles),
+            dtype=np.float64,
+            count=len(rectangles) * 4
+        )
+        return cls(boxes)
+
+    @classmethod
+    def from_tlbr(cls, boxes: np.ndarray) -> BoxArray:
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        return cls(boxes[:, [1, 0, 3, 2]])
+
+    @classmethod
+    def from_xywh(cls, boxes: np.ndarray) -> BoxArray:
+        return cls.from_ltwh(boxes)
+
+    @classmethod
+    def from_yolo_bboxes(cls, boxes: np.ndarray, image_width: int, image_height: int) -> BoxArray:
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4) * ((image_width, image_height) * 2)
+        half_sizes = boxes[:, 2:] / 2
+        return cls(np.concatenate((boxes[:, :2] - half_sizes, boxes[:, :2] + half_sizes), axis=1))
+
+    def contains(self, other: Rectangle | BoxArray = None) -> np.ndarray:
+        """
+        Containment matrix where [i, j] is True if box i of self contains box j of other.
+        """
+        other_ltrb = self.ltrb if other is None else _as_ltrb(other)
+        return (
+            (self.ltrb[:, None, 0] <= other_ltrb[None, :, 0]) &
+            (self.ltrb[:, None, 1] <= other_ltrb[None, :, 1]) &
+            (self.ltrb[:, None, 2] >= other_ltrb[None, :, 2]) &
+            (self.ltrb[:, None, 3] >= other_ltrb[None, :, 3])
+        )
+
+    def contains_points(self, points: PointArray) -> np.ndarray:
+        """
+        Hit-test matrix where [i, j] is True if box i contains point j. Edges count as inside.
+        """
+        x, y = points.x[None, :], points.y[None, :]
+        return (
+            (self.ltrb[:, None, 0] <= x) & (self.ltrb[:, None, 2] >= x) &
+            (self.ltrb[:, None, 1] <= y) & (self.ltrb[:, None, 3] >= y)
+        )
+
+    def intersection_areas(self, other: Rectangle | BoxArray = None) -> np.ndarray:
+        other_ltrb = self.ltrb if other is None else _as_ltrb(other)
+        top_left = np.maximum(self.ltrb[:, None, :2], other_ltrb[None, :, :2])
+        bottom_right = np.minimum(self.ltrb[:, None, 2:], other_ltrb[None, :, 2:])
+        sizes = np.clip(bottom_right - top_left, 0, None)
+        return sizes[..., 0] * sizes[..., 1]
+
+    def iou(self, other: Rectangle | BoxArray = None) -> np.ndarray:
+        """
+        Pairwise intersection-over-union matrix, shaped (len(self), len(other)).
+        """
+        other_ltrb = self.ltrb if other is None else _as_ltrb(other)
+        other_areas = (other_ltrb[:, 2] - other_ltrb[:, 0]) * (other_ltrb[:, 3] - other_ltrb[:, 1])
+        intersections = self.intersection_areas(other)
+        unions = self.areas[:, None] + other_areas[None, :] - intersections
+        return np.divide(intersections, unions, out=np.zeros_like(intersections), where=unions > 0)
+
+    def to_coco_bboxes(self) -> np.ndarray:
+        return self.to_ltwh()
+
+    def to_ltrb(self) -> np.ndarray:
+        return self.ltrb.copy()
+
+    def to_ltwh(self) -> np.ndarray:
+        return np.concatenate((self.ltrb[:, :2], self.ltrb[:, 2:] - self.ltrb[:, :2]), axis=1)
+
+    def to_rectangles(self) -> list[Rectangle]:
+        return list(self)
+
+    def to_tlbr(self) -> np.ndarray:
+        return self.ltrb[:, [1, 0, 3, 2]]
+
+    def to_xywh(self) -> np.ndarray:
+        return self.to_ltwh()
+
+    def to_yolo_bboxes(self, image_width: int, image_height: int) -> np.ndarray:
+        centers = (self.ltrb[:, :2] + self.ltrb[:, 2:]) / 2
+        sizes = self.ltrb[:, 2:] - self.ltrb[:, :2]
+        return np.concatenate((centers, sizes), axis=1) / ((image_width, image_height) * 2)
+
+
+def _as_ltrb(other: Rectangle | BoxArray) -> np.ndarray:
+    if isinstance(other, BoxArray):
+        return other.ltrb
+    return np.array([other.ltrb], dtype=np.float64)
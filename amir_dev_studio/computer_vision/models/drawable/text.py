@@ -1,9 +1,7 @@
 from dataclasses import dataclass, field
 
-import cv2
 import numpy as np
 
-from amir_dev_studio.computer_vision.models.base import Base
 from amir_dev_studio.computer_vision.models.color import Color
 from amir_dev_studio.computer_vision.models.drawable.configs import (
     get_default_draw_thickness,
@@ -12,10 +10,13 @@ from amir_dev_studio.computer_vision.models.drawable.configs import (
 )
 from amir_dev_studio.computer_vision.models.drawable.base import Drawable
 from amir_dev_studio.computer_vision.models.point import Point
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
 
 
 @dataclass
-class DrawableText(Base, Drawable[np.ndarray]):
+class DrawableText(Drawable[np.ndarray]):
     value: str
     position: Point
 
@@ -30,6 +31,7 @@ class DrawableText(Base, Drawable[np.ndarray]):
             self.position.copy(),
             self.color.copy(),
             self.font_scale,
+            self.font_face,
             self.thickness
         )
 
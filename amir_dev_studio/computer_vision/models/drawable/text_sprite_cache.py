@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.models.drawable.text import DrawableText
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+
+@dataclass(frozen=True)
+class TextSprite:
+    """
+    A pre-rendered label: a boolean glyph mask, the fill color and the mask's offset from the text origin.
+    """
+    mask: np.ndarray
+    color: tuple[float, ...]
+    offset_x: int
+    offset_y: int
+
+    def blit(self, pixels: np.ndarray, x: int, y: int) -> np.ndarray:
+        left, top = x + self.offset_x, y + self.offset_y
+        height, width = self.mask.shape
+
+        x0, y0 = max(left, 0), max(top, 0)
+        x1, y1 = min(left + width, pixels.shape[1]), min(top + height, pixels.shape[0])
+
+        if x0 >= x1 or y0 >= y1:
+            return pixels
+
+        mask = self.mask[y0 - top:y1 - top, x0 - left:x1 - left]
+        if pixels.ndim == 3:
+            # Like an OpenCV scalar: missing channels (alpha on BGRA images) are filled with 0.
+            channels = pixels.shape[2]
+            color = (tuple(self.color) + (0,) * channels)[:channels]
+        else:
+            color = self.color[0]
+        pixels[y0:y1, x0:x1][mask] = np.clip(np.round(color), 0, 255)
+
+        return pixels
+
+
+class TextSpriteCache:
+    """
+    A bounded LRU cache of rasterized text labels.
+
+    Each distinct (value, font_face, font_scale, thickness, color) is drawn once with `cv2.putText` into a
+    mask, then stamped onto images with a masked assignment. The result is pixel-identical to drawing the
+    text directly, except for labels cut by the image border, where OpenCV's stroke clipping can move
+    edge pixels by one.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        assert max_entries > 0, 'max_entries must be positive'
+
+        self._lock = Lock()
+        self._sprites: OrderedDict[tuple, TextSprite] = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def __repr__(self):
+        return f'TextSpriteCache(entries={len(self)}, hits={self.hits}, misses={self.misses})'
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def _render(key: tuple) -> TextSprite:
+        value, font_face, font_scale, thickness, color = key
+        (width, height), baseline = cv2.getTextSize(value, font_face, font_scale, thickness)
+
+        # Hershey glyphs can overshoot the reported text box, so render with a generous margin
+        # and crop to the pixels that were actually set.
+        margin = height + 2 * max(thickness, 1)
+        canvas = np.zeros((height + baseline + 2 * margin, width + 2 * margin), np.uint8)
+        cv2.putText(canvas, value, (margin, margin + height), font_face, font_scale, 255, thickness)
+
+        rows = np.flatnonzero(canvas.any(axis=1))
+        columns = np.flatnonzero(canvas.any(axis=0))
+
+        if not len(rows):
+            return TextSprite(np.zeros((0, 0), bool), color, 0, 0)
+
+        mask = canvas[rows[0]:rows[-1] + 1, columns[0]:columns[-1] + 1] > 0
+        return TextSprite(mask, color, int(columns[0]) - margin, int(rows[0]) - margin - height)
+
+    def clear(self):
+        with self._lock:
+            self._sprites.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def draw(self, text: DrawableText, pixels: np.ndarray) -> np.ndarray:
+        x, y = text.position.xy_ints
+        return self.get(text).blit(pixels, x, y)
+
+    def get(self, text: DrawableText) -> TextSprite:
+        # Same color channel order DrawableText.draw_on_image passes to OpenCV.
+        key = (text.value, text.font_face, text.font_scale, text.thickness, text.color.rgb)
+
+        with self._lock:
+            if (sprite := self._sprites.get(key)) is not None:
+                self._sprites.move_to_end(key)
+                self.hits += 1
+                return sprite
+
+            self.misses += 1
+
+        sprite = self._render(key)
+
+        with self._lock:
+            self._sprites[key] = sprite
+            self._sprites.move_to_end(key)
+
+            while len(self._sprites) > self.max_entries:
+                self._sprites.popitem(last=False)
+                self.evictions += 1
+
+        return sprite
+
+
+default_text_sprite_cache = TextSpriteCache()
+
+
+def get_default_text_sprite_cache() -> TextSpriteCache:
+    return default_text_sprite_cache
+
+
+def set_default_text_sprite_cache(cache: TextSpriteCache):
+    global default_text_sprite_cache
+    default_text_sprite_cache = cache
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import List
 
-import cv2
 import numpy as np
 
+from amir_dev_studio.computer_vision import color_conversions, tone
+from amir_dev_studio.computer_vision.buffer_pool import BufferPool
 from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.integral_image import IntegralImage
+from amir_dev_studio.computer_vision.io import raw_store
 from amir_dev_studio.computer_vision.models.base import Base
 from amir_dev_studio.computer_vision.models.drawable.base import Drawable
+from amir_dev_studio.computer_vision.models.drawable.rectangle import Rectangle
 from amir_dev_studio.computer_vision.models.point import Point
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+# sys.getrefcount of a buffer held only by Image._recycle's caller: the caller's local, the parameter and
+# getrefcount's own argument.
+_unshared_buffer_refcount = 3
 
 
 @dataclass
@@ -20,12 +32,28 @@ class Image(Base):
     name: str = 'Untitled'
     path: str = None
 
+    buffer_pool: BufferPool = field(default=None, repr=False, compare=False)
+
+    _shared_base: np.ndarray = field(default=None, init=False, repr=False, compare=False)
+    _pooled_buffer: np.ndarray = field(default=None, init=False, repr=False, compare=False)
+    _representations: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _integral: IntegralImage = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        # Replacing the pixels invalidates every cached color space representation and the integral image.
+        if name == 'pixels':
+            if representations := self.__dict__.get('_representations'):
+                representations.clear()
+            self.__dict__['_integral'] = None
+        super().__setattr__(name, value)
+
     def __copy__(self):
         return Image(
             pixels=self.pixels.copy(),
             color_space=self.color_space,
             name=self.name,
-            path=self.path
+            path=self.path,
+            buffer_pool=self.buffer_pool
         )
 
     def __repr__(self):
@@ -39,6 +67,23 @@ class Image(Base):
     def height(self):
         return self.pixels.shape[0]
 
+    @property
+    def integral(self) -> IntegralImage:
+        """
+        Summed-area tables for O(1) region statistics, built on first use and kept until the pixels are
+        replaced. Call invalidate_representations after writing into `pixels` in place.
+        """
+        if self._integral is None:
+            self._integral = IntegralImage(self.pixels)
+        return self._integral
+
+    @property
+    def is_view(self) -> bool:
+        """
+        True while this image still shares its pixel buffer with the image it was viewed from.
+        """
+        return self._shared_base is not None and np.may_share_memory(self.pixels, self._shared_base)
+
     @property
     def center(self) -> Point:
         return Point(self.width / 2, self.height / 2)
@@ -76,54 +121,165 @@ class Image(Base):
             **kwargs
         )
 
+    @classmethod
+    def from_mmap(cls, path: str, mode: str = 'c') -> Image:
+        """
+        Opens an image saved with save_mmap without reading its pixels. See raw_store.open_raw for modes.
+        """
+        pixels, header = raw_store.open_raw(path, mode)
+
+        return cls.from_numpy_array(
+            pixels=pixels,
+            color_space=header.color_space,
+            name=header.name,
+            path=path
+        )
+
+    def _ensure_owns_pixels(self):
+        if self.is_view:
+            self.pixels = self.pixels.copy()
+        self._shared_base = None
+
+    def _output_buffer(self, shape: tuple[int, ...], dtype=None) -> np.ndarray | None:
+        if self.buffer_pool is None:
+            return None
+        return self.buffer_pool.acquire(shape, dtype or self.pixels.dtype)
+
+    def _set_output_pixels(self, pixels: np.ndarray, buffer: np.ndarray | None):
+        # `buffer` is the pooled destination handed to OpenCV. If OpenCV allocated its own output anyway,
+        # the buffer goes straight back; otherwise it replaces the buffer this image held before.
+        if buffer is not None and pixels is not buffer:
+            self.buffer_pool.release(buffer)
+            buffer = None
+
+        previous = self._pooled_buffer
+        self.pixels = pixels
+        self._pooled_buffer = buffer
+
+        if previous is not None:
+            self._recycle(previous)
+
+    def _recycle(self, buffer: np.ndarray):
+        # Views, as_ results and arrays held by callers keep referencing the buffer, so it only goes back to
+        # the pool once nothing else does; otherwise the next acquire would overwrite pixels still in use.
+        if sys.getrefcount(buffer) <= _unshared_buffer_refcount:
+            self.buffer_pool.release(buffer)
+        else:
+            self.buffer_pool.discard(buffer)
+
     def draw(self, drawable: Drawable[np.ndarray]):
+        self._ensure_owns_pixels()
         self.pixels = drawable.draw_on_image(self.pixels)
 
     def apply_brightness(self, value: float):
-        if value > 0:
-            shadow = value
-            max_ = 255
-
-        else:
-            shadow = 0
-            max_ = 255 + value
+        dst = self._output_buffer(self.pixels.shape)
 
-        alpha = (max_ - shadow) / 255
-        gamma = shadow
+        if self.pixels.dtype == np.uint8:
+            self._set_output_pixels(cv2.LUT(self.pixels, tone.brightness_lut(value), dst=dst), dst)
 
-        self.pixels = cv2.addWeighted(self.pixels, alpha, self.pixels, 0, gamma)
+        else:
+            alpha, gamma = tone.brightness_coefficients(value)
+            self._set_output_pixels(cv2.addWeighted(self.pixels, alpha, self.pixels, 0, gamma, dst=dst), dst)
 
         return self
 
     def apply_color_space_conversion(self, color_space: ColorSpaces):
-        conversion_key = (self.color_space, color_space)
-        conversions = {
-            (ColorSpaces.BGR, ColorSpaces.GRAY): cv2.COLOR_BGR2GRAY,
-            (ColorSpaces.BGR, ColorSpaces.RGB): cv2.COLOR_BGR2RGB,
-            (ColorSpaces.RGB, ColorSpaces.BGR): cv2.COLOR_RGB2BGR,
-        }
+        if color_space == self.color_space:
+            return
+
+        # A conversion keeps the picture itself, so the other cached representations stay valid.
+        representations = dict(self._representations)
+        cached = representations.pop(color_space, None)
+
+        if self._pooled_buffer is None:
+            representations[self.color_space] = self.pixels
 
-        if not (conversion := conversions.get(conversion_key)):
-            raise Exception(f'Could not convert {self.color_space} to {color_space}')
+        if cached is not None:
+            # Views handed out by as_ may still reference the cached pixels, so adopt them copy-on-write.
+            self._set_output_pixels(cached, None)
+            self._shared_base = cached
+
+        else:
+            dst = self._output_buffer(color_conversions.output_shape(self.pixels, color_space))
+            pixels = color_conversions.convert(self.pixels, self.color_space, color_space, dst=dst)
+            self._set_output_pixels(pixels, dst)
 
-        self.pixels = cv2.cvtColor(self.pixels, conversion)
         self.color_space = color_space
+        self._representations.update(representations)
 
     def apply_contrast(self, value: float):
-        alpha = float(131 * (value + 127)) / (127 * (131 - value))
-        gamma = 127 * (1 - alpha)
-        self.pixels = cv2.addWeighted(self.pixels, alpha, self.pixels, 0, gamma)
+        dst = self._output_buffer(self.pixels.shape)
+
+        if self.pixels.dtype == np.uint8:
+            self._set_output_pixels(cv2.LUT(self.pixels, tone.contrast_lut(value), dst=dst), dst)
+
+        else:
+            alpha, gamma = tone.contrast_coefficients(value)
+            self._set_output_pixels(cv2.addWeighted(self.pixels, alpha, self.pixels, 0, gamma, dst=dst), dst)
+
+    def apply_curve(self, *control_points: tuple[float, float]):
+        self.apply_tone_map(tone.ToneMap().curve(*control_points))
+
+    def apply_gamma(self, gamma: float):
+        self.apply_tone_map(tone.ToneMap().gamma(gamma))
 
     def apply_gaussian_blur(self, kernel_size: int):
-        self.pixels = cv2.GaussianBlur(self.pixels, (kernel_size, kernel_size), 0)
+        dst = self._output_buffer(self.pixels.shape)
+        self._set_output_pixels(cv2.GaussianBlur(self.pixels, (kernel_size, kernel_size), 0, dst=dst), dst)
 
     def apply_grayscale_conversion(self):
-        self.apply_color_space_conversion(ColorSpaces.GRAY)
-        self.pixels = np.stack((self.pixels,) * 3, axis=-1)
+        """
+        Desaturates the image while keeping its channel layout, e.g. BGR stays a 3-channel BGR image.
+        """
+        color_space = self.color_space
+        gray = color_conversions.convert(self.pixels, color_space, ColorSpaces.GRAY)
+
+        dst = self._output_buffer(color_conversions.output_shape(self.pixels, color_space))
+        self._set_output_pixels(color_conversions.convert(gray, ColorSpaces.GRAY, color_space, dst=dst), dst)
+
+    def apply_levels(
+            self,
+            in_black: int = 0,
+            in_white: int = 255,
+            gamma: float = 1.0,
+            out_black: int = 0,
+            out_white: int = 255
+    ):
+        self.apply_tone_map(tone.ToneMap().levels(in_black, in_white, gamma, out_black, out_white))
 
     def apply_rgb_conversion(self):
         self.apply_color_space_conversion(ColorSpaces.RGB)
 
+    def apply_tone_map(self, tone_map: tone.ToneMap):
+        dst = self._output_buffer(self.pixels.shape)
+        self._set_output_pixels(tone_map.apply(self.pixels, dst=dst), dst)
+
+    def apply_white_balance(self, *gains: float):
+        self.apply_tone_map(tone.ToneMap().white_balance(*gains))
+
+    def as_(self, color_space: ColorSpaces) -> Image:
+        """
+        Returns this image in another color space without changing it. Conversions are cached on the image
+        until its pixels are replaced, so repeated requests for the same frame cost nothing. The result is a
+        copy-on-write view of the cached pixels.
+
+        Writing into `pixels` in place bypasses the cache; call invalidate_representations afterwards.
+        """
+        if color_space == self.color_space:
+            pixels = self.pixels
+
+        elif (pixels := self._representations.get(color_space)) is None:
+            pixels = color_conversions.convert(self.pixels, self.color_space, color_space)
+            self._representations[color_space] = pixels
+
+        image = Image(
+            pixels=pixels,
+            color_space=color_space,
+            name=self.name,
+            path=self.path
+        )
+        return image.view(Rectangle.from_ltrb(0, 0, image.width, image.height))
+
     def blank_copy(self):
         return self.__class__.create_blank(self.width, self.height)
 
@@ -133,28 +289,84 @@ class Image(Base):
     def concat_vertical(self, image: Image):
         self.pixels = np.concatenate((self.pixels, image.pixels), axis=0)
 
+    def view(self, rect: Rectangle, copy_on_write: bool = True) -> Image:
+        """
+        Returns an image over the given region that shares memory with this one. The rectangle is clipped
+        to the image bounds.
+
+        With copy_on_write, the view's pixels are read-only and the view copies its region before the first
+        in-place write (drawing). The apply_* methods already produce new buffers and never write into the
+        parent. Without copy_on_write, writes to the view go straight through to this image.
+        """
+        left, top = max(int(rect.left), 0), max(int(rect.top), 0)
+        right, bottom = min(int(np.ceil(rect.right)), self.width), min(int(np.ceil(rect.bottom)), self.height)
+
+        assert left < right and top < bottom, f'{rect} does not overlap the image'
+
+        pixels = self.pixels[top:bottom, left:right]
+        image = Image(
+            pixels=pixels,
+            color_space=self.color_space,
+            name=self.name,
+            path=self.path
+        )
+
+        if copy_on_write:
+            pixels.flags.writeable = False
+            image._shared_base = self.pixels
+
+        return image
+
+    def invalidate_representations(self):
+        self._representations.clear()
+        self._integral = None
+
     def iter_resized_copies(self, start, stop, count):
         step = abs(stop - start) / count
 
         for i in range(count):
             scale = start + (step * i)
-            copy = self.copy()
-            copy.scale(scale)
-            yield copy
-
-    def scale(self, value: float):
+            yield Image(
+                pixels=self._resized_pixels(scale),
+                color_space=self.color_space,
+                name=self.name,
+                path=self.path
+            )
+
+    def _resized_pixels(self, value: float, dst: np.ndarray = None) -> np.ndarray:
         new_width = int(self.width * value)
         new_height = int(self.height * value)
 
-        self.pixels = cv2.resize(
+        return cv2.resize(
             self.pixels,
             (new_width, new_height),
+            dst=dst,
             interpolation=cv2.INTER_AREA
         )
 
+    def release(self):
+        """
+        Returns this image's pooled buffer, if any, to its BufferPool. The image must not be used afterwards.
+        A buffer that views or other arrays still reference is left to them instead.
+        """
+        buffer = self._pooled_buffer
+        self._pooled_buffer = None
+        self.pixels = None
+
+        if buffer is not None:
+            self._recycle(buffer)
+
+    def scale(self, value: float):
+        shape = (int(self.height * value), int(self.width * value), *self.pixels.shape[2:])
+        dst = self._output_buffer(shape)
+        self._set_output_pixels(self._resized_pixels(value, dst), dst)
+
     def save(self, path: str):
         cv2.imwrite(path, self.pixels)
 
+    def save_mmap(self, path: str):
+        raw_store.save_raw(path, self.pixels, self.color_space, self.name)
+
     def show(self, title: str = None, wait_key: int = 0, should_destroy_window: bool = True):
         title = title or self.name
         cv2.imshow(title, self.pixels)
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from amir_dev_studio.computer_vision import color_conversions
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.models.base import Base
+from amir_dev_studio.computer_vision.models.drawable.rectangle import BoxArray, Rectangle
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+RESIZE_MODES = {'letterbox', 'stretch'}
+
+# Source channel index for each output channel, per input layout.
+_channel_sources = {
+    (ColorSpaces.BGR, 'BGR'): (0, 1, 2),
+    (ColorSpaces.BGR, 'RGB'): (2, 1, 0),
+    (ColorSpaces.RGB, 'BGR'): (2, 1, 0),
+    (ColorSpaces.RGB, 'RGB'): (0, 1, 2),
+    (ColorSpaces.RGBA, 'BGR'): (2, 1, 0),
+    (ColorSpaces.RGBA, 'RGB'): (0, 1, 2),
+    (ColorSpaces.GRAY, 'BGR'): (0, 0, 0),
+    (ColorSpaces.GRAY, 'RGB'): (0, 0, 0),
+}
+
+
+def _to_uint8(pixels: np.ndarray) -> np.ndarray:
+    # Float images are taken to be in [0, 1], as OpenCV treats them; uint16 images span the full 16 bits.
+    if pixels.dtype == np.uint8:
+        return pixels
+    if pixels.dtype == np.uint16:
+        return cv2.convertScaleAbs(pixels, alpha=255 / 65535)
+    if np.issubdtype(pixels.dtype, np.floating):
+        return np.clip(np.rint(pixels * 255), 0, 255).astype(np.uint8)
+
+    raise Exception(f'Cannot convert {pixels.dtype} pixels to a tensor; use uint8, uint16 or float images')
+
+
+@dataclass(frozen=True)
+class LetterboxTransform:
+    """
+    Maps between an original image's coordinates and its resized, padded slot in a tensor:
+    tensor = original * scale + pad.
+    """
+    scale_x: float
+    scale_y: float
+    pad_x: float
+    pad_y: float
+
+    def boxes_to_source(self, boxes: BoxArray) -> BoxArray:
+        scale = np.array([self.scale_x, self.scale_y] * 2)
+        pad = np.array([self.pad_x, self.pad_y] * 2)
+        return BoxArray((boxes.ltrb - pad) / scale)
+
+    def boxes_to_tensor(self, boxes: BoxArray) -> BoxArray:
+        scale = np.array([self.scale_x, self.scale_y] * 2)
+        pad = np.array([self.pad_x, self.pad_y] * 2)
+        return BoxArray(boxes.ltrb * scale + pad)
+
+    def to_source(self, rect: Rectangle) -> Rectangle:
+        return Rectangle.from_ltrb(
+            (rect.left - self.pad_x) / self.scale_x,
+            (rect.top - self.pad_y) / self.scale_y,
+            (rect.right - self.pad_x) / self.scale_x,
+            (rect.bottom - self.pad_y) / self.scale_y
+        )
+
+    def to_tensor(self, rect: Rectangle) -> Rectangle:
+        return Rectangle.from_ltrb(
+            rect.left * self.scale_x + self.pad_x,
+            rect.top * self.scale_y + self.pad_y,
+            rect.right * self.scale_x + self.pad_x,
+            rect.bottom * self.scale_y + self.pad_y
+        )
+
+
+@dataclass
+class ImageBatch(Base):
+    images: list[Image]
+
+    def __copy__(self):
+        return ImageBatch([image.copy() for image in self.images])
+
+    def __len__(self):
+        return len(self.images)
+
+    def to_tensor(
+            self,
+            size: tuple[int, int],
+            mode: str = 'letterbox',
+            channel_order: str = 'RGB',
+            mean: Sequence[float] = (0.0, 0.0, 0.0),
+            std: Sequence[float] = (1.0, 1.0, 1.0),
+            scale: float = 1 / 255,
+            dtype=np.float32,
+            pad_value: int = 114,
+            channels_first: bool = True,
+            interpolation: int = None,
+            out: np.ndarray = None
+    ) -> tuple[np.ndarray, list[LetterboxTransform]]:
+        """
+        Packs the images into one contiguous (N, 3, H, W) tensor, or (N, H, W, 3) without channels_first.
+        Each value is ((pixel * scale) - mean) / std, with mean and std given in output channel order.
+
+        Every image is resized into a single reused uint8 canvas. Channel reordering, normalization,
+        dtype conversion and the transpose then happen in one lookup pass per channel, written straight
+        into the output tensor. Pass a previous result as `out` to reuse its memory. uint16 and float
+        (0 to 1) images are scaled to 8 bits first.
+
+        Returns the tensor and one LetterboxTransform per image for mapping detections back.
+        """
+        assert mode in RESIZE_MODES, f'Invalid resize mode: {mode}'
+        assert channel_order in {'RGB', 'BGR'}, f'Invalid channel order: {channel_order}'
+        assert len(mean) == len(std) == 3, 'mean and std need one value per output channel'
+
+        if interpolation is None:
+            interpolation = cv2.INTER_LINEAR
+
+        width, height = size
+        shape = (len(self.images), 3, height, width) if channels_first else (len(self.images), height, width, 3)
+
+        if out is None or out.shape != shape or out.dtype != np.dtype(dtype) or not out.flags.c_contiguous:
+            out = np.empty(shape, dtype)
+
+        # Per-channel lookup tables fold scaling, mean and std into a single gather per channel.
+        ramp = np.arange(256, dtype=np.float64)
+        luts = [((ramp * scale - m) / s).astype(dtype) for m, s in zip(mean, std)]
+
+        canvas = np.empty((height, width, 3), np.uint8)
+        transforms = []
+
+        for index, image in enumerate(self.images):
+            pixels, color_space = _to_uint8(image.pixels), image.color_space
+            if (color_space, channel_order) not in _channel_sources:
+                pixels, color_space = color_conversions.convert(pixels, color_space, ColorSpaces.BGR), ColorSpaces.BGR
+
+            transform = self._resize_into(pixels, canvas, mode, pad_value, interpolation)
+            transforms.append(transform)
+
+            for channel, source in enumerate(_channel_sources[color_space, channel_order]):
+                target = out[index, channel] if channels_first else out[index, ..., channel]
+                np.take(luts[channel], canvas[..., source], out=target, mode='clip')
+
+        return out, transforms
+
+    @staticmethod
+    def _resize_into(
+            pixels: np.ndarray,
+            canvas: np.ndarray,
+            mode: str,
+            pad_value: int,
+            interpolation: int
+    ) -> LetterboxTransform:
+        height, width = canvas.shape[:2]
+        source_height, source_width = pixels.shape[:2]
+
+        if mode == 'stretch':
+            new_width, new_height, pad_x, pad_y = width, height, 0, 0
+        else:
+            ratio = min(width / source_width, height / source_height)
+            new_width = max(1, min(width, round(source_width * ratio)))
+            new_height = max(1, min(height, round(source_height * ratio)))
+            pad_x, pad_y = (width - new_width) // 2, (height - new_height) // 2
+            canvas[...] = pad_value
+
+        region = canvas[pad_y:pad_y + new_height, pad_x:pad_x + new_width]
+
+        if pixels.ndim == 2 or pixels.shape[2] == 1:
+            region[..., 0] = cv2.resize(pixels, (new_width, new_height), interpolation=interpolation)
+        else:
+            resized = cv2.resize(pixels[..., :3], (new_width, new_height), dst=region, interpolation=interpolation)
+            if not np.shares_memory(resized, region):
+                region[...] = resized
+
+        return LetterboxTransform(new_width / source_width, new_height / source_height, pad_x, pad_y)
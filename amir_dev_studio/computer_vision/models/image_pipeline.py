@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+
+@dataclass(frozen=True)
+class _Step:
+    name: str
+    fn: Callable[[Image], None]
+    is_pointwise: bool = False
+    commutes_with_crop: bool = False
+
+
+@dataclass(frozen=True)
+class _CropStep:
+    top: int = 0
+    bottom: int = 0
+    left: int = 0
+    right: int = 0
+
+    name = 'crop'
+    commutes_with_crop = True
+
+    def __add__(self, other: _CropStep) -> _CropStep:
+        return _CropStep(
+            self.top + other.top,
+            self.bottom + other.bottom,
+            self.left + other.left,
+            self.right + other.right
+        )
+
+    def fn(self, image: Image):
+        image.pixels = image.pixels[
+            self.top:image.height - self.bottom,
+            self.left:image.width - self.right
+        ]
+
+
+@dataclass(frozen=True)
+class _FusedPointwiseStep:
+    steps: tuple[_Step, ...]
+    lut: np.ndarray
+
+    name = 'fused_pointwise'
+    commutes_with_crop = True
+
+    @classmethod
+    def from_steps(cls, steps: tuple[_Step, ...]) -> _FusedPointwiseStep:
+        # Run the real Image methods over every possible uint8 value, so the table reproduces
+        # the exact rounding and saturation of applying the steps one after another.
+        ramp = Image.from_numpy_array(np.arange(256, dtype=np.uint8).reshape(1, 256), ColorSpaces.GRAY)
+        for step in steps:
+            step.fn(ramp)
+        return cls(steps, ramp.pixels.reshape(256).copy())
+
+    def fn(self, image: Image):
+        if image.pixels.dtype == np.uint8:
+            image.pixels = cv2.LUT(image.pixels, self.lut)
+            return
+
+        for step in self.steps:
+            step.fn(image)
+
+
+@dataclass
+class ImagePipeline:
+    """
+    A recorded sequence of Image operations that executes only when applied.
+
+    Before running, the pipeline is compiled: crops are moved ahead of the per-pixel operations they
+    commute with, so those operations only touch the ROI, and runs of adjacent pointwise tone operations
+    are fused into one 256-entry lookup table. A compiled pipeline can be applied to any number of frames.
+    """
+    source: Image = None
+    steps: list = field(default_factory=list)
+
+    _compiled: list = field(default=None, init=False, repr=False)
+
+    def __copy__(self):
+        return ImagePipeline(self.source, self.steps.copy())
+
+    def copy(self):
+        return self.__copy__()
+
+    def _record(self, step) -> ImagePipeline:
+        self.steps.append(step)
+        self._compiled = None
+        return self
+
+    def brightness(self, value: float) -> ImagePipeline:
+        return self._record(_Step('brightness', lambda image: image.apply_brightness(value), True, True))
+
+    def contrast(self, value: float) -> ImagePipeline:
+        return self._record(_Step('contrast', lambda image: image.apply_contrast(value), True, True))
+
+    def convert_color_space(self, color_space: ColorSpaces) -> ImagePipeline:
+        return self._record(
+            _Step('color_space', lambda image: image.apply_color_space_conversion(color_space), False, True)
+        )
+
+    def curve(self, *control_points: tuple[float, float]) -> ImagePipeline:
+        return self._record(_Step('curve', lambda image: image.apply_curve(*control_points), True, True))
+
+    def gamma(self, gamma: float) -> ImagePipeline:
+        return self._record(_Step('gamma', lambda image: image.apply_gamma(gamma), True, True))
+
+    def gaussian_blur(self, kernel_size: int) -> ImagePipeline:
+        return self._record(_Step('gaussian_blur', lambda image: image.apply_gaussian_blur(kernel_size)))
+
+    def grayscale(self) -> ImagePipeline:
+        return self._record(_Step('grayscale', lambda image: image.apply_grayscale_conversion(), False, True))
+
+    def levels(
+            self,
+            in_black: int = 0,
+            in_white: int = 255,
+            gamma: float = 1.0,
+            out_black: int = 0,
+            out_white: int = 255
+    ) -> ImagePipeline:
+        return self._record(_Step(
+            'levels',
+            lambda image: image.apply_levels(in_black, in_white, gamma, out_black, out_white),
+            True,
+            True
+        ))
+
+    def rgb(self) -> ImagePipeline:
+        return self.convert_color_space(ColorSpaces.RGB)
+
+    def scale(self, value: float) -> ImagePipeline:
+        return self._record(_Step('scale', lambda image: image.scale(value)))
+
+    def trim(self, top: int = 0, bottom: int = 0, left: int = 0, right: int = 0) -> ImagePipeline:
+        assert min(top, bottom, left, right) >= 0, 'Trim amounts cannot be negative'
+        return self._record(_CropStep(top, bottom, left, right))
+
+    def compile(self) -> list:
+        if self._compiled is not None:
+            return self._compiled
+
+        reordered = []
+        for step in self.steps:
+            if isinstance(step, _CropStep):
+                index = len(reordered)
+                while index and reordered[index - 1].commutes_with_crop and not isinstance(reordered[index - 1], _CropStep):
+                    index -= 1
+
+                if index and isinstance(reordered[index - 1], _CropStep):
+                    reordered[index - 1] += step
+                else:
+                    reordered.insert(index, step)
+            else:
+                reordered.append(step)
+
+        compiled = []
+        pointwise_run = []
+        for step in reordered + [None]:
+            if isinstance(step, _Step) and step.is_pointwise:
+                pointwise_run.append(step)
+                continue
+
+            if len(pointwise_run) > 1:
+                compiled.append(_FusedPointwiseStep.from_steps(tuple(pointwise_run)))
+            else:
+                compiled.extend(pointwise_run)
+
+            pointwise_run = []
+            if step is not None:
+                compiled.append(step)
+
+        self._compiled = compiled
+        return compiled
+
+    def describe(self) -> list[str]:
+        return [step.name for step in self.compile()]
+
+    def apply(self, image: Image) -> Image:
+        """
+        Runs the compiled pipeline on the image and returns the result. The input image is not modified;
+        a pipeline of crops alone returns a view of its pixels.
+        """
+        result = Image(
+            pixels=image.pixels,
+            color_space=image.color_space,
+            name=image.name,
+            path=image.path,
+            buffer_pool=image.buffer_pool
+        )
+
+        for step in self.compile():
+            step.fn(result)
+
+        return result
+
+    def __call__(self, image: Image) -> Image:
+        return self.apply(image)
+
+    def apply_many(self, images: Iterable[Image]) -> Iterator[Image]:
+        for image in images:
+            yield self.apply(image)
+
+    def materialize(self) -> Image:
+        assert self.source is not None, 'Pipeline is not bound to an image'
+        return self.apply(self.source)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterator
+
+
+from amir_dev_studio.computer_vision.models.base import Base
+from amir_dev_studio.computer_vision.models.drawable.rectangle import Rectangle
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+PYRAMID_METHODS = {'area', 'gaussian'}
+
+
+@dataclass(frozen=True)
+class PyramidWindow:
+    """
+    A window into one pyramid level. `image` is a view of the level's pixels and `rect` is the window's
+    footprint in the coordinates of the base image.
+    """
+    image: Image
+    level: int
+    scale: float
+    rect: Rectangle
+
+
+@dataclass
+class ImagePyramid(Base):
+    """
+    A lazily built, cached image pyramid.
+
+    Each level is downscaled from the previous one rather than from the base image. The 'gaussian' method
+    uses `cv2.pyrDown` and always halves the size; the 'area' method resizes by `scale_factor` with
+    `cv2.INTER_AREA`. Levels stop once either side would fall below `min_size`.
+    """
+    image: Image
+    method: str = 'area'
+    scale_factor: float = 0.5
+    min_size: tuple[int, int] = (32, 32)
+    max_levels: int = None
+
+    _levels: list[Image] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self):
+        assert self.method in PYRAMID_METHODS, f'Invalid pyramid method: {self.method}'
+        assert 0 < self.scale_factor < 1, f'Scale factor must be between 0 and 1. Got: {self.scale_factor}'
+
+        if self.method == 'gaussian':
+            self.scale_factor = 0.5
+
+        self._levels = [self.image]
+
+    def __copy__(self):
+        return ImagePyramid(self.image, self.method, self.scale_factor, self.min_size, self.max_levels)
+
+    def __getitem__(self, level: int) -> Image:
+        while len(self._levels) <= level:
+            if not self._build_next_level():
+                raise IndexError(f'Pyramid has only {len(self._levels)} levels')
+        return self._levels[level]
+
+    def __iter__(self) -> Iterator[Image]:
+        level = 0
+        while True:
+            try:
+                yield self[level]
+            except IndexError:
+                return
+            level += 1
+
+    def __len__(self):
+        while self._build_next_level():
+            pass
+        return len(self._levels)
+
+    def _next_size(self, image: Image) -> tuple[int, int]:
+        if self.method == 'gaussian':
+            return (image.width + 1) // 2, (image.height + 1) // 2
+        return int(image.width * self.scale_factor), int(image.height * self.scale_factor)
+
+    def _build_next_level(self) -> bool:
+        if self.max_levels is not None and len(self._levels) >= self.max_levels:
+            return False
+
+        previous = self._levels[-1]
+        width, height = self._next_size(previous)
+        min_width, min_height = self.min_size
+
+        if width < min_width or height < min_height:
+            return False
+
+        if self.method == 'gaussian':
+            pixels = cv2.pyrDown(previous.pixels, dstsize=(width, height))
+        else:
+            pixels = cv2.resize(previous.pixels, (width, height), interpolation=cv2.INTER_AREA)
+
+        self._levels.append(Image(
+            pixels=pixels,
+            color_space=previous.color_space,
+            name=f'{self.image.name} (level {len(self._levels)})',
+            path=self.image.path
+        ))
+        return True
+
+    def scale_of(self, level: int) -> float:
+        """
+        The effective width ratio between a level and the base image.
+        """
+        return self[level].width / self.image.width
+
+    def sliding_windows(
+            self,
+            window_size: tuple[int, int],
+            stride: int | tuple[int, int] = None
+    ) -> Iterator[PyramidWindow]:
+        """
+        Yields fixed-size windows over every level, coarse windows covering larger areas of the base image.
+        Windows are views into the level pixels, so no pixel data is copied.
+        """
+        window_width, window_height = window_size
+        stride_x, stride_y = (stride, stride) if isinstance(stride, int) else (stride or window_size)
+
+        for level, image in enumerate(self):
+            if image.width < window_width or image.height < window_height:
+                break
+
+            scale_x = image.width / self.image.width
+            scale_y = image.height / self.image.height
+
+            for y in range(0, image.height - window_height + 1, stride_y):
+                for x in range(0, image.width - window_width + 1, stride_x):
+                    view = Image(
+                        pixels=image.pixels[y:y + window_height, x:x + window_width],
+                        color_space=image.color_space,
+                        name=image.name,
+                        path=image.path
+                    )
+                    yield PyramidWindow(
+                        image=view,
+                        level=level,
+                        scale=scale_x,
+                        rect=Rectangle.from_ltrb(
+                            x / scale_x,
+                            y / scale_y,
+                            (x + window_width) / scale_x,
+                            (y + window_height) / scale_y
+                        )
+                    )
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.constants import Colors
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.models.color import Color
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+
+@dataclass
+class MosaicCompositor:
+    """
+    Lays out images on a grid inside a single preallocated canvas.
+
+    The canvas size is computed up front and each tile is written straight into its slice, resizing
+    mismatched tiles directly into the destination. Tiles are filled on a thread pool; OpenCV releases
+    the GIL while resizing, so large sheets compose in parallel.
+    """
+    columns: int
+    rows: int
+    tile_size: tuple[int, int] = None
+    padding: int = 0
+    border: int = 0
+    background: Color = field(default_factory=lambda: Colors.BLACK)
+    interpolation: int = None
+    max_workers: int = None
+
+    def __post_init__(self):
+        assert self.columns > 0 and self.rows > 0, f'Invalid grid shape: {self.columns}x{self.rows}'
+        assert self.padding >= 0 and self.border >= 0, 'Padding and border cannot be negative'
+
+    @property
+    def capacity(self) -> int:
+        return self.columns * self.rows
+
+    def canvas_shape(self, tile_width: int, tile_height: int, channels: int) -> tuple[int, int, int]:
+        width = self.columns * tile_width + (self.columns - 1) * self.padding + 2 * self.border
+        height = self.rows * tile_height + (self.rows - 1) * self.padding + 2 * self.border
+        return height, width, channels
+
+    def tile_origin(self, index: int, tile_width: int, tile_height: int) -> tuple[int, int]:
+        row, column = divmod(index, self.columns)
+        x = self.border + column * (tile_width + self.padding)
+        y = self.border + row * (tile_height + self.padding)
+        return x, y
+
+    def compose(self, images: list[Image], output_path: str = None) -> Image:
+        """
+        Composes the images row by row. The inputs are left untouched.
+
+        If `output_path` is given, the canvas is a memory-mapped `.npy` file at that path instead of an
+        in-memory array, which keeps very large contact sheets out of RAM.
+        """
+        if not images:
+            raise Exception('No images to render')
+
+        if len(images) > self.capacity:
+            raise Exception(f'Too many images. Images: {len(images)}, Grid: {self.columns}x{self.rows}')
+
+        first = images[0]
+        tile_width, tile_height = self.tile_size or (first.width, first.height)
+        channels = first.pixels.shape[2] if first.pixels.ndim == 3 else 1
+        shape = self.canvas_shape(tile_width, tile_height, channels)
+
+        if output_path:
+            canvas = np.lib.format.open_memmap(output_path, mode='w+', dtype=first.pixels.dtype, shape=shape)
+        else:
+            canvas = np.empty(shape, first.pixels.dtype)
+
+        canvas[...] = np.asarray((*self.background.bgr, 255)[:channels]).round().clip(0, 255)
+
+        def fill(index: int):
+            x, y = self.tile_origin(index, tile_width, tile_height)
+            self._write_tile(images[index].pixels, canvas[y:y + tile_height, x:x + tile_width])
+
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            list(executor.map(fill, range(len(images))))
+
+        return Image.from_numpy_array(
+            pixels=canvas if first.pixels.ndim == 3 else canvas[..., 0],
+            color_space=first.color_space if channels > 1 else ColorSpaces.GRAY,
+            path=output_path
+        )
+
+    def _write_tile(self, pixels: np.ndarray, tile: np.ndarray):
+        if pixels.ndim == 2:
+            pixels = pixels[..., None]
+
+        if pixels.shape[:2] == tile.shape[:2]:
+            tile[...] = pixels
+            return
+
+        size = tile.shape[1], tile.shape[0]
+        interpolation = cv2.INTER_AREA if self.interpolation is None else self.interpolation
+
+        if pixels.shape[2] != tile.shape[2]:
+            tile[...] = cv2.resize(pixels, size, interpolation=interpolation).reshape(*tile.shape[:2], -1)
+            return
+
+        resized = cv2.resize(pixels, size, dst=tile, interpolation=interpolation)
+
+        if not np.shares_memory(resized, tile):
+            tile[...] = resized.reshape(tile.shape)
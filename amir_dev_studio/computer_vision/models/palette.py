@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+from typing import Iterable
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.models.base import Base
+from amir_dev_studio.computer_vision.models.color import Color, hex_digits
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+# Candidate colors for distinct(): every channel in 16 steps, converted to CIELAB once.
+_candidate_steps = 16
+
+
+@lru_cache(maxsize=1)
+def _candidates() -> tuple[np.ndarray, np.ndarray]:
+    levels = np.linspace(0, 255, _candidate_steps).round().astype(np.uint8)
+    bgr = np.stack(np.meshgrid(levels, levels, levels, indexing='ij'), axis=-1).reshape(-1, 3)
+    return bgr, _to_lab(bgr)
+
+
+def _to_lab(bgr: np.ndarray) -> np.ndarray:
+    pixels = (bgr.astype(np.float32) / 255).reshape(-1, 1, 3)
+    return cv2.cvtColor(pixels, cv2.COLOR_BGR2LAB).reshape(-1, 3)
+
+
+@lru_cache(maxsize=64)
+def _distinct_colors(count: int, avoid: tuple[tuple[int, int, int], ...]) -> np.ndarray:
+    bgr, lab = _candidates()
+
+    # Greedy farthest-point sampling: each pick is the candidate farthest (in CIELAB) from every earlier
+    # pick and from the colors to avoid.
+    nearest = np.full(len(lab), np.inf)
+    for color in avoid:
+        nearest = np.minimum(nearest, np.linalg.norm(lab - _to_lab(np.array([color]))[0], axis=1))
+
+    chosen = np.empty(count, np.intp)
+    for index in range(count):
+        pick = int(np.argmax(nearest)) if np.isfinite(nearest).any() else 0
+        chosen[index] = pick
+        nearest = np.minimum(nearest, np.linalg.norm(lab - lab[pick], axis=1))
+
+    colors = bgr[chosen]
+    colors.flags.writeable = False
+    return colors
+
+
+@dataclass
+class Palette(Base):
+    """
+    A list of colors backed by an Nx3 uint8 array in b, g, r order, like Color.
+
+    Class ids map onto the palette cyclically. `lookup` colors any number of ids with one gather and
+    `colorize` turns a label mask into an image, so labels never become individual Color objects.
+    Adjustments (lighten, darken, blend) return new palettes.
+    """
+    colors: np.ndarray
+
+    _color_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        # Replacing the colors invalidates the Color objects handed out by color().
+        if name == 'colors' and (cache := self.__dict__.get('_color_cache')):
+            cache.clear()
+        super().__setattr__(name, value)
+
+    def __post_init__(self):
+        colors = np.asarray(self.colors)
+        if colors.dtype != np.uint8:
+            colors = np.clip(np.rint(colors), 0, 255).astype(np.uint8)
+        self.colors = np.ascontiguousarray(colors.reshape(-1, 3))
+
+        assert len(self.colors), 'A palette needs at least one color'
+
+    def __copy__(self):
+        return Palette(self.colors.copy())
+
+    def __getitem__(self, item) -> Color | Palette:
+        if isinstance(item, (int, np.integer)):
+            b, g, r = self.colors[item].tolist()
+            return Color(b, g, r)
+        return Palette(self.colors[item])
+
+    def __iter__(self):
+        for b, g, r in self.colors.tolist():
+            yield Color(b, g, r)
+
+    def __len__(self):
+        return len(self.colors)
+
+    def __repr__(self):
+        return f'Palette(n={len(self)})'
+
+    @classmethod
+    def distinct(cls, count: int, avoid: Iterable[Color] = None) -> Palette:
+        """
+        `count` colors that are as far apart as possible in CIELAB, and from the `avoid` colors (by
+        default black and white, the usual backgrounds). The result is deterministic and cached, and
+        each palette is a prefix of any larger one with the same `avoid` colors.
+        """
+        if avoid is None:
+            avoid = (Color(0, 0, 0), Color(255, 255, 255))
+
+        avoid = tuple(tuple(int(round(channel)) for channel in color.bgr) for color in avoid)
+        return cls(_distinct_colors(count, avoid).copy())
+
+    @classmethod
+    def from_colors(cls, colors: Iterable[Color]) -> Palette:
+        colors = list(colors)
+        values = np.fromiter(chain.from_iterable(color.bgr for color in colors), np.float64, len(colors) * 3)
+        return cls(values)
+
+    @classmethod
+    def from_hex(cls, hex_colors: Iterable[str]) -> Palette:
+        """
+        Parses hex strings in any of the forms Color.from_hex accepts. Hex strings are decoded together in
+        a single pass; other specifications (such as named colors) fall back to Color.from_hex.
+        """
+        hex_colors = list(hex_colors)
+        digits = [hex_digits(value) for value in hex_colors]
+
+        if all(digits):
+            rgb = np.frombuffer(bytes.fromhex(''.join(digits)), np.uint8).reshape(-1, 3)
+            return cls(rgb[:, ::-1])
+
+        return cls.from_colors(Color.from_hex(value) for value in hex_colors)
+
+    def color(self, class_id: int) -> Color:
+        """
+        The Color for a class id. Colors are created once per palette entry and reused, so do not modify
+        them. After editing `colors` in place, reassign it to refresh them.
+        """
+        index = int(class_id) % len(self)
+        if (color := self._color_cache.get(index)) is None:
+            color = self._color_cache[index] = self[index]
+        return color
+
+    def lookup(self, class_ids: np.ndarray) -> np.ndarray:
+        """
+        Colors for any array of class ids, shaped class_ids.shape + (3,).
+        """
+        return self.colors[np.asarray(class_ids) % len(self)]
+
+    def colorize(self, labels: np.ndarray, background: Color = None) -> np.ndarray:
+        """
+        Turns an integer label mask (such as one from rasterization.rasterize) into a BGR image. With a
+        background color, label 0 gets that color and label n gets the palette's (n - 1)th color.
+        """
+        if background is None:
+            return self.lookup(labels)
+
+        table = np.concatenate((np.array([background.bgr]).round().astype(np.uint8), self.colors))
+        labels = np.asarray(labels)
+        return table[np.where(labels > 0, (labels - 1) % len(self) + 1, 0)]
+
+    def to_colors(self) -> list[Color]:
+        return list(self)
+
+    def to_hex(self) -> list[str]:
+        digits = np.ascontiguousarray(self.colors[:, ::-1]).tobytes().hex()
+        return ['#' + digits[i:i + 6] for i in range(0, len(digits), 6)]
+
+    def blend(self, other: Palette | Color, alpha: float = 0.5) -> Palette:
+        """
+        Mixes each color with `other`: (1 - alpha) * self + alpha * other. `other` is a single Color or a
+        palette of the same length.
+        """
+        other_colors = np.array([other.bgr]) if isinstance(other, Color) else other.colors
+        return Palette(self.colors * (1 - alpha) + other_colors * alpha)
+
+    def darken(self, intensity: float) -> Palette:
+        return Palette(self.colors - intensity * 255)
+
+    def lighten(self, intensity: float) -> Palette:
+        return Palette(self.colors + intensity * 255)
@@ -1,10 +1,16 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
+from itertools import chain
 from math import dist
+from typing import Iterable
+
+import numpy as np
 
 from amir_dev_studio.computer_vision.models.base import Base
 
 
-@dataclass
+@dataclass(slots=True)
 class Point(Base):
     x: float
     y: float
@@ -57,3 +63,125 @@ class Point(Base):
 
     def is_top_right_of(self, other: 'Point') -> bool:
         return self.is_above(other) and self.is_right_of(other)
+
+
+@dataclass
+class PointArray(Base):
+    """
+    A columnar collection of points backed by an Nx2 float array.
+    """
+    coords: np.ndarray
+
+    def __post_init__(self):
+        self.coords = np.asarray(self.coords, dtype=np.float64).reshape(-1, 2)
+
+    def __copy__(self):
+        return PointArray(self.coords.copy())
+
+    def __getitem__(self, item) -> Point | PointArray:
+        if isinstance(item, (int, np.integer)):
+            x, y = self.coords[item].tolist()
+            return Point(x, y)
+        return PointArray(self.coords[item])
+
+    def __iter__(self):
+        for x, y in self.coords.tolist():
+            yield Point(x, y)
+
+    def __len__(self):
+        return len(self.coords)
+
+    def __repr__(self):
+        return f'PointArray(n={len(self)})'
+
+    @property
+    def quadrant(self) -> np.ndarray:
+        x, y = self.x, self.y
+        return np.select(
+            [(x > 0) & (y > 0), x > 0, (x < 0) & (y > 0), x < 0],
+            [1, 4, 2, 3],
+            default=0
+        )
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.coords[:, 0]
+
+    @property
+    def xy_ints(self) -> np.ndarray:
+        return self.coords.astype(np.int32)
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.coords[:, 1]
+
+    @classmethod
+    def empty(cls) -> PointArray:
+        return cls(np.empty((0, 2), np.float64))
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point]) -> PointArray:
+        if isinstance(points, PointArray):
+            return points.copy()
+
+        points = list(points)
+        coords = np.fromiter(
+            chain.from_iterable((point.x, point.y) for point in points),
+            dtype=np.float64,
+            count=len(points) * 2
+        )
+        return cls(coords)
+
+    @classmethod
+    def from_xy(cls, x: np.ndarray, y: np.ndarray) -> PointArray:
+        return cls(np.column_stack((x, y)))
+
+    def to_points(self) -> list[Point]:
+        return list(self)
+
+    def translate(self, x: float | np.ndarray = 0, y: float | np.ndarray = 0) -> PointArray:
+        return PointArray(self.coords + np.stack(np.broadcast_arrays(x, y), axis=-1))
+
+    def distance_from(self, other: Point | PointArray) -> np.ndarray:
+        """
+        Row-wise distances to a single point, or to the matching row of another array.
+        """
+        return np.hypot(*(self.coords - _as_coords(other)).T)
+
+    def distance_matrix(self, other: Point | PointArray = None) -> np.ndarray:
+        """
+        All-pairs (cdist-style) distances, shaped (len(self), len(other)).
+        """
+        other_coords = self.coords if other is None else _as_coords(other).reshape(-1, 2)
+        deltas = self.coords[:, None, :] - other_coords[None, :, :]
+        return np.hypot(deltas[..., 0], deltas[..., 1])
+
+    def is_above(self, other: Point | PointArray) -> np.ndarray:
+        return self.y < _as_coords(other)[..., 1]
+
+    def is_below(self, other: Point | PointArray) -> np.ndarray:
+        return self.y > _as_coords(other)[..., 1]
+
+    def is_left_of(self, other: Point | PointArray) -> np.ndarray:
+        return self.x < _as_coords(other)[..., 0]
+
+    def is_right_of(self, other: Point | PointArray) -> np.ndarray:
+        return self.x > _as_coords(other)[..., 0]
+
+    def is_bottom_left_of(self, other: Point | PointArray) -> np.ndarray:
+        return self.is_below(other) & self.is_left_of(other)
+
+    def is_bottom_right_of(self, other: Point | PointArray) -> np.ndarray:
+        return self.is_below(other) & self.is_right_of(other)
+
+    def is_top_left_of(self, other: Point | PointArray) -> np.ndarray:
+        return self.is_above(other) & self.is_left_of(other)
+
+    def is_top_right_of(self, other: Point | PointArray) -> np.ndarray:
+        return self.is_above(other) & self.is_right_of(other)
+
+
+def _as_coords(other: Point | PointArray) -> np.ndarray:
+    if isinstance(other, PointArray):
+        return other.coords
+    return np.array(other.xy, dtype=np.float64)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.models.drawable.circle import Circle
+from amir_dev_studio.computer_vision.models.drawable.line import Line
+from amir_dev_studio.computer_vision.models.drawable.rectangle import BoxArray, Rectangle
+from amir_dev_studio.computer_vision.models.point import PointArray
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+Shape = Union[Circle, Line, Rectangle]
+
+
+def _fill_boxes(mask: np.ndarray, boxes: BoxArray):
+    """
+    Marks every pixel covered by any box with one cumulative sum, whatever the number of boxes. Corners
+    are inclusive and truncated to ints, like cv2.rectangle.
+    """
+    height, width = mask.shape
+    ltrb = boxes.ltrb.astype(np.int64)
+    left, top = np.clip(ltrb[:, 0], 0, width), np.clip(ltrb[:, 1], 0, height)
+    right, bottom = np.clip(ltrb[:, 2] + 1, 0, width), np.clip(ltrb[:, 3] + 1, 0, height)
+    visible = (left < right) & (top < bottom)
+    left, top, right, bottom = left[visible], top[visible], right[visible], bottom[visible]
+
+    deltas = np.zeros((height + 1, width + 1), np.int32)
+    np.add.at(deltas, (top, left), 1)
+    np.add.at(deltas, (top, right), -1)
+    np.add.at(deltas, (bottom, left), -1)
+    np.add.at(deltas, (bottom, right), 1)
+
+    coverage = deltas.cumsum(axis=0).cumsum(axis=1)[:height, :width]
+    mask[coverage > 0] = 1
+
+
+def _draw(mask: np.ndarray, shape: Shape, value: int, thickness: int, line_thickness: int):
+    if isinstance(shape, Rectangle):
+        cv2.rectangle(mask, shape.top_left.xy_ints, shape.bottom_right.xy_ints, value, thickness)
+    elif isinstance(shape, Circle):
+        cv2.circle(mask, shape.center.xy_ints, int(shape.radius), value, thickness)
+    elif isinstance(shape, Line):
+        cv2.line(mask, shape.pt1.xy_ints, shape.pt2.xy_ints, value, line_thickness)
+    else:
+        raise TypeError(f'Cannot rasterize {type(shape).__name__}')
+
+
+def rasterize(
+        shapes: Sequence[Shape],
+        size: tuple[int, int],
+        labels: Sequence[int] = None,
+        thickness: int = -1,
+        line_thickness: int = 1
+) -> np.ndarray:
+    """
+    Renders shapes into a (height, width) mask for an image of the given (width, height).
+
+    Without labels the result is a boolean union of all shapes. With labels it is an int32 label map
+    where 0 is background and later shapes paint over earlier ones. Rectangles and circles are filled
+    unless `thickness` is positive; lines are drawn `line_thickness` pixels wide. Pixel coverage matches
+    drawing the same shapes with OpenCV.
+    """
+    width, height = size
+
+    if labels is not None:
+        assert len(labels) == len(shapes), f'Got {len(labels)} labels for {len(shapes)} shapes'
+
+        mask = np.zeros((height, width), np.int32)
+        for shape, label in zip(shapes, labels):
+            _draw(mask, shape, int(label), thickness, line_thickness)
+        return mask
+
+    mask = np.zeros((height, width), np.uint8)
+    rectangles = [shape for shape in shapes if isinstance(shape, Rectangle)]
+    lines = [shape for shape in shapes if isinstance(shape, Line)]
+
+    fill_boxes = thickness < 0
+
+    if rectangles and fill_boxes:
+        _fill_boxes(mask, BoxArray.from_rectangles(rectangles))
+
+    if lines:
+        segments = np.array([(line.pt1.xy_ints, line.pt2.xy_ints) for line in lines], dtype=np.int32)
+        cv2.polylines(mask, list(segments), False, 1, line_thickness)
+
+    for shape in shapes:
+        if isinstance(shape, Circle) or (isinstance(shape, Rectangle) and not fill_boxes):
+            _draw(mask, shape, 1, thickness, line_thickness)
+        elif not isinstance(shape, (Line, Rectangle)):
+            raise TypeError(f'Cannot rasterize {type(shape).__name__}')
+
+    return mask.view(bool)
+
+
+def contains_matrix(shapes: Sequence[Shape], points: PointArray, line_tolerance: float = 0.5) -> np.ndarray:
+    """
+    Hit-test matrix where [i, j] is True if shape i contains point j. Rectangles and circles include
+    their edges; a point hits a line within `line_tolerance` of it. Each kind of shape is tested in a
+    single broadcast, so the cost does not grow with Python-level loops over points.
+    """
+    hits = np.zeros((len(shapes), len(points)), bool)
+    kinds = {Rectangle: [], Circle: [], Line: []}
+
+    for index, shape in enumerate(shapes):
+        kind = next((kind for kind in kinds if isinstance(shape, kind)), None)
+        if kind is None:
+            raise TypeError(f'Cannot hit-test {type(shape).__name__}')
+        kinds[kind].append(index)
+
+    if indices := kinds[Rectangle]:
+        hits[indices] = BoxArray.from_rectangles([shapes[i] for i in indices]).contains_points(points)
+
+    if indices := kinds[Circle]:
+        centers = PointArray.from_points([shapes[i].center for i in indices])
+        radii = np.array([shapes[i].radius for i in indices], dtype=np.float64)
+        hits[indices] = centers.distance_matrix(points) <= radii[:, None]
+
+    if indices := kinds[Line]:
+        starts = np.array([shapes[i].pt1.xy for i in indices], dtype=np.float64)
+        segments = np.array([shapes[i].pt2.xy for i in indices], dtype=np.float64) - starts
+        lengths_squared = np.einsum('ij,ij->i', segments, segments)
+
+        offsets = points.coords[None, :, :] - starts[:, None, :]
+        projections = np.einsum('lpj,lj->lp', offsets, segments)
+        lengths_squared = np.broadcast_to(lengths_squared[:, None], projections.shape)
+        t = np.divide(projections, lengths_squared, out=np.zeros_like(projections), where=lengths_squared > 0)
+        t = np.clip(t, 0, 1)
+        nearest = offsets - t[..., None] * segments[:, None, :]
+        hits[indices] = np.hypot(nearest[..., 0], nearest[..., 1]) <= line_tolerance
+
+    return hits
+
+
+def hit_test(shapes: Sequence[Shape], points: PointArray, line_tolerance: float = 0.5) -> np.ndarray:
+    """
+    Index of the topmost (last) shape containing each point, or -1 where no shape does.
+    """
+    hits = contains_matrix(shapes, points, line_tolerance)
+    if not len(shapes):
+        return np.full(len(points), -1)
+
+    topmost = len(shapes) - 1 - np.argmax(hits[::-1], axis=0)
+    return np.where(hits.any(axis=0), topmost, -1)
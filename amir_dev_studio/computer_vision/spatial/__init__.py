@@ -0,0 +1,8 @@
+from amir_dev_studio.computer_vision.spatial.index import (
+    GridIndex
+)
+
+from amir_dev_studio.computer_vision.spatial.nms import (
+    non_maximum_suppression,
+    soft_non_maximum_suppression
+)
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from math import floor
+from typing import Iterable
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.models.drawable.rectangle import BoxArray, Rectangle
+from amir_dev_studio.computer_vision.models.point import Point
+
+_max_cells_per_box = 4
+
+
+class GridIndex:
+    """
+    A bulk-loaded uniform grid over a set of rectangles.
+
+    Every box is registered in each cell it overlaps. Cells are stored row-major in a CSR layout,
+    so the cells of one grid row within a query window are a single contiguous slice.
+    """
+
+    def __init__(self, boxes: BoxArray | Iterable[Rectangle], cell_size: float = None):
+        self.boxes = boxes if isinstance(boxes, BoxArray) else BoxArray.from_rectangles(boxes)
+
+        ltrb = self.boxes.ltrb
+        self.origin = ltrb[:, :2].min(axis=0) if len(ltrb) else np.zeros(2)
+        extent = ltrb[:, 2:].max(axis=0) - self.origin if len(ltrb) else np.ones(2)
+
+        if cell_size is None:
+            cell_size = float(np.median(np.maximum(self.boxes.widths, self.boxes.heights))) if len(ltrb) else 1.0
+
+        # Keep the grid proportional to the number of boxes so that sparse, far-apart boxes
+        # do not allocate a huge number of empty cells.
+        min_cell_size = np.sqrt(extent[0] * extent[1] / max(_max_cells_per_box * len(ltrb), 1))
+        self.cell_size = max(cell_size, min_cell_size, np.finfo(np.float64).eps)
+
+        self.columns, self.rows = (np.floor(extent / self.cell_size).astype(np.int64) + 1).tolist()
+        self._build()
+
+    def __len__(self):
+        return len(self.boxes)
+
+    def __repr__(self):
+        return f'GridIndex(n={len(self)}, grid={self.columns}x{self.rows}, cell_size={self.cell_size:g})'
+
+    def _build(self):
+        cells = self._cell_ranges(self.boxes.ltrb)
+        column_counts = cells[:, 2] - cells[:, 0] + 1
+        counts = column_counts * (cells[:, 3] - cells[:, 1] + 1)
+
+        box_ids = np.repeat(np.arange(len(self.boxes)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cell_x = cells[box_ids, 0] + offsets % column_counts[box_ids]
+        cell_y = cells[box_ids, 1] + offsets // column_counts[box_ids]
+        cell_ids = cell_y * self.columns + cell_x
+
+        order = np.argsort(cell_ids, kind='stable')
+        self._cell_box_ids = box_ids[order]
+        self._cell_starts = np.searchsorted(cell_ids[order], np.arange(self.columns * self.rows + 1))
+
+    def _cell_ranges(self, ltrb: np.ndarray) -> np.ndarray:
+        cells = np.floor((ltrb - np.tile(self.origin, 2)) / self.cell_size).astype(np.int64)
+        cells[:, [0, 2]] = np.clip(cells[:, [0, 2]], 0, self.columns - 1)
+        cells[:, [1, 3]] = np.clip(cells[:, [1, 3]], 0, self.rows - 1)
+        return cells
+
+    def _candidates(self, left: float, top: float, right: float, bottom: float) -> np.ndarray:
+        cells = self._cell_ranges(np.array([[left, top, right, bottom]], dtype=np.float64))
+        return self._candidates_in_cells(*cells[0].tolist())
+
+    def _candidates_in_cells(self, x0: int, y0: int, x1: int, y1: int) -> np.ndarray:
+        x0, x1 = min(max(x0, 0), self.columns - 1), min(max(x1, 0), self.columns - 1)
+        y0, y1 = min(max(y0, 0), self.rows - 1), min(max(y1, 0), self.rows - 1)
+        slices = [
+            self._cell_box_ids[self._cell_starts[y * self.columns + x0]:self._cell_starts[y * self.columns + x1 + 1]]
+            for y in range(y0, y1 + 1)
+        ]
+        return np.unique(np.concatenate(slices))
+
+    def query_containing(self, rect: Rectangle) -> np.ndarray:
+        """
+        Indices of boxes that fully contain the given rectangle.
+        """
+        candidates = self._candidates(rect.left, rect.top, rect.left, rect.top)
+        ltrb = self.boxes.ltrb[candidates]
+        mask = (
+            (ltrb[:, 0] <= rect.left) & (ltrb[:, 1] <= rect.top) &
+            (ltrb[:, 2] >= rect.right) & (ltrb[:, 3] >= rect.bottom)
+        )
+        return candidates[mask]
+
+    def query_contained(self, rect: Rectangle) -> np.ndarray:
+        """
+        Indices of boxes that lie fully inside the given rectangle.
+        """
+        candidates = self._candidates(rect.left, rect.top, rect.right, rect.bottom)
+        ltrb = self.boxes.ltrb[candidates]
+        mask = (
+            (ltrb[:, 0] >= rect.left) & (ltrb[:, 1] >= rect.top) &
+            (ltrb[:, 2] <= rect.right) & (ltrb[:, 3] <= rect.bottom)
+        )
+        return candidates[mask]
+
+    def query_overlapping(self, rect: Rectangle) -> np.ndarray:
+        """
+        Indices of boxes whose intersection with the given rectangle has a non-zero area.
+        """
+        candidates = self._candidates(rect.left, rect.top, rect.right, rect.bottom)
+        ltrb = self.boxes.ltrb[candidates]
+        mask = (
+            (ltrb[:, 0] < rect.right) & (ltrb[:, 2] > rect.left) &
+            (ltrb[:, 1] < rect.bottom) & (ltrb[:, 3] > rect.top)
+        )
+        return candidates[mask]
+
+    def nearest(self, point: Point, k: int = 1) -> np.ndarray:
+        """
+        Indices of the k boxes closest to the given point, nearest first. Boxes containing the point have
+        a distance of zero.
+
+        The search expands ring by ring from the point's cell and stops as soon as no unvisited cell can
+        hold a box closer than the current k-th candidate.
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, np.int64)
+
+        x, y = point.xy
+        center_x = floor((x - self.origin[0]) / self.cell_size)
+        center_y = floor((y - self.origin[1]) / self.cell_size)
+        ring = 0
+
+        while True:
+            left = self.origin[0] + (center_x - ring) * self.cell_size
+            top = self.origin[1] + (center_y - ring) * self.cell_size
+            right = self.origin[0] + (center_x + ring + 1) * self.cell_size
+            bottom = self.origin[1] + (center_y + ring + 1) * self.cell_size
+            covers_grid = (
+                center_x - ring <= 0 and center_y - ring <= 0 and
+                center_x + ring >= self.columns - 1 and center_y + ring >= self.rows - 1
+            )
+
+            candidates = self._candidates_in_cells(
+                center_x - ring,
+                center_y - ring,
+                center_x + ring,
+                center_y + ring
+            )
+
+            if len(candidates) >= k:
+                distances = self.distances_from(point, candidates)
+                order = np.argsort(distances, kind='stable')[:k]
+                searched_radius = max(0.0, min(x - left, right - x, y - top, bottom - y))
+
+                if covers_grid or distances[order[-1]] <= searched_radius:
+                    return candidates[order]
+
+            elif covers_grid:
+                return candidates
+
+            ring += 1
+
+    def distances_from(self, point: Point, indices: np.ndarray = None) -> np.ndarray:
+        ltrb = self.boxes.ltrb if indices is None else self.boxes.ltrb[indices]
+        dx = np.maximum(np.maximum(ltrb[:, 0] - point.x, point.x - ltrb[:, 2]), 0)
+        dy = np.maximum(np.maximum(ltrb[:, 1] - point.y, point.y - ltrb[:, 3]), 0)
+        return np.hypot(dx, dy)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.models.drawable.rectangle import BoxArray, Rectangle
+
+
+def _as_box_array(boxes: BoxArray | Iterable[Rectangle]) -> BoxArray:
+    return boxes if isinstance(boxes, BoxArray) else BoxArray.from_rectangles(boxes)
+
+
+def _offset_by_class(boxes: BoxArray, class_ids: np.ndarray) -> np.ndarray:
+    # Shifting every class into its own disjoint region lets a single pass suppress per class.
+    span = boxes.ltrb.max() - boxes.ltrb.min() + 1 if len(boxes) else 0
+    return boxes.ltrb + (np.asarray(class_ids, dtype=np.float64) * span)[:, None]
+
+
+def _ious_against(ltrb: np.ndarray, areas: np.ndarray, index: int, others: np.ndarray) -> np.ndarray:
+    top_left = np.maximum(ltrb[index, :2], ltrb[others, :2])
+    bottom_right = np.minimum(ltrb[index, 2:], ltrb[others, 2:])
+    sizes = np.clip(bottom_right - top_left, 0, None)
+    intersections = sizes[:, 0] * sizes[:, 1]
+    unions = areas[index] + areas[others] - intersections
+    return np.divide(intersections, unions, out=np.zeros_like(intersections), where=unions > 0)
+
+
+def non_maximum_suppression(
+        boxes: BoxArray | Iterable[Rectangle],
+        scores: np.ndarray,
+        iou_threshold: float = 0.5,
+        score_threshold: float = None,
+        class_ids: np.ndarray = None
+) -> np.ndarray:
+    """
+    Greedy NMS. Returns the indices of the kept boxes, sorted by descending score.
+    """
+    boxes = _as_box_array(boxes)
+    scores = np.asarray(scores, dtype=np.float64)
+    assert len(boxes) == len(scores), f'Got {len(boxes)} boxes but {len(scores)} scores'
+
+    ltrb = boxes.ltrb if class_ids is None else _offset_by_class(boxes, class_ids)
+    areas = boxes.areas
+    order = np.argsort(-scores, kind='stable')
+
+    if score_threshold is not None:
+        order = order[scores[order] >= score_threshold]
+
+    keep = []
+    while len(order):
+        index = order[0]
+        keep.append(index)
+        order = order[1:][_ious_against(ltrb, areas, index, order[1:]) <= iou_threshold]
+
+    return np.array(keep, dtype=np.int64)
+
+
+def soft_non_maximum_suppression(
+        boxes: BoxArray | Iterable[Rectangle],
+        scores: np.ndarray,
+        sigma: float = 0.5,
+        iou_threshold: float = 0.3,
+        score_threshold: float = 0.001,
+        method: str = 'gaussian',
+        class_ids: np.ndarray = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Soft-NMS (Bodla et al.). Overlapping boxes have their scores decayed instead of being dropped.
+
+    `method` is either 'gaussian' or 'linear'. Returns the kept indices and their decayed scores,
+    sorted by descending decayed score.
+    """
+    assert method in {'gaussian', 'linear'}, f'Invalid soft-NMS method: {method}'
+
+    boxes = _as_box_array(boxes)
+    scores = np.asarray(scores, dtype=np.float64).copy()
+    assert len(boxes) == len(scores), f'Got {len(boxes)} boxes but {len(scores)} scores'
+
+    ltrb = boxes.ltrb if class_ids is None else _offset_by_class(boxes, class_ids)
+    areas = boxes.areas
+    remaining = np.flatnonzero(scores >= score_threshold)
+
+    keep = []
+    while len(remaining):
+        best = np.argmax(scores[remaining])
+        index = remaining[best]
+        keep.append(index)
+        remaining = np.delete(remaining, best)
+
+        ious = _ious_against(ltrb, areas, index, remaining)
+        if method == 'gaussian':
+            scores[remaining] *= np.exp(-(ious ** 2) / sigma)
+        else:
+            scores[remaining] *= np.where(ious > iou_threshold, 1 - ious, 1)
+
+        remaining = remaining[scores[remaining] >= score_threshold]
+
+    keep = np.array(keep, dtype=np.int64)
+    return keep, scores[keep]
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Iterator
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.io import raw_store
+from amir_dev_studio.computer_vision.models.image import Image
+
+
+@dataclass(frozen=True)
+class Tile:
+    """
+    One cell of a tiling. The core (top, left, bottom, right) is the region of the output this tile is
+    responsible for; the read region adds up to `halo` pixels of context on every side, clamped to the
+    image bounds.
+    """
+    row: int
+    column: int
+    top: int
+    left: int
+    bottom: int
+    right: int
+    read_top: int
+    read_left: int
+    read_bottom: int
+    read_right: int
+
+    @property
+    def core_slices(self) -> tuple[slice, slice]:
+        return slice(self.top, self.bottom), slice(self.left, self.right)
+
+    @property
+    def inner_slices(self) -> tuple[slice, slice]:
+        """
+        The core, relative to the read region.
+        """
+        top, left = self.top - self.read_top, self.left - self.read_left
+        return slice(top, top + self.bottom - self.top), slice(left, left + self.right - self.left)
+
+    @property
+    def read_slices(self) -> tuple[slice, slice]:
+        return slice(self.read_top, self.read_bottom), slice(self.read_left, self.read_right)
+
+
+def iter_tiles(height: int, width: int, tile_size: int | tuple[int, int], halo: int = 0) -> Iterator[Tile]:
+    tile_width, tile_height = (tile_size, tile_size) if isinstance(tile_size, int) else tile_size
+    assert tile_width > 0 and tile_height > 0, f'Invalid tile size: {tile_size}'
+    assert halo >= 0, f'Halo must not be negative. Got: {halo}'
+
+    for row, top in enumerate(range(0, height, tile_height)):
+        bottom = min(top + tile_height, height)
+
+        for column, left in enumerate(range(0, width, tile_width)):
+            right = min(left + tile_width, width)
+
+            yield Tile(
+                row, column, top, left, bottom, right,
+                max(top - halo, 0), max(left - halo, 0), min(bottom + halo, height), min(right + halo, width)
+            )
+
+
+def _process_tile(function: Callable[[np.ndarray], np.ndarray], pixels: np.ndarray, inner: tuple) -> np.ndarray:
+    # Runs in the worker; cropping there keeps the halo out of the result sent back.
+    return np.ascontiguousarray(function(pixels)[inner])
+
+
+class TiledProcessor:
+    """
+    Applies a per-tile function to images too large to process as a whole.
+
+    The source is cut into `tile_size` tiles, each read with `halo` extra pixels of context so that
+    neighbourhood operations see the same data they would on the full image. A Gaussian blur with an
+    n x n kernel, for example, needs a halo of n // 2 to be bit-identical to the whole-image result.
+    `function` must return an array with the same height and width as its input; its channels and dtype
+    may differ.
+
+    At most `max_in_flight` tiles are read, being processed or waiting to be written at any time, so
+    memory use depends on the tile size and the pool size, not on the image. Sources can be memory-mapped
+    (see Image.from_mmap) and the output can be written straight to a raw image file. With processes,
+    `function` and its inputs must be picklable; threads suit functions that release the GIL, as most
+    OpenCV calls do.
+    """
+
+    def __init__(
+            self,
+            tile_size: int | tuple[int, int] = 1024,
+            halo: int = 0,
+            max_workers: int = None,
+            max_in_flight: int = None,
+            use_processes: bool = True
+    ):
+        self.tile_size = tile_size
+        self.halo = halo
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.use_processes = use_processes
+
+    def _executor(self) -> Executor:
+        if self.use_processes:
+            return ProcessPoolExecutor(self.max_workers)
+        return ThreadPoolExecutor(self.max_workers)
+
+    def tiles(self, height: int, width: int) -> list[Tile]:
+        return list(iter_tiles(height, width, self.tile_size, self.halo))
+
+    def process(
+            self,
+            pixels: np.ndarray,
+            function: Callable[[np.ndarray], np.ndarray],
+            output: np.ndarray = None,
+            allocate: Callable[[tuple[int, ...], np.dtype], np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Returns the stitched result. It is written into `output` when given; otherwise the output is
+        allocated once the first tile finishes, with `allocate(shape, dtype)` if provided.
+        """
+        height, width = pixels.shape[:2]
+        assert height > 0 and width > 0, f'Cannot tile an empty image of shape {pixels.shape}'
+
+        tiles = iter_tiles(height, width, self.tile_size, self.halo)
+        max_in_flight = self.max_in_flight or 2 * (self.max_workers or os.cpu_count() or 1)
+
+        with self._executor() as executor:
+            pending = {}
+
+            def submit(tile: Tile):
+                region = np.ascontiguousarray(pixels[tile.read_slices])
+                pending[executor.submit(_process_tile, function, region, tile.inner_slices)] = tile
+
+            for tile in islice(tiles, max_in_flight):
+                submit(tile)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    tile = pending.pop(future)
+                    result = future.result()
+
+                    assert result.shape[:2] == (tile.bottom - tile.top, tile.right - tile.left), (
+                        f'The tile function changed the tile size from {pixels[tile.read_slices].shape[:2]} '
+                        f'to {result.shape[:2]}'
+                    )
+
+                    if output is None:
+                        shape = (height, width) + result.shape[2:]
+                        output = (allocate or np.empty)(shape, result.dtype)
+
+                    output[tile.core_slices] = result
+
+                    if (tile := next(tiles, None)) is not None:
+                        submit(tile)
+
+        if isinstance(output, np.memmap):
+            output.flush()
+
+        return output
+
+    def process_image(
+            self,
+            image: Image,
+            function: Callable[[np.ndarray], np.ndarray],
+            output_path: str = None,
+            color_space: ColorSpaces = None
+    ) -> Image:
+        """
+        Processes an image tile by tile. With `output_path`, the result is written to a raw image file
+        (see Image.save_mmap) as tiles complete and the returned image is memory-mapped from it. Pass
+        `color_space` when the function changes it.
+        """
+        color_space = color_space or image.color_space
+
+        if output_path is None:
+            pixels = self.process(image.pixels, function)
+            return Image.from_numpy_array(pixels, color_space, name=image.name, path=image.path)
+
+        def allocate(shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+            return raw_store.create_raw(output_path, shape, dtype, color_space, image.name)
+
+        self.process(image.pixels, function, allocate=allocate)
+        return Image.from_mmap(output_path)
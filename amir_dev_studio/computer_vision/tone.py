@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+
+from amir_dev_studio.lazy_imports import lazy_import
+
+cv2 = lazy_import('cv2')
+
+_ramp = np.arange(256, dtype=np.uint8)
+_lut_cache_size = 512
+
+
+def _read_only(lut: np.ndarray) -> np.ndarray:
+    lut.flags.writeable = False
+    return lut
+
+
+def brightness_coefficients(value: float) -> tuple[float, float]:
+    if value > 0:
+        shadow = value
+        max_ = 255
+
+    else:
+        shadow = 0
+        max_ = 255 + value
+
+    alpha = (max_ - shadow) / 255
+    gamma = shadow
+
+    return alpha, gamma
+
+
+def contrast_coefficients(value: float) -> tuple[float, float]:
+    alpha = float(131 * (value + 127)) / (127 * (131 - value))
+    gamma = 127 * (1 - alpha)
+
+    return alpha, gamma
+
+
+@lru_cache(maxsize=_lut_cache_size)
+def affine_lut(alpha: float, gamma: float) -> np.ndarray:
+    # Evaluated with cv2.addWeighted itself so the table reproduces its rounding and saturation exactly.
+    return _read_only(cv2.addWeighted(_ramp, alpha, _ramp, 0, gamma).reshape(256))
+
+
+def brightness_lut(value: float) -> np.ndarray:
+    return affine_lut(*brightness_coefficients(value))
+
+
+def contrast_lut(value: float) -> np.ndarray:
+    return affine_lut(*contrast_coefficients(value))
+
+
+@lru_cache(maxsize=_lut_cache_size)
+def gamma_lut(gamma: float) -> np.ndarray:
+    assert gamma > 0, f'Gamma must be positive. Got: {gamma}'
+    return _read_only(np.rint(((_ramp / 255) ** (1 / gamma)) * 255).astype(np.uint8))
+
+
+@lru_cache(maxsize=_lut_cache_size)
+def levels_lut(
+        in_black: int = 0,
+        in_white: int = 255,
+        gamma: float = 1.0,
+        out_black: int = 0,
+        out_white: int = 255
+) -> np.ndarray:
+    assert in_black < in_white, f'Input black point must be below the white point. Got: {in_black}, {in_white}'
+    assert gamma > 0, f'Gamma must be positive. Got: {gamma}'
+
+    normalized = np.clip((_ramp.astype(np.float64) - in_black) / (in_white - in_black), 0, 1)
+    normalized **= 1 / gamma
+    return _read_only(np.rint(out_black + normalized * (out_white - out_black)).clip(0, 255).astype(np.uint8))
+
+
+@lru_cache(maxsize=_lut_cache_size)
+def curve_lut(control_points: tuple[tuple[float, float], ...]) -> np.ndarray:
+    """
+    Piecewise-linear curve through (input, output) control points, clamped outside the first and last point.
+    """
+    assert len(control_points) >= 2, 'A curve needs at least two control points'
+
+    xs, ys = zip(*sorted(control_points))
+    return _read_only(np.rint(np.interp(_ramp, xs, ys)).clip(0, 255).astype(np.uint8))
+
+
+@lru_cache(maxsize=_lut_cache_size)
+def gain_lut(gain: float) -> np.ndarray:
+    return _read_only(np.rint(_ramp * gain).clip(0, 255).astype(np.uint8))
+
+
+def compose_luts(*luts: np.ndarray) -> np.ndarray:
+    """
+    Composes lookup tables left to right, so the result applies the first table, then the second, and so on.
+
+    Single-channel tables have shape (256,); per-channel tables have shape (256, channels). Mixing the two
+    broadcasts the single-channel tables across every channel.
+    """
+    composed = _ramp
+    for lut in luts:
+        if lut.ndim == 1:
+            composed = lut[composed]
+        elif composed.ndim == 1:
+            composed = np.take_along_axis(lut, np.repeat(composed[:, None], lut.shape[1], axis=1), axis=0)
+        else:
+            composed = np.take_along_axis(lut, composed, axis=0)
+
+    return composed.copy()
+
+
+@dataclass
+class ToneMap:
+    """
+    A chain of tone adjustments collapsed into a single lookup table.
+
+    Adjustments are applied in the order they are added. The composed table is cached until the chain
+    changes, so applying the same map to a stream of frames costs one `cv2.LUT` call per frame.
+    """
+    luts: list[np.ndarray] = field(default_factory=list)
+
+    _lut: np.ndarray = field(default=None, init=False, repr=False)
+
+    def __copy__(self):
+        return ToneMap(self.luts.copy())
+
+    def copy(self):
+        return self.__copy__()
+
+    def _add(self, lut: np.ndarray) -> ToneMap:
+        self.luts.append(lut)
+        self._lut = None
+        return self
+
+    @property
+    def lut(self) -> np.ndarray:
+        if self._lut is None:
+            self._lut = compose_luts(*self.luts)
+        return self._lut
+
+    def brightness(self, value: float) -> ToneMap:
+        return self._add(brightness_lut(value))
+
+    def contrast(self, value: float) -> ToneMap:
+        return self._add(contrast_lut(value))
+
+    def curve(self, *control_points: tuple[float, float]) -> ToneMap:
+        return self._add(curve_lut(tuple(control_points)))
+
+    def gamma(self, gamma: float) -> ToneMap:
+        return self._add(gamma_lut(gamma))
+
+    def levels(
+            self,
+            in_black: int = 0,
+            in_white: int = 255,
+            gamma: float = 1.0,
+            out_black: int = 0,
+            out_white: int = 255
+    ) -> ToneMap:
+        return self._add(levels_lut(in_black, in_white, gamma, out_black, out_white))
+
+    def lookup(self, lut: np.ndarray) -> ToneMap:
+        return self._add(np.asarray(lut, dtype=np.uint8))
+
+    def white_balance(self, *gains: float) -> ToneMap:
+        """
+        Scales each channel by its own gain, in the channel order of the image (b, g, r for BGR images).
+        """
+        return self._add(np.stack([gain_lut(gain) for gain in gains], axis=1))
+
+    def apply(self, pixels: np.ndarray, dst: np.ndarray = None) -> np.ndarray:
+        assert pixels.dtype == np.uint8, f'Tone maps only apply to uint8 pixels. Got: {pixels.dtype}'
+
+        lut = self.lut
+        if lut.ndim == 1:
+            return cv2.LUT(pixels, lut, dst=dst)
+
+        channels = pixels.shape[2] if pixels.ndim == 3 else 1
+        assert lut.shape[1] == channels, f'Tone map has {lut.shape[1]} channels but the image has {channels}'
+        return cv2.LUT(pixels, lut.reshape(1, 256, channels), dst=dst)
@@ -0,0 +1,42 @@
+import importlib
+import importlib.util
+import sys
+from threading import RLock
+from types import ModuleType
+
+_lock = RLock()
+
+
+class _LazyModule(ModuleType):
+    """
+    Stands in for a module until one of its attributes is first accessed, then imports it.
+
+    The import happens under a lock and the module is fully executed before any attribute is returned, so
+    threads that reach it at the same time all wait for the same, complete import. Afterwards the module's
+    namespace is copied onto the proxy so later lookups do not go through __getattr__.
+    """
+
+    def __getattr__(self, attribute: str):
+        with _lock:
+            module = importlib.import_module(self.__name__)
+            self.__dict__.update(module.__dict__)
+
+        return getattr(module, attribute)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Returns a module that is only executed when one of its attributes is first accessed.
+
+    Heavy optional dependencies (cv2, matplotlib) are bound at module level with this instead of `import`,
+    so importing a module that merely might use them costs nothing until it actually does. A module that
+    has already been imported is returned as is.
+    """
+    with _lock:
+        if (module := sys.modules.get(name)) is not None:
+            return module
+
+        if importlib.util.find_spec(name) is None:
+            raise ImportError(f'No module named {name!r}', name=name)
+
+        return _LazyModule(name)
@@ -0,0 +1,75 @@
+from unittest import TestCase
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.buffer_pool import BufferPool
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.models.drawable.rectangle import Rectangle
+from amir_dev_studio.computer_vision.models.image import Image
+
+
+def _process(image: Image) -> Image:
+    image.apply_brightness(20)
+    image.apply_contrast(15)
+    image.apply_gaussian_blur(5)
+    image.scale(0.5)
+    image.apply_gamma(1.4)
+    image.apply_color_space_conversion(ColorSpaces.GRAY)
+    return image
+
+
+class TestBufferPool(TestCase):
+    def setUp(self):
+        self.frames = [
+            np.random.default_rng(i).integers(0, 255, (64, 80, 3), np.uint8)
+            for i in range(5)
+        ]
+
+    def test_pooled_operations_match_and_recycle(self):
+        pool = BufferPool()
+
+        for pixels in self.frames:
+            expected = _process(Image.from_numpy_array(pixels, ColorSpaces.BGR))
+            actual = _process(Image.from_numpy_array(pixels, ColorSpaces.BGR, buffer_pool=pool))
+
+            np.testing.assert_array_equal(actual.pixels, expected.pixels)
+            assert not np.shares_memory(actual.pixels, pixels)
+            actual.release()
+
+        assert pool.outstanding_bytes == 0
+        assert pool.misses == 5
+        assert pool.hits == 5 * 6 - 5
+        assert pool.peak_bytes == 2 * 64 * 80 * 3 + 2 * 32 * 40 * 3 + 32 * 40
+
+    def test_referenced_buffers_are_not_recycled(self):
+        pool = BufferPool()
+        image = Image.from_numpy_array(self.frames[0], ColorSpaces.BGR, buffer_pool=pool)
+        image.apply_brightness(10)
+
+        held = image.pixels
+        view = image.view(Rectangle.from_ltrb(0, 0, 40, 40))
+        as_bgr = image.as_(ColorSpaces.BGR)
+        expected = held.copy()
+
+        image.apply_brightness(10)
+        image.apply_brightness(10)
+        other = Image.from_numpy_array(self.frames[1], ColorSpaces.BGR, buffer_pool=pool)
+        other.apply_brightness(10)
+        other.apply_contrast(10)
+
+        np.testing.assert_array_equal(held, expected)
+        np.testing.assert_array_equal(view.pixels, expected[:40, :40])
+        np.testing.assert_array_equal(as_bgr.pixels, expected)
+
+        image.release()
+        other.release()
+        assert pool.outstanding_bytes == 0
+
+    def test_max_pooled_bytes(self):
+        pool = BufferPool(max_pooled_bytes=100)
+        pool.release(pool.acquire((10, 10)))
+        pool.release(pool.acquire((20, 20)))
+
+        assert pool.pooled_bytes == 100
+        assert pool.acquire((10, 10)) is not None
+        assert pool.hits == 1
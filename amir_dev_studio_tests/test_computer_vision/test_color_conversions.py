@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+import cv2
+import numpy as np
+
+from amir_dev_studio.computer_vision import color_conversions
+from amir_dev_studio.computer_vision.constants import Colors
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.models.drawable.rectangle import DrawableRectangle
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.computer_vision.models.point import Point
+
+
+class TestColorConversions(TestCase):
+    def setUp(self):
+        self.pixels = np.random.default_rng(0).integers(0, 255, (20, 30, 3), np.uint8)
+
+    def test_every_pair_is_reachable(self):
+        for source in ColorSpaces:
+            for target in ColorSpaces:
+                path = color_conversions.conversion_path(source, target)
+                assert len(path) <= 2, (source, target)
+
+    def test_multi_step_conversion(self):
+        hsv = cv2.cvtColor(self.pixels, cv2.COLOR_BGR2HSV)
+        expected = cv2.cvtColor(cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR), cv2.COLOR_BGR2LAB)
+        np.testing.assert_array_equal(color_conversions.convert(hsv, ColorSpaces.HSV, ColorSpaces.LAB), expected)
+
+    def test_grayscale_conversion_keeps_layout(self):
+        image = Image.from_numpy_array(self.pixels, ColorSpaces.BGR)
+        image.apply_grayscale_conversion()
+
+        gray = cv2.cvtColor(self.pixels, cv2.COLOR_BGR2GRAY)
+        assert image.color_space == ColorSpaces.BGR
+        np.testing.assert_array_equal(image.pixels, np.stack((gray,) * 3, axis=-1))
+
+    def test_cached_representations(self):
+        image = Image.from_numpy_array(self.pixels, ColorSpaces.BGR)
+        hsv = image.as_(ColorSpaces.HSV)
+
+        assert hsv.color_space == ColorSpaces.HSV
+        assert np.shares_memory(hsv.pixels, image.as_(ColorSpaces.HSV).pixels)
+        np.testing.assert_array_equal(hsv.pixels, cv2.cvtColor(self.pixels, cv2.COLOR_BGR2HSV))
+
+        image.apply_color_space_conversion(ColorSpaces.HSV)
+        assert np.shares_memory(image.pixels, hsv.pixels)
+        assert np.shares_memory(image.as_(ColorSpaces.BGR).pixels, self.pixels)
+
+        image.draw(DrawableRectangle(Point(1, 1), Point(5, 5), Colors.WHITE, 1))
+        assert not np.shares_memory(image.pixels, hsv.pixels)
+        assert not np.shares_memory(image.as_(ColorSpaces.BGR).pixels, self.pixels)
+        np.testing.assert_array_equal(hsv.pixels, cv2.cvtColor(self.pixels, cv2.COLOR_BGR2HSV))
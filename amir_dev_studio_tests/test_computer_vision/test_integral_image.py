@@ -0,0 +1,65 @@
+from unittest import TestCase
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.integral_image import IntegralImage
+from amir_dev_studio.computer_vision.models.drawable.rectangle import BoxArray, Rectangle
+from amir_dev_studio.computer_vision.models.image import Image
+
+
+class TestIntegralImage(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.pixels = rng.integers(0, 255, (60, 80, 3), np.uint8)
+        self.boxes = BoxArray.from_ltrb(np.array([
+            [0, 0, 80, 60],
+            [10, 5, 30, 25],
+            [12.5, 7.2, 40.1, 33.9],
+            [-20, -20, 5, 5],
+            [70, 50, 200, 200],
+        ]))
+        self.regions = [(0, 0, 80, 60), (10, 5, 30, 25), (12, 7, 41, 34), (0, 0, 5, 5), (70, 50, 80, 60)]
+
+    def test_batch_statistics_match_slicing(self):
+        integral = IntegralImage(self.pixels)
+        sums, means, variances = integral.sum(self.boxes), integral.mean(self.boxes), integral.variance(self.boxes)
+
+        assert sums.shape == means.shape == variances.shape == (5, 3)
+        for index, (left, top, right, bottom) in enumerate(self.regions):
+            region = self.pixels[top:bottom, left:right].reshape(-1, 3).astype(np.float64)
+            np.testing.assert_array_equal(sums[index], region.sum(axis=0))
+            np.testing.assert_allclose(means[index], region.mean(axis=0))
+            np.testing.assert_allclose(variances[index], region.var(axis=0), rtol=1e-9)
+
+        np.testing.assert_array_equal(integral.counts(self.boxes), [4800, 400, 29 * 27, 25, 100])
+        np.testing.assert_allclose(integral.std(Rectangle.from_ltrb(10, 5, 30, 25))[0], variances[1] ** 0.5)
+
+    def test_single_channel_and_empty_regions(self):
+        gray = self.pixels[..., 0]
+        integral = IntegralImage(gray)
+        boxes = [Rectangle.from_ltrb(2, 3, 9, 11), Rectangle.from_ltrb(100, 100, 120, 120)]
+
+        means = integral.mean(boxes)
+        assert means.shape == (2, 1)
+        np.testing.assert_allclose(means[0, 0], gray[3:11, 2:9].mean())
+        assert np.isnan(means[1, 0]) and np.isnan(integral.variance(boxes)[1, 0])
+
+    def test_flat_regions_have_zero_variance(self):
+        integral = IntegralImage(np.full((100, 100), 200, np.uint8))
+        assert np.all(integral.variance(np.array([[0, 0, 100, 100], [3, 3, 50, 70]])) == 0)
+
+    def test_image_caches_and_invalidates(self):
+        image = Image.from_numpy_array(self.pixels.copy(), ColorSpaces.BGR)
+        integral = image.integral
+
+        assert image.integral is integral
+        image.apply_brightness(20)
+        assert image.integral is not integral
+        np.testing.assert_allclose(image.integral.mean(Rectangle.from_ltrb(0, 0, 80, 60))[0],
+                                   image.pixels.reshape(-1, 3).mean(axis=0))
+
+        refreshed = image.integral
+        image.pixels[:] = 0
+        image.invalidate_representations()
+        assert image.integral is not refreshed and image.integral.sum(self.boxes).sum() == 0
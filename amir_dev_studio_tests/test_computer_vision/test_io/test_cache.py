@@ -0,0 +1,58 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import cv2
+import numpy as np
+
+from amir_dev_studio.computer_vision.constants import Colors
+from amir_dev_studio.computer_vision.io.cache import ImageCache
+from amir_dev_studio.computer_vision.models.drawable.rectangle import DrawableRectangle
+from amir_dev_studio.computer_vision.models.point import Point
+
+
+class TestImageCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = []
+
+        for i in range(3):
+            path = os.path.join(self.directory.name, f'{i}.png')
+            cv2.imwrite(path, np.full((10, 10, 3), i, np.uint8))
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_hits_share_the_buffer(self):
+        cache = ImageCache()
+        first = cache.get(self.paths[0])
+        second = cache.get(self.paths[0])
+
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert np.shares_memory(first.pixels, second.pixels)
+
+        first.draw(DrawableRectangle(Point(1, 1), Point(5, 5), Colors.WHITE, 1))
+        assert not second.pixels.any()
+        assert not cache.get(self.paths[0]).pixels.any()
+
+    def test_invalidated_when_file_changes(self):
+        cache = ImageCache()
+        cache.get(self.paths[1])
+
+        cv2.imwrite(self.paths[1], np.full((12, 10, 3), 7, np.uint8))
+        os.utime(self.paths[1], ns=(0, 10 ** 9))
+
+        image = cache.get(self.paths[1])
+        assert cache.invalidations == 1
+        assert image.pixels.shape == (12, 10, 3)
+
+    def test_evicts_by_bytes(self):
+        cache = ImageCache(max_bytes=2 * 300)
+        for path in self.paths:
+            cache.get(path)
+
+        assert len(cache) == 2
+        assert cache.current_bytes == 600
+        assert cache.evictions == 1
+        assert self.paths[0] not in cache
@@ -0,0 +1,41 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import cv2
+import numpy as np
+
+from amir_dev_studio.computer_vision.io.loader import ImageLoader
+
+
+class TestImageLoader(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = []
+
+        for i in range(12):
+            path = os.path.join(self.directory.name, f'{i}.png')
+            cv2.imwrite(path, np.full((40, 60, 3), i, np.uint8))
+            self.paths.append(path)
+
+        self.missing_path = os.path.join(self.directory.name, 'missing.png')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_ordered_with_error_capture(self):
+        paths = self.paths[:5] + [self.missing_path] + self.paths[5:]
+        results = list(ImageLoader(paths, max_workers=4, max_prefetch=3))
+
+        assert [result.path for result in results] == paths
+        assert not results[5].was_successful
+        assert [int(result.image.pixels[0, 0, 0]) for result in results if result.was_successful] == list(range(12))
+
+    def test_unordered_with_memory_budget(self):
+        loader = ImageLoader(self.paths, ordered=False, memory_budget=40 * 60 * 3 * 2)
+        assert sorted(image.path for image in loader.iter_images()) == sorted(self.paths)
+
+    def test_reduce_factor(self):
+        image = next(ImageLoader(self.paths, reduce_factor=2, grayscale=True).iter_images())
+        assert image.pixels.shape == (20, 30)
+        assert ImageLoader(self.paths, reduce_factor=2, grayscale=True).estimate_bytes(self.paths[0]) == 600
@@ -0,0 +1,58 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import cv2
+import numpy as np
+
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.io.probe import probe
+from amir_dev_studio.computer_vision.models.image import Image
+
+
+class TestProbe(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.pixels = np.random.default_rng(0).integers(0, 255, (37, 53, 3), np.uint8)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_common_formats(self):
+        cases = {
+            'image.png': 3,
+            'image.jpg': 3,
+            'image.bmp': 3,
+            'image.webp': 3,
+        }
+
+        for filename, channels in cases.items():
+            path = os.path.join(self.directory.name, filename)
+            cv2.imwrite(path, self.pixels)
+            info = probe(path)
+            assert (info.width, info.height, info.channels) == (53, 37, channels), (filename, info)
+
+        path = os.path.join(self.directory.name, 'alpha.png')
+        cv2.imwrite(path, np.dstack((self.pixels, self.pixels[..., 0])))
+        assert probe(path).channels == 4
+
+        path = os.path.join(self.directory.name, 'gray.png')
+        cv2.imwrite(path, self.pixels[..., 0])
+        assert probe(path).channels == 1
+
+    def test_mmap_round_trip(self):
+        path = os.path.join(self.directory.name, 'image.adsimg')
+        image = Image.from_numpy_array(self.pixels, ColorSpaces.RGB, name='frame')
+        image.save_mmap(path)
+
+        info = probe(path)
+        assert (info.format, info.width, info.height, info.channels) == ('raw', 53, 37, 3)
+
+        loaded = Image.from_mmap(path)
+        assert isinstance(loaded.pixels, np.memmap)
+        assert (loaded.color_space, loaded.name) == (ColorSpaces.RGB, 'frame')
+        np.testing.assert_array_equal(loaded.pixels, self.pixels)
+
+        loaded.pixels[0, 0] = 0
+        np.testing.assert_array_equal(Image.from_mmap(path).pixels, self.pixels)
+        del loaded
@@ -0,0 +1,126 @@
+import copy
+import multiprocessing
+import pickle
+from unittest import TestCase
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.buffer_pool import BufferPool
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.io.shared_images import SharedImagePool
+from amir_dev_studio.computer_vision.models.image import Image
+
+
+def _invert_worker(pool, inbox, outbox):
+    while (image := inbox.get()) is not None:
+        image.pixels[...] = 255 - image.pixels
+        outbox.put((image.name, image.slot, int(image.pixels.sum())))
+        image.release()
+    pool.close()
+
+
+class TestSharedImagePool(TestCase):
+    def setUp(self):
+        self.context = multiprocessing.get_context('spawn')
+        self.pool = SharedImagePool((32, 48, 3), slots=2, context=self.context)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_allocate_release_and_bounded(self):
+        first = self.pool.allocate((32, 48, 3))
+        second = self.pool.allocate((16, 16), color_space=ColorSpaces.GRAY)
+        assert {first.slot, second.slot} == {0, 1}
+        assert self.pool.free_slots == 0
+
+        with self.assertRaises(TimeoutError):
+            self.pool.allocate((32, 48, 3), timeout=0.05)
+
+        first.retain()
+        assert self.pool.refcount(first.slot) == 2
+        received = pickle.loads(pickle.dumps(first))
+        first.release()
+        first.release()
+        assert self.pool.refcount(first.slot) == 1
+
+        received.release()
+        assert self.pool.free_slots == 1
+
+        third = self.pool.allocate((32, 48, 3), timeout=0.05)
+        assert third.slot == first.slot
+        del first, second, third, received
+
+    def test_pickled_view_shares_pixels(self):
+        image = self.pool.share(Image(np.arange(32 * 48 * 3, dtype=np.uint8).reshape(32, 48, 3), ColorSpaces.BGR))
+        view = pickle.loads(pickle.dumps(image))
+        view.pixels = view.pixels[4:20, 8:40]
+        received = pickle.loads(pickle.dumps(view))
+
+        received.pixels[0, 0] = 7
+        assert np.all(image.pixels[4, 8] == 7)
+        assert np.array_equal(received.pixels, image.pixels[4:20, 8:40])
+
+        view.pixels = view.pixels.copy()
+        with self.assertRaises(Exception):
+            pickle.dumps(view)
+
+        del view, received
+        image.release()
+
+    def test_copies_are_private(self):
+        image = self.pool.allocate((32, 48, 3))
+        image.pixels[...] = 5
+
+        for duplicate in (copy.copy(image), copy.deepcopy(image)):
+            assert type(duplicate) is Image
+            assert not np.shares_memory(duplicate.pixels, image.pixels)
+            assert np.all(duplicate.pixels == 5)
+
+        assert self.pool.refcount(image.slot) == 1
+        image.release()
+        assert self.pool.free_slots == 2
+
+    def test_release_returns_pooled_buffer(self):
+        buffers = BufferPool()
+        image = self.pool.allocate((32, 48, 3))
+        image.buffer_pool = buffers
+        image.pixels[...] = 5
+        image.apply_brightness(10)
+        assert not image.is_shared and buffers.outstanding_bytes == 32 * 48 * 3
+
+        image.release()
+        assert buffers.outstanding_bytes == 0 and buffers.pooled_bytes == 32 * 48 * 3
+        assert self.pool.free_slots == 2
+
+    def test_unpickling_returns_the_attached_pool(self):
+        reconstruct, args = self.pool.__reduce__()
+        assert reconstruct(*args) is self.pool
+
+    def test_worker_modifies_in_place(self):
+        for method in ('spawn', 'fork'):
+            with self.subTest(method):
+                context = multiprocessing.get_context(method)
+                pool = SharedImagePool((32, 48, 3), slots=2, context=context)
+                inbox, outbox = context.Queue(), context.Queue()
+                worker = context.Process(target=_invert_worker, args=(pool, inbox, outbox))
+                worker.start()
+
+                for value in range(4):
+                    image = pool.allocate((32, 48, 3), name=f'frame {value}', timeout=10)
+                    image.pixels[...] = value
+                    image.retain()
+                    inbox.put(image)
+
+                    name, slot, total = outbox.get(timeout=30)
+                    assert name == f'frame {value}' and slot == image.slot
+                    assert total == (255 - value) * 32 * 48 * 3
+                    assert np.all(image.pixels == 255 - value)
+                    image.release()
+
+                inbox.put(None)
+                worker.join(timeout=30)
+                assert worker.exitcode == 0
+                assert pool.free_slots == 2
+
+                # The worker closed its copy of the pool; the segment must still be ours to free.
+                pool.close()
@@ -0,0 +1,42 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import cv2
+import numpy as np
+
+from amir_dev_studio.computer_vision.io.video import FrameSource
+
+
+class TestFrameSource(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'video.avi')
+
+        writer = cv2.VideoWriter(self.path, cv2.VideoWriter_fourcc(*'MJPG'), 10, (64, 48))
+        for i in range(20):
+            writer.write(np.full((48, 64, 3), i * 10, np.uint8))
+        writer.release()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _read(self, **kwargs) -> list[tuple[int, int]]:
+        source = FrameSource(self.path, **kwargs)
+        frames = [(image.extra_data['frame_index'], round(image.pixels.mean() / 10)) for image in source]
+        return frames
+
+    def test_threaded_capture(self):
+        frames = self._read(ring_size=3)
+        assert frames == [(i, i) for i in range(20)]
+
+    def test_stride_and_limits(self):
+        assert self._read(stride=3, start_frame=2, max_frames=4) == [(2, 2), (5, 5), (8, 8), (11, 11)]
+        assert self._read(stride=2, threaded=False, max_frames=3) == [(0, 0), (2, 2), (4, 4)]
+
+    def test_buffers_are_reused(self):
+        source = FrameSource(self.path, ring_size=2, threaded=False)
+        buffers = {image.pixels.__array_interface__['data'][0] for image in source}
+
+        assert len(buffers) == 2
+        assert source.frames_yielded == 20
@@ -0,0 +1,39 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import cv2
+import numpy as np
+
+from amir_dev_studio.computer_vision.io.writer import EncodeParams, ImageWriter
+from amir_dev_studio.computer_vision.models.image import Image
+
+
+class TestImageWriter(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_writes_in_background(self):
+        image = Image.create_blank(30, 40)
+
+        with ImageWriter(max_workers=3, max_queue=4, encode_params=EncodeParams(png_compression=9)) as writer:
+            for i in range(20):
+                image.pixels[...] = i
+                writer.write(image, os.path.join(self.directory.name, f'{i}.png'))
+
+        assert writer.images_written == 20
+        assert writer.bytes_written > 0
+        for i in range(20):
+            assert cv2.imread(os.path.join(self.directory.name, f'{i}.png'))[0, 0, 0] == i
+
+    def test_errors_are_reported_on_close(self):
+        writer = ImageWriter()
+        writer.write(np.zeros((10, 10, 3), np.uint8), os.path.join(self.directory.name, 'missing', 'a.png'))
+        writer.flush()
+
+        assert len(writer.errors) == 1
+        with self.assertRaises(Exception):
+            writer.close()
@@ -0,0 +1,22 @@
+from unittest import TestCase
+
+from amir_dev_studio.computer_vision.models.color import Color
+
+
+class TestColor(TestCase):
+    def test_from_hex(self):
+        assert Color.from_hex('#ff8000').bgr == (0, 128, 255)
+        assert Color.from_hex('#FFF').bgr == (255, 255, 255)
+        assert Color.from_hex('#12345678').rgb == (0x12, 0x34, 0x56)
+        assert Color.from_hex('#abcd').rgb == (0xaa, 0xbb, 0xcc)
+        assert Color.from_hex('red').rgb == (255, 0, 0)
+
+    def test_to_hex(self):
+        assert Color(0, 128, 255).to_hex() == '#ff8000'
+        assert Color(10.4, 200.6, 0).to_hex() == '#00c90a'
+
+        for value in ('#000000', '#0a0b0c', '#ffffff'):
+            assert Color.from_hex(value).to_hex() == value
+
+        with self.assertRaises(ValueError):
+            Color(0, 0, 300).to_hex()
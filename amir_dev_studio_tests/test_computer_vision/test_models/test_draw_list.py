@@ -0,0 +1,40 @@
+from unittest import TestCase
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.constants import Colors
+from amir_dev_studio.computer_vision.models.drawable.draw_list import DrawList
+from amir_dev_studio.computer_vision.models.drawable.line import DrawableLine
+from amir_dev_studio.computer_vision.models.drawable.rectangle import DrawableRectangle
+from amir_dev_studio.computer_vision.models.drawable.text import DrawableText
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.computer_vision.models.point import Point
+
+
+class TestDrawList(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.drawables = []
+
+        for _ in range(200):
+            (x1, y1), (x2, y2) = rng.uniform(0, 300, (2, 2))
+            if x1 == x2 or y1 == y2:
+                continue
+            self.drawables.append(DrawableLine(Point(x1, y1), Point(x2, y2), Colors.GREEN, 2))
+            self.drawables.append(DrawableRectangle(Point(x1, y1), Point(x2, y2), Colors.GREEN, 1))
+
+        self.drawables.append(DrawableText('label', Point(20, 20), Colors.GREEN, 1, thickness=1))
+
+    def test_matches_individual_draws(self):
+        expected = Image.create_blank(300, 300)
+        for drawable in self.drawables:
+            expected.draw(drawable)
+
+        actual = Image.create_blank(300, 300)
+        actual.draw(DrawList(self.drawables))
+
+        np.testing.assert_array_equal(actual.pixels, expected.pixels)
+
+    def test_groups(self):
+        groups = DrawList(self.drawables).group()
+        assert len(groups) == 3
@@ -1,9 +1,11 @@
 from unittest import TestCase
 
+import numpy as np
+
 from amir_dev_studio.computer_vision.constants import Colors
 from amir_dev_studio.computer_vision.models.image import Image
 from amir_dev_studio.computer_vision.models.point import Point
-from amir_dev_studio.computer_vision.models.drawable.rectangle import DrawableRectangle
+from amir_dev_studio.computer_vision.models.drawable.rectangle import DrawableRectangle, Rectangle
 from amir_dev_studio.computer_vision.models.drawable.text import DrawableText as Text
 
 
@@ -28,3 +30,36 @@ class TestImageCase(TestCase):
         image = Image.create_blank(100, 100)
         image.draw(DrawableRectangle(Point(10, 10), Point(20, 20), Colors.RED, 1))
         image.draw(DrawableRectangle(Point(30, 30), Point(40, 40), Colors.GREEN, 1))
+
+
+class TestImageViewCase(TestCase):
+    def test_view_shares_memory_until_drawn(self):
+        image = Image.create_blank(100, 100)
+        view = image.view(Rectangle.from_ltrb(10, 20, 50, 60))
+
+        assert view.is_view
+        assert (view.width, view.height) == (40, 40)
+        assert np.shares_memory(view.pixels, image.pixels)
+
+        view.draw(DrawableRectangle(Point(5, 5), Point(20, 20), Colors.RED, 1))
+
+        assert not view.is_view
+        assert view.pixels.any()
+        assert not image.pixels.any()
+
+    def test_apply_does_not_touch_parent(self):
+        image = Image.create_blank(100, 100)
+        view = image.view(Rectangle.from_ltrb(-10, -10, 30, 30))
+        view.apply_brightness(50)
+
+        assert view.pixels.shape == (30, 30, 3)
+        assert view.pixels.all()
+        assert not image.pixels.any()
+
+    def test_write_through_view(self):
+        image = Image.create_blank(100, 100)
+        view = image.view(Rectangle.from_ltrb(0, 0, 10, 10), copy_on_write=False)
+        view.pixels[...] = 255
+
+        assert image.pixels[:10, :10].all()
+        assert not image.pixels[10:].any()
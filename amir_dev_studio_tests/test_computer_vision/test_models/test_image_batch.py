@@ -0,0 +1,85 @@
+from unittest import TestCase
+
+import cv2
+import numpy as np
+
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.models.drawable.rectangle import BoxArray, Rectangle
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.computer_vision.models.image_batch import ImageBatch
+
+
+class TestImageBatch(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.wide = Image.from_numpy_array(rng.integers(0, 255, (40, 80, 3), np.uint8), ColorSpaces.BGR)
+        self.tall = Image.from_numpy_array(rng.integers(0, 255, (64, 32, 3), np.uint8), ColorSpaces.RGB)
+        self.gray = Image.from_numpy_array(rng.integers(0, 255, (32, 32), np.uint8), ColorSpaces.GRAY)
+
+    def test_stretch_matches_reference(self):
+        batch = ImageBatch([self.wide, self.tall])
+        mean, std = (0.485, 0.456, 0.406), (0.229, 0.224, 0.225)
+        tensor, transforms = batch.to_tensor((48, 32), mode='stretch', mean=mean, std=std)
+
+        assert tensor.shape == (2, 3, 32, 48) and tensor.dtype == np.float32
+        assert tensor.flags.c_contiguous
+
+        for index, (pixels, swap) in enumerate([(self.wide.pixels, True), (self.tall.pixels, False)]):
+            resized = cv2.resize(pixels, (48, 32), interpolation=cv2.INTER_LINEAR).astype(np.float64) / 255
+            if swap:
+                resized = resized[..., ::-1]
+            expected = ((resized - mean) / std).transpose(2, 0, 1)
+            np.testing.assert_allclose(tensor[index], expected, atol=1e-5)
+
+        assert (transforms[0].scale_x, transforms[0].scale_y) == (48 / 80, 32 / 40)
+
+    def test_letterbox_pads_and_maps_back(self):
+        batch = ImageBatch([self.wide, self.tall])
+        tensor, transforms = batch.to_tensor((64, 64), scale=1.0, channel_order='BGR')
+
+        # The wide image is scaled to 64x32 and centred vertically.
+        assert (transforms[0].pad_x, transforms[0].pad_y) == (0, 16)
+        assert np.all(tensor[0, :, :16] == 114) and np.all(tensor[0, :, 48:] == 114)
+        np.testing.assert_array_equal(
+            tensor[0, :, 16:48].transpose(1, 2, 0),
+            cv2.resize(self.wide.pixels, (64, 32), interpolation=cv2.INTER_LINEAR)
+        )
+
+        rect = Rectangle.from_ltrb(10, 5, 30, 25)
+        mapped = transforms[0].to_tensor(rect)
+        assert (mapped.left, mapped.top, mapped.right, mapped.bottom) == (8, 20, 24, 36)
+        back = transforms[0].to_source(mapped)
+        assert (back.left, back.top, back.right, back.bottom) == (10, 5, 30, 25)
+
+        boxes = BoxArray.from_rectangles([rect, Rectangle.from_ltrb(0, 0, 32, 64)])
+        np.testing.assert_allclose(transforms[1].boxes_to_source(transforms[1].boxes_to_tensor(boxes)).ltrb, boxes.ltrb)
+
+    def test_scales_other_dtypes_to_eight_bits(self):
+        expected, _ = ImageBatch([self.wide]).to_tensor((48, 32))
+
+        source = self.wide.pixels
+        for pixels in (source / 255, source.astype(np.float32) / 255, source * np.uint16(257)):
+            image = Image.from_numpy_array(pixels, ColorSpaces.BGR)
+            tensor, _ = ImageBatch([image]).to_tensor((48, 32))
+            np.testing.assert_array_equal(tensor, expected)
+
+        with self.assertRaises(Exception):
+            ImageBatch([Image.from_numpy_array(self.wide.pixels.astype(np.int32), ColorSpaces.BGR)]).to_tensor((48, 32))
+
+        with self.assertRaises(AssertionError):
+            ImageBatch([self.wide]).to_tensor((48, 32), mean=(0.5,), std=(0.5,))
+
+    def test_reuses_output_buffer_and_half_precision(self):
+        batch = ImageBatch([self.wide, self.gray])
+        tensor, _ = batch.to_tensor((32, 32), dtype=np.float16)
+        again, _ = batch.to_tensor((32, 32), dtype=np.float16, out=tensor)
+
+        assert again is tensor and tensor.dtype == np.float16
+        assert np.all(tensor[1, 0] == tensor[1, 1]) and np.all(tensor[1, 1] == tensor[1, 2])
+        np.testing.assert_allclose(tensor[1, 0], self.gray.pixels / 255, atol=1e-3)
+
+    def test_channels_last(self):
+        tensor, _ = ImageBatch([self.tall]).to_tensor((32, 64), mode='stretch', scale=1.0, channels_first=False)
+
+        assert tensor.shape == (1, 64, 32, 3)
+        np.testing.assert_array_equal(tensor[0], self.tall.pixels)
@@ -0,0 +1,47 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.computer_vision.models.image_grid import ImageGrid
+from amir_dev_studio.computer_vision.models.mosaic import MosaicCompositor
+
+
+class TestImageGrid(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.images = [
+            Image.from_numpy_array(rng.integers(0, 255, (20, 30, 3), np.uint8), ColorSpaces.BGR)
+            for _ in range(5)
+        ]
+
+    def test_concat_to_image(self):
+        grid = ImageGrid(self.images)
+        image = grid.concat_to_image((3, 2))
+
+        assert (image.height, image.width) == (40, 90)
+        np.testing.assert_array_equal(image.pixels[:20, 30:60], self.images[1].pixels)
+        np.testing.assert_array_equal(image.pixels[20:, 30:60], self.images[4].pixels)
+        assert not image.pixels[20:, 60:].any()
+        assert len(grid.images) == 5
+
+    def test_padding_border_and_resizing(self):
+        images = self.images + [Image.create_blank(7, 11), Image.create_blank(5, 5, channels=1)]
+        compositor = MosaicCompositor(4, 2, tile_size=(30, 20), padding=2, border=3)
+        image = compositor.compose(images)
+
+        assert (image.height, image.width) == (2 * 20 + 2 + 6, 4 * 30 + 3 * 2 + 6)
+        np.testing.assert_array_equal(image.pixels[3:23, 3:33], self.images[0].pixels)
+        np.testing.assert_array_equal(image.pixels[25:45, 35:65], images[5].pixels[:1, :1].repeat(20, 0).repeat(30, 1))
+
+    def test_memory_mapped_output(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'sheet.npy')
+            image = MosaicCompositor(5, 1).compose(self.images, output_path=path)
+            image.pixels.flush()
+
+            np.testing.assert_array_equal(np.load(path), image.pixels)
+            del image
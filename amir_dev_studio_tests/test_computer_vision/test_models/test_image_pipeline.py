@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.computer_vision.models.image_pipeline import ImagePipeline
+
+
+class TestImagePipeline(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.image = Image.from_numpy_array(rng.integers(0, 255, (60, 80, 3), np.uint8), ColorSpaces.BGR)
+
+    def test_matches_eager_operations(self):
+        pipeline = (
+            ImagePipeline()
+            .brightness(40)
+            .contrast(30)
+            .gaussian_blur(3)
+            .brightness(-20)
+            .trim(5, 6, 7, 8)
+            .scale(0.5)
+        )
+
+        expected = self.image.copy()
+        expected.apply_brightness(40)
+        expected.apply_contrast(30)
+        expected.apply_gaussian_blur(3)
+        expected.apply_brightness(-20)
+        expected.pixels = expected.pixels[5:-6, 7:-8]
+        expected.scale(0.5)
+
+        actual = pipeline.apply(self.image)
+
+        np.testing.assert_array_equal(actual.pixels, expected.pixels)
+        assert pipeline.describe() == ['fused_pointwise', 'gaussian_blur', 'crop', 'brightness', 'scale']
+
+    def test_crop_moves_ahead_of_pointwise_operations(self):
+        pipeline = ImagePipeline(self.image).brightness(10).contrast(10).trim(1, 2, 3, 4).trim(1, 1, 1, 1)
+
+        assert pipeline.describe() == ['crop', 'fused_pointwise']
+        assert pipeline.materialize().pixels.shape == (55, 71, 3)
+
+    def test_source_is_untouched(self):
+        original = self.image.pixels.copy()
+        ImagePipeline(self.image).brightness(50).grayscale().materialize()
+        np.testing.assert_array_equal(self.image.pixels, original)
@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+import cv2
+import numpy as np
+
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.computer_vision.models.image_pyramid import ImagePyramid
+
+
+class TestImagePyramid(TestCase):
+    def setUp(self):
+        pixels = np.random.default_rng(0).integers(0, 255, (200, 300, 3), np.uint8)
+        self.image = Image.from_numpy_array(pixels, ColorSpaces.BGR)
+
+    def test_gaussian_levels_are_built_incrementally(self):
+        pyramid = ImagePyramid(self.image, method='gaussian', min_size=(30, 30))
+
+        assert [level.pixels.shape[:2] for level in pyramid] == [(200, 300), (100, 150), (50, 75)]
+        np.testing.assert_array_equal(pyramid[2].pixels, cv2.pyrDown(cv2.pyrDown(self.image.pixels)))
+        assert pyramid[1] is pyramid[1]
+
+    def test_area_levels(self):
+        pyramid = ImagePyramid(self.image, scale_factor=0.75, max_levels=3)
+        assert len(pyramid) == 3
+        assert (pyramid[2].width, pyramid[2].height) == (168, 112)
+
+    def test_sliding_windows_are_views(self):
+        pyramid = ImagePyramid(self.image, method='gaussian')
+        windows = list(pyramid.sliding_windows((100, 100), stride=50))
+
+        assert {window.level for window in windows} == {0, 1}
+        for window in windows:
+            source = pyramid[window.level].pixels
+            assert np.shares_memory(window.image.pixels, source)
+            assert window.image.pixels.shape[:2] == (100, 100)
+
+        coarse = [window for window in windows if window.level == 1][0]
+        assert (coarse.rect.width, coarse.rect.height) == (200, 200)
@@ -0,0 +1,87 @@
+from unittest import TestCase
+
+import cv2
+import numpy as np
+
+from amir_dev_studio.computer_vision.models.color import Color
+from amir_dev_studio.computer_vision.models.palette import Palette
+
+
+class TestPalette(TestCase):
+    def setUp(self):
+        self.hex_colors = ['#ff8000', '#0A0B0C', '#fff', '#12345678']
+        self.palette = Palette.from_hex(self.hex_colors)
+
+    def test_hex_round_trip(self):
+        assert self.palette.colors.dtype == np.uint8 and self.palette.colors.shape == (4, 3)
+        assert self.palette.to_hex() == ['#ff8000', '#0a0b0c', '#ffffff', '#123456']
+        assert [color.bgr for color in self.palette] == [Color.from_hex(value).bgr for value in self.hex_colors]
+
+        named = Palette.from_hex(['red', '#00ff00'])
+        np.testing.assert_array_equal(named.colors, [[0, 0, 255], [0, 255, 0]])
+
+    def test_from_colors_and_indexing(self):
+        palette = Palette.from_colors([Color(1, 2, 3), Color(4.4, 5.6, 300)])
+
+        np.testing.assert_array_equal(palette.colors, [[1, 2, 3], [4, 6, 255]])
+        assert palette[1].bgr == (4, 6, 255)
+        assert len(palette[:1]) == 1
+
+    def test_lookup_and_cached_colors(self):
+        ids = np.array([[0, 5], [3, 2]])
+        colors = self.palette.lookup(ids)
+
+        assert colors.shape == (2, 2, 3)
+        np.testing.assert_array_equal(colors[0, 1], self.palette.colors[1])
+        assert self.palette.color(7) is self.palette.color(7)
+        assert self.palette.color(7).bgr == self.palette[3].bgr
+
+    def test_colors_are_writable_and_cache_is_bounded(self):
+        for palette in (self.palette, Palette.from_colors([Color(1, 2, 3)]), Palette.distinct(3)):
+            assert palette.colors.flags.c_contiguous and palette.colors.flags.writeable
+
+        for class_id in range(100):
+            self.palette.color(class_id)
+        assert len(self.palette._color_cache) == len(self.palette)
+
+        colors = self.palette.colors.copy()
+        colors[3] = (7, 8, 9)
+        self.palette.colors = colors
+        assert self.palette.color(7).bgr == (7, 8, 9)
+
+    def test_empty_palette_rejected(self):
+        with self.assertRaises(AssertionError):
+            Palette.from_colors([])
+
+    def test_colorize_with_background(self):
+        labels = np.array([[0, 1], [4, 5]])
+        image = self.palette.colorize(labels, background=Color(9, 9, 9))
+
+        assert image.shape == (2, 2, 3) and image.dtype == np.uint8
+        np.testing.assert_array_equal(image[0, 0], [9, 9, 9])
+        np.testing.assert_array_equal(image[0, 1], self.palette.colors[0])
+        np.testing.assert_array_equal(image[1, 0], self.palette.colors[3])
+        np.testing.assert_array_equal(image[1, 1], self.palette.colors[0])
+
+    def test_batch_adjustments_match_color(self):
+        for adjusted, method in ((self.palette.lighten(0.2), 'lighten'), (self.palette.darken(0.2), 'darken')):
+            for color, expected in zip(adjusted, self.palette):
+                getattr(expected, method)(0.2)
+                np.testing.assert_allclose(color.bgr, expected.bgr, atol=0.5)
+
+        blended = self.palette.blend(Color(0, 0, 0), 0.25)
+        np.testing.assert_array_equal(blended.colors, np.rint(self.palette.colors * 0.75))
+        np.testing.assert_array_equal(self.palette.blend(self.palette, 0.7).colors, self.palette.colors)
+
+    def test_distinct_colors(self):
+        palette = Palette.distinct(12)
+        colors = palette.colors.astype(np.int32)
+
+        assert len(palette) == 12 and len({tuple(color) for color in colors}) == 12
+        assert not np.any(np.all(colors == 0, axis=1) | np.all(colors == 255, axis=1))
+        np.testing.assert_array_equal(Palette.distinct(5).colors, palette.colors[:5])
+
+        # Every pair stays far apart in CIELAB (random colors typically come within ~15 of each other).
+        lab = cv2.cvtColor((palette.colors.astype(np.float32) / 255).reshape(-1, 1, 3), cv2.COLOR_BGR2LAB)[:, 0]
+        distances = np.linalg.norm(lab[:, None] - lab[None, :], axis=-1) + np.eye(12) * 1e9
+        assert distances.min() > 40
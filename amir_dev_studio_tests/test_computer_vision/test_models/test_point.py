@@ -0,0 +1,50 @@
+from unittest import TestCase
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.models.point import Point, PointArray
+
+
+class TestPoint(TestCase):
+    def test_compact_layout(self):
+        point = Point(1, 2)
+
+        assert not hasattr(point, '__dict__')
+        assert not hasattr(point, '_extra_data')
+
+        point.extra_data['label'] = 'corner'
+        assert point.extra_data == {'label': 'corner'}
+        assert point.copy() == point
+
+
+class TestPointArray(TestCase):
+    def setUp(self):
+        self.points = [Point(1, 2), Point(-3, 4), Point(-5, -6), Point(7, -8), Point(0, 1)]
+        self.array = PointArray.from_points(self.points)
+
+    def test_round_trip(self):
+        assert self.array.coords.shape == (5, 2)
+        assert [p.xy for p in self.array.to_points()] == [p.xy for p in self.points]
+        assert self.array[1].xy == (-3, 4)
+        assert len(self.array[1:3]) == 2
+
+    def test_quadrant(self):
+        assert self.array.quadrant.tolist() == [p.quadrant for p in self.points]
+
+    def test_translate(self):
+        translated = self.array.translate(1, -1)
+        assert [p.xy for p in translated] == [p.translate(1, -1).xy for p in self.points]
+
+    def test_distances(self):
+        origin = Point(0, 0)
+        expected = [p.distance_from(origin) for p in self.points]
+        np.testing.assert_allclose(self.array.distance_from(origin), expected)
+
+        matrix = self.array.distance_matrix()
+        assert matrix.shape == (5, 5)
+        np.testing.assert_allclose(matrix[1, 2], self.points[1].distance_from(self.points[2]))
+
+    def test_direction_predicates(self):
+        other = Point(0, 0)
+        assert self.array.is_top_left_of(other).tolist() == [p.is_top_left_of(other) for p in self.points]
+        assert self.array.is_bottom_right_of(other).tolist() == [p.is_bottom_right_of(other) for p in self.points]
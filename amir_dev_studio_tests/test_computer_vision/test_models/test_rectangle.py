@@ -0,0 +1,84 @@
+import copy
+import pickle
+from unittest import TestCase
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.models.drawable.rectangle import BoxArray, DrawableRectangle, Rectangle
+from amir_dev_studio.computer_vision.models.point import Point
+
+
+class TestRectangle(TestCase):
+    def test_edges_are_normalized(self):
+        rect = Rectangle(Point(9, 1), Point(1, 7))
+
+        assert not hasattr(rect, '__dict__')
+        assert rect.ltrb == (1, 1, 9, 7)
+        assert (rect.left, rect.top, rect.right, rect.bottom) == (1, 1, 9, 7)
+        assert (rect.top_left.xy, rect.bottom_right.xy, rect.width, rect.height) == ((1, 1), (9, 7), 8, 6)
+
+    def test_reassigning_corners_updates_edges(self):
+        for rect in (Rectangle(Point(9, 1), Point(1, 7)), DrawableRectangle(Point(9, 1), Point(1, 7))):
+            rect.pt1 = Point(20, 30)
+            assert rect.ltrb == (1, 7, 20, 30)
+
+    def test_moving_corners_in_place_requires_reassignment(self):
+        rect = Rectangle(Point(9, 1), Point(1, 7))
+        rect.pt2.x = 30
+        assert rect.ltrb == (1, 1, 9, 7)
+
+        rect.pt2 = rect.pt2
+        assert rect.ltrb == (9, 1, 30, 7)
+
+    def test_deepcopy_and_pickle(self):
+        for rect in (Rectangle(Point(9, 1), Point(1, 7)), DrawableRectangle(Point(9, 1), Point(1, 7), thickness=3)):
+            for restored in (copy.deepcopy(rect), pickle.loads(pickle.dumps(rect))):
+                assert type(restored) is type(rect)
+                assert restored == rect
+                assert restored.ltrb == (1, 1, 9, 7)
+
+                restored.pt1 = Point(20, 30)
+                assert restored.ltrb == (1, 7, 20, 30)
+                assert rect.ltrb == (1, 1, 9, 7)
+
+    def test_zero_size_rejected(self):
+        for pt2 in (Point(1, 1), Point(1, 5), Point(5, 1)):
+            with self.assertRaises(AssertionError):
+                Rectangle(Point(1, 1), pt2)
+
+
+class TestBoxArray(TestCase):
+    def setUp(self):
+        self.rectangles = [
+            Rectangle.from_ltrb(0, 0, 10, 10),
+            Rectangle.from_ltrb(5, 5, 15, 15),
+            Rectangle.from_ltrb(2, 2, 4, 4),
+            Rectangle.from_ltrb(30, 40, 20, 25),
+        ]
+        self.boxes = BoxArray.from_rectangles(self.rectangles)
+
+    def test_round_trip(self):
+        assert [r.to_xywh() for r in self.boxes.to_rectangles()] == [r.to_xywh() for r in self.rectangles]
+        assert self.boxes[3].to_coco_bbox() == self.rectangles[3].to_coco_bbox()
+
+    def test_format_conversion(self):
+        yolo = self.boxes.to_yolo_bboxes(100, 50)
+        np.testing.assert_allclose(yolo[1], self.rectangles[1].to_yolo_bbox(100, 50))
+        np.testing.assert_allclose(BoxArray.from_yolo_bboxes(yolo, 100, 50).ltrb, self.boxes.ltrb)
+        np.testing.assert_allclose(BoxArray.from_tlbr(self.boxes.to_tlbr()).ltrb, self.boxes.ltrb)
+        np.testing.assert_allclose(BoxArray.from_coco_bboxes(self.boxes.to_coco_bboxes()).ltrb, self.boxes.ltrb)
+
+    def test_areas_and_centers(self):
+        assert self.boxes.areas.tolist() == [r.width * r.height for r in self.rectangles]
+        assert [p.xy for p in self.boxes.centers] == [r.center.xy for r in self.rectangles]
+
+    def test_iou(self):
+        iou = self.boxes.iou()
+        np.testing.assert_allclose(np.diag(iou), 1)
+        np.testing.assert_allclose(iou[0, 1], 25 / 175)
+        assert iou[0, 3] == 0
+
+    def test_contains(self):
+        contains = self.boxes.contains()
+        expected = [[a.contains(b) for b in self.rectangles] for a in self.rectangles]
+        assert contains.tolist() == expected
@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.constants import Colors
+from amir_dev_studio.computer_vision.models.drawable.bounding_box import DrawableBoundingBox
+from amir_dev_studio.computer_vision.models.drawable.rectangle import DrawableRectangle
+from amir_dev_studio.computer_vision.models.drawable.text import DrawableText
+from amir_dev_studio.computer_vision.models.drawable.text_sprite_cache import TextSpriteCache
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.computer_vision.models.point import Point
+
+
+class TestTextSpriteCache(TestCase):
+    def test_matches_put_text(self):
+        cache = TextSpriteCache()
+        texts = [
+            DrawableText('person 0.93', Point(10, 30), Colors.YELLOW, 0.8, thickness=2),
+            DrawableText('gjpqy', Point(40, 100), Colors.RED, 1.5, thickness=1),
+            DrawableText('car', Point(180, 195), Colors.CYAN, 1, thickness=3),
+        ]
+
+        for text in texts:
+            expected = Image.create_blank(200, 200)
+            expected.draw(text)
+
+            actual = Image.create_blank(200, 200)
+            actual.pixels = cache.draw(text, actual.pixels)
+
+            np.testing.assert_array_equal(actual.pixels, expected.pixels)
+
+    def test_matches_put_text_on_bgra(self):
+        text = DrawableText('person 0.93', Point(10, 30), Colors.YELLOW, 0.8, thickness=2)
+        expected = np.full((60, 200, 4), 255, np.uint8)
+        text.draw_on_image(expected)
+
+        actual = TextSpriteCache().draw(text, np.full((60, 200, 4), 255, np.uint8))
+        np.testing.assert_array_equal(actual, expected)
+
+        rect = DrawableRectangle(Point(5, 5), Point(150, 50))
+        box = DrawableBoundingBox(text, rect).draw_on_image(np.full((60, 200, 4), 255, np.uint8))
+        np.testing.assert_array_equal(box, rect.draw_on_image(expected))
+
+    def test_clips_at_image_border(self):
+        text = DrawableText('gjpqy', Point(-5, 5), Colors.RED, 1.5, thickness=1)
+        expected = Image.create_blank(100, 100)
+        expected.draw(text)
+
+        actual = Image.create_blank(100, 100)
+        actual.pixels = TextSpriteCache().draw(text, actual.pixels)
+
+        # OpenCV clips glyph strokes against the border, which can shift edge pixels by one.
+        assert np.count_nonzero(actual.pixels != expected.pixels) < 30
+        assert np.count_nonzero(actual.pixels) > 0
+
+    def test_lru_eviction_and_counters(self):
+        cache = TextSpriteCache(max_entries=2)
+        pixels = np.zeros((50, 50, 3), np.uint8)
+
+        for value in ['a', 'b', 'a', 'c', 'b']:
+            cache.draw(DrawableText(value, Point(5, 20)), pixels)
+
+        assert (cache.hits, cache.misses, cache.evictions) == (1, 4, 2)
+        assert len(cache) == 2
@@ -0,0 +1,84 @@
+from math import cos, pi, sin
+from unittest import TestCase
+
+import cv2
+import numpy as np
+
+from amir_dev_studio.computer_vision.models.drawable.circle import Circle
+from amir_dev_studio.computer_vision.models.drawable.line import Line
+from amir_dev_studio.computer_vision.models.drawable.rectangle import BoxArray, Rectangle
+from amir_dev_studio.computer_vision.models.point import Point, PointArray
+from amir_dev_studio.computer_vision.rasterization import contains_matrix, hit_test, rasterize
+
+
+class TestRasterization(TestCase):
+    def setUp(self):
+        self.shapes = [
+            Rectangle.from_ltrb(5, 5, 40, 30),
+            Circle.from_xyr(30, 30, 12),
+            Line(Point(0, 59), Point(79, 0)),
+            Rectangle.from_ltrb(-10, 50, 10, 70),
+        ]
+
+    def _reference(self, thickness: int = -1) -> np.ndarray:
+        pixels = np.zeros((60, 80), np.uint8)
+        cv2.rectangle(pixels, (5, 5), (40, 30), 1, thickness)
+        cv2.circle(pixels, (30, 30), 12, 1, thickness)
+        cv2.line(pixels, (0, 59), (79, 0), 1, 1)
+        cv2.rectangle(pixels, (-10, 50), (10, 70), 1, thickness)
+        return pixels.astype(bool)
+
+    def test_boolean_mask_matches_opencv(self):
+        mask = rasterize(self.shapes, (80, 60))
+
+        assert mask.dtype == bool and mask.shape == (60, 80)
+        np.testing.assert_array_equal(mask, self._reference())
+        np.testing.assert_array_equal(rasterize(self.shapes, (80, 60), thickness=2), self._reference(2))
+
+    def test_label_mask_paints_in_order(self):
+        mask = rasterize(self.shapes[:2], (80, 60), labels=[3, 7])
+
+        assert mask.dtype == np.int32
+        assert mask[10, 10] == 3 and mask[30, 30] == 7 and mask[0, 79] == 0
+        assert set(np.unique(mask)) == {0, 3, 7}
+
+    def test_hit_testing(self):
+        points = PointArray.from_xy(np.array([10, 30, 36, 60, 0]), np.array([10, 30, 36, 15, 0]))
+        hits = contains_matrix(self.shapes, points)
+
+        assert hits.shape == (4, 5)
+        np.testing.assert_array_equal(hits[0], [True, True, False, False, False])
+        np.testing.assert_array_equal(hits[1], [False, True, True, False, False])
+        assert not hits[2].any()
+        for index, shape in enumerate(self.shapes):
+            np.testing.assert_array_equal(hits[index], shape.contains_points(points))
+
+        np.testing.assert_array_equal(hit_test(self.shapes, points), [0, 1, 1, -1, -1])
+
+    def test_line_distances(self):
+        line = Line(Point(0, 0), Point(10, 0))
+        points = PointArray.from_xy(np.array([5, -3, 14, 5]), np.array([2, 4, 3, 0]))
+
+        np.testing.assert_allclose(line.distances_from(points), [2, 5, 5, 0])
+        np.testing.assert_array_equal(contains_matrix([line], points, line_tolerance=2)[0], [True, False, False, True])
+
+    def test_box_array_contains_points(self):
+        boxes = BoxArray.from_ltrb(np.array([[0, 0, 10, 10], [5, 5, 20, 20]]))
+        points = PointArray.from_xy(np.array([1, 7, 15]), np.array([1, 7, 15]))
+
+        np.testing.assert_array_equal(boxes.contains_points(points), [[True, True, False], [False, True, True]])
+
+
+class TestCircleSampling(TestCase):
+    def test_sample_circumference_matches_scalar_math(self):
+        circle = Circle.from_xyr(3, -2, 5)
+        points = circle.sample_circumference(8)
+
+        assert isinstance(points, PointArray) and len(points) == 9
+        expected = [(3 + 5 * cos(step * pi / 4), -2 + 5 * sin(step * pi / 4)) for step in range(9)]
+        np.testing.assert_allclose(points.coords, expected)
+        np.testing.assert_allclose(circle.sample_circumference(8, clockwise=False).coords, expected[::-1])
+
+        listed = circle.list_points_on_circumference(8)
+        assert all(isinstance(point, Point) for point in listed)
+        np.testing.assert_allclose([point.xy for point in listed], expected)
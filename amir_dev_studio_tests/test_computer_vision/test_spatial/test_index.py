@@ -0,0 +1,36 @@
+from unittest import TestCase
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.models.drawable.rectangle import BoxArray, Rectangle
+from amir_dev_studio.computer_vision.models.point import Point
+from amir_dev_studio.computer_vision.spatial.index import GridIndex
+
+
+class TestGridIndex(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        top_left = rng.uniform(0, 1000, (500, 2))
+        sizes = rng.uniform(5, 60, (500, 2))
+        self.boxes = BoxArray.from_ltwh(np.concatenate((top_left, sizes), axis=1))
+        self.index = GridIndex(self.boxes)
+        self.query = Rectangle.from_ltrb(200, 300, 450, 520)
+
+    def test_query_overlapping(self):
+        expected = np.flatnonzero(self.boxes.intersection_areas(self.query)[:, 0] > 0)
+        assert sorted(self.index.query_overlapping(self.query).tolist()) == expected.tolist()
+
+    def test_query_contained(self):
+        expected = np.flatnonzero(BoxArray.from_rectangles([self.query]).contains(self.boxes)[0])
+        assert sorted(self.index.query_contained(self.query).tolist()) == expected.tolist()
+
+    def test_query_containing(self):
+        inner = self.boxes[7]
+        expected = np.flatnonzero(self.boxes.contains(inner)[:, 0])
+        assert sorted(self.index.query_containing(inner).tolist()) == expected.tolist()
+
+    def test_nearest(self):
+        for point in [Point(500, 500), Point(-200, 1300), Point(10, 990)]:
+            distances = self.index.distances_from(point)
+            nearest = self.index.nearest(point, k=5)
+            np.testing.assert_allclose(distances[nearest], np.sort(distances)[:5])
@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+import numpy as np
+
+from amir_dev_studio.computer_vision.models.drawable.rectangle import Rectangle
+from amir_dev_studio.computer_vision.spatial.nms import non_maximum_suppression, soft_non_maximum_suppression
+
+
+class TestNonMaximumSuppression(TestCase):
+    def setUp(self):
+        self.rectangles = [
+            Rectangle.from_ltrb(0, 0, 10, 10),
+            Rectangle.from_ltrb(1, 1, 11, 11),
+            Rectangle.from_ltrb(50, 50, 60, 60),
+            Rectangle.from_ltrb(0, 0, 9, 10),
+        ]
+        self.scores = np.array([0.9, 0.8, 0.7, 0.95])
+
+    def test_standard(self):
+        assert non_maximum_suppression(self.rectangles, self.scores, 0.5).tolist() == [3, 2]
+
+    def test_per_class(self):
+        keep = non_maximum_suppression(self.rectangles, self.scores, 0.5, class_ids=np.array([0, 1, 0, 0]))
+        assert keep.tolist() == [3, 1, 2]
+
+    def test_soft(self):
+        keep, scores = soft_non_maximum_suppression(self.rectangles, self.scores)
+        assert keep[0] == 3
+        assert len(keep) == 4
+        assert scores[0] == 0.95
+        assert np.all(np.diff(scores) <= 0)
@@ -0,0 +1,66 @@
+import os
+import tempfile
+from functools import partial
+from unittest import TestCase
+
+import cv2
+import numpy as np
+
+from amir_dev_studio.computer_vision.enums import ColorSpaces
+from amir_dev_studio.computer_vision.models.image import Image
+from amir_dev_studio.computer_vision.tiling import TiledProcessor, iter_tiles
+
+_blur = partial(cv2.GaussianBlur, ksize=(9, 9), sigmaX=2.0)
+
+
+def _to_gray(pixels: np.ndarray) -> np.ndarray:
+    return cv2.cvtColor(pixels, cv2.COLOR_BGR2GRAY)
+
+
+class TestTiling(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.pixels = rng.integers(0, 255, (203, 157, 3), np.uint8)
+
+    def test_iter_tiles_covers_image_once(self):
+        coverage = np.zeros((203, 157), np.int32)
+        tiles = list(iter_tiles(203, 157, (64, 50), halo=5))
+
+        for tile in tiles:
+            coverage[tile.core_slices] += 1
+            assert tile.read_top == max(tile.top - 5, 0) and tile.read_right == min(tile.right + 5, 157)
+
+        assert np.all(coverage == 1)
+        assert (tiles[-1].row, tiles[-1].column) == (4, 2)
+
+    def test_blur_with_halo_matches_whole_image(self):
+        processor = TiledProcessor(tile_size=48, halo=4, max_workers=2, use_processes=False)
+        result = processor.process(self.pixels, _blur)
+
+        np.testing.assert_array_equal(result, _blur(self.pixels))
+
+    def test_blur_without_halo_shows_seams(self):
+        result = TiledProcessor(tile_size=48, max_workers=2, use_processes=False).process(self.pixels, _blur)
+        assert np.any(result != _blur(self.pixels))
+
+    def test_empty_image_rejected(self):
+        processor = TiledProcessor(tile_size=48, use_processes=False)
+
+        for shape in ((0, 10, 3), (10, 0, 3)):
+            with self.assertRaises(AssertionError):
+                processor.process_image(Image.from_numpy_array(np.zeros(shape, np.uint8), ColorSpaces.BGR), _blur)
+
+    def test_process_pool_to_memory_mapped_output(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source_path = os.path.join(directory, 'source.adsimg')
+            output_path = os.path.join(directory, 'output.adsimg')
+            Image.from_numpy_array(self.pixels, ColorSpaces.BGR, name='scan').save_mmap(source_path)
+
+            source = Image.from_mmap(source_path, mode='r')
+            processor = TiledProcessor(tile_size=64, halo=4, max_workers=2, max_in_flight=2)
+            result = processor.process_image(source, _to_gray, output_path, ColorSpaces.GRAY)
+
+            assert isinstance(result.pixels, np.memmap)
+            assert result.name == 'scan' and result.color_space == ColorSpaces.GRAY
+            np.testing.assert_array_equal(result.pixels, _to_gray(self.pixels))
+            del source, result
@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+import cv2
+import numpy as np
+
+from amir_dev_studio.computer_vision import tone
+from amir_dev_studio.computer_vision.tone import ToneMap
+
+
+class TestToneMap(TestCase):
+    def setUp(self):
+        self.pixels = np.random.default_rng(0).integers(0, 256, (40, 50, 3), np.uint8)
+
+    def test_luts_match_add_weighted(self):
+        for value in [-80, -1, 0, 37, 120]:
+            alpha, gamma = tone.brightness_coefficients(value)
+            expected = cv2.addWeighted(self.pixels, alpha, self.pixels, 0, gamma)
+            np.testing.assert_array_equal(cv2.LUT(self.pixels, tone.brightness_lut(value)), expected)
+
+            alpha, gamma = tone.contrast_coefficients(value)
+            expected = cv2.addWeighted(self.pixels, alpha, self.pixels, 0, gamma)
+            np.testing.assert_array_equal(cv2.LUT(self.pixels, tone.contrast_lut(value)), expected)
+
+    def test_luts_are_cached(self):
+        assert tone.gamma_lut(2.2) is tone.gamma_lut(2.2)
+        assert not tone.gamma_lut(2.2).flags.writeable
+
+    def test_composition_matches_sequential_application(self):
+        tone_map = ToneMap().brightness(30).gamma(1.8).levels(10, 240).curve((0, 0), (128, 150), (255, 255))
+
+        expected = self.pixels
+        for lut in tone_map.luts:
+            expected = cv2.LUT(expected, lut)
+
+        np.testing.assert_array_equal(tone_map.apply(self.pixels), expected)
+
+    def test_white_balance(self):
+        tone_map = ToneMap().contrast(20).white_balance(1.0, 0.5, 2.0)
+        actual = tone_map.apply(self.pixels)
+
+        contrasted = cv2.LUT(self.pixels, tone.contrast_lut(20)).astype(np.float64)
+        expected = np.rint(contrasted * (1.0, 0.5, 2.0)).clip(0, 255)
+        np.testing.assert_array_equal(actual, expected)
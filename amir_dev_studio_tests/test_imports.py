@@ -0,0 +1,104 @@
+import json
+import subprocess
+import sys
+from unittest import TestCase
+
+_heavy_modules = ('cv2', 'matplotlib', 'numpy')
+
+# Generous, so that only a heavy dependency creeping back into import time fails it; numpy alone takes
+# around a tenth of that.
+_import_seconds_budget = 1.0
+
+_probe = '''
+import importlib, json, sys, time
+
+started = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = time.perf_counter() - started
+
+loaded = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{'loaded': loaded, 'seconds': elapsed}}))
+'''
+
+# Every thread touches cv2 for the first time at once; none may see a partially imported module.
+_concurrent_probe = '''
+import threading
+import numpy as np
+from amir_dev_studio.computer_vision.io.loader import cv2
+
+barrier = threading.Barrier(16)
+errors = []
+
+def use():
+    barrier.wait()
+    try:
+        cv2.imdecode(cv2.imencode('.png', np.zeros((4, 4), np.uint8))[1], cv2.IMREAD_GRAYSCALE)
+    except Exception as exception:
+        errors.append(repr(exception))
+
+threads = [threading.Thread(target=use) for _ in range(16)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+
+print(len(errors), errors[:1])
+'''
+
+
+def _import_in_subprocess(module: str) -> dict:
+    # A fresh interpreter, so modules imported by the test runner itself do not count.
+    result = subprocess.run(
+        [sys.executable, '-c', _probe.format(module=module, heavy=_heavy_modules)],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout)
+
+
+class TestImportCost(TestCase):
+    def assert_loads_only(self, module: str, *allowed: str):
+        result = _import_in_subprocess(module)
+        loaded = set(result['loaded'])
+        assert loaded <= set(allowed), f'Importing {module} loaded {sorted(loaded - set(allowed))}'
+        assert result['seconds'] < _import_seconds_budget, f'Importing {module} took {result["seconds"]:.2f}s'
+
+    def test_pure_python_packages_have_no_third_party_imports(self):
+        for module in ('amir_dev_studio.events', 'amir_dev_studio.dependency_injection', 'amir_dev_studio.unit_of_work'):
+            self.assert_loads_only(module)
+
+    def test_computer_vision_defers_opencv_and_matplotlib(self):
+        self.assert_loads_only('amir_dev_studio.computer_vision')
+        self.assert_loads_only('amir_dev_studio.computer_vision.models.color')
+
+        for module in (
+                'amir_dev_studio.computer_vision.io.loader',
+                'amir_dev_studio.computer_vision.io.video',
+                'amir_dev_studio.computer_vision.models.drawable.draw_list',
+                'amir_dev_studio.computer_vision.models.image',
+                'amir_dev_studio.computer_vision.models.image_batch',
+                'amir_dev_studio.computer_vision.models.image_pipeline',
+                'amir_dev_studio.computer_vision.models.mosaic',
+                'amir_dev_studio.computer_vision.rasterization',
+                'amir_dev_studio.computer_vision.spatial',
+                'amir_dev_studio.computer_vision.tiling',
+        ):
+            self.assert_loads_only(module, 'numpy')
+
+    def test_opencv_loads_on_first_use(self):
+        probe = (
+            'import sys; '
+            'from amir_dev_studio.computer_vision.models.image import Image; '
+            'before = "cv2" in sys.modules; '
+            'Image.create_blank(4, 4).apply_gaussian_blur(3); '
+            'print(before, "cv2" in sys.modules)'
+        )
+        output = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True).stdout
+        assert output.split() == ['False', 'True']
+
+    def test_concurrent_first_use(self):
+        output = subprocess.run(
+            [sys.executable, '-c', _concurrent_probe], capture_output=True, text=True, check=True
+        ).stdout
+        assert output.startswith('0 '), output
@@ -0,0 +1,119 @@
+"""
+Compares the memory footprint and speed of the slotted geometry models with the previous layout, where
+every instance carried a __dict__ and an eagerly allocated extra_data dict and Rectangle recomputed its
+corners on every edge access.
+
+Run from the repository root with: python -m benchmarks.models_memory
+"""
+import timeit
+import tracemalloc
+from dataclasses import dataclass, field
+
+from amir_dev_studio.computer_vision.models.color import Color
+from amir_dev_studio.computer_vision.models.drawable.circle import Circle
+from amir_dev_studio.computer_vision.models.drawable.rectangle import Rectangle
+from amir_dev_studio.computer_vision.models.point import Point
+
+_count = 100_000
+
+
+@dataclass
+class _LegacyBase:
+    extra_data: dict = field(init=False, default_factory=dict, repr=False)
+
+
+@dataclass
+class _LegacyPoint(_LegacyBase):
+    x: float
+    y: float
+
+
+@dataclass
+class _LegacyColor(_LegacyBase):
+    b: float
+    g: float
+    r: float
+
+
+@dataclass
+class _LegacyCircle(_LegacyBase):
+    center: _LegacyPoint
+    radius: float
+
+
+@dataclass
+class _LegacyRectangle(_LegacyBase):
+    pt1: _LegacyPoint
+    pt2: _LegacyPoint
+
+    def __post_init__(self):
+        assert (self.pt1.x, self.pt1.y) != (self.pt2.x, self.pt2.y), 'Rectangle cannot have zero area'
+        assert self.pt1.x != self.pt2.x, 'Rectangle width cannot be 0'
+        assert self.pt1.y != self.pt2.y, 'Rectangle height cannot be 0'
+
+    @property
+    def top_left(self):
+        return _LegacyPoint(min(self.pt1.x, self.pt2.x), min(self.pt1.y, self.pt2.y))
+
+    @property
+    def bottom_right(self):
+        return _LegacyPoint(max(self.pt1.x, self.pt2.x), max(self.pt1.y, self.pt2.y))
+
+    @property
+    def left(self):
+        return self.top_left.x
+
+    @property
+    def right(self):
+        return self.bottom_right.x
+
+    @property
+    def width(self):
+        return self.bottom_right.x - self.top_left.x
+
+
+def _bytes_per_object(factory) -> float:
+    tracemalloc.start()
+    objects = [factory(i) for i in range(_count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / _count
+
+
+def _seconds_per_call(statement, number: int = _count) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number
+
+
+def _report(name: str, legacy: float, current: float, unit: str, scale: float = 1):
+    print(f'{name:34s} {legacy * scale:10.1f} {current * scale:10.1f} {unit:6s} {legacy / current:6.2f}x')
+
+
+def main():
+    print(f'{"":34s} {"legacy":>10s} {"current":>10s} {"":6s} {"ratio":>6s}')
+
+    _report('Point memory', _bytes_per_object(lambda i: _LegacyPoint(i, i)),
+            _bytes_per_object(lambda i: Point(i, i)), 'B')
+    _report('Color memory', _bytes_per_object(lambda i: _LegacyColor(i, i, i)),
+            _bytes_per_object(lambda i: Color(i, i, i)), 'B')
+    _report('Circle memory (with center)', _bytes_per_object(lambda i: _LegacyCircle(_LegacyPoint(i, i), 3)),
+            _bytes_per_object(lambda i: Circle(Point(i, i), 3)), 'B')
+    _report('Rectangle memory (with corners)',
+            _bytes_per_object(lambda i: _LegacyRectangle(_LegacyPoint(i, i), _LegacyPoint(i + 5, i + 5))),
+            _bytes_per_object(lambda i: Rectangle(Point(i, i), Point(i + 5, i + 5))), 'B')
+
+    _report('Point construction', _seconds_per_call(lambda: _LegacyPoint(1, 2)),
+            _seconds_per_call(lambda: Point(1, 2)), 'ns', 1e9)
+    _report('Rectangle construction',
+            _seconds_per_call(lambda: _LegacyRectangle(_LegacyPoint(9, 1), _LegacyPoint(1, 9))),
+            _seconds_per_call(lambda: Rectangle(Point(9, 1), Point(1, 9))), 'ns', 1e9)
+
+    legacy_rectangle = _LegacyRectangle(_LegacyPoint(9, 1), _LegacyPoint(1, 9))
+    rectangle = Rectangle(Point(9, 1), Point(1, 9))
+    _report('Rectangle left + right + width',
+            _seconds_per_call(lambda: legacy_rectangle.left + legacy_rectangle.right + legacy_rectangle.width),
+            _seconds_per_call(lambda: rectangle.left + rectangle.right + rectangle.width), 'ns', 1e9)
+
+
+if __name__ == '__main__':
+    main()